@@ -3,53 +3,150 @@ RH56DFTP TCP实现模块，用于通过Modbus TCP协议与设备通信
 """
 # 标准库导入
 import logging
-from typing import Any, Dict
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # 第三方库导入
 from pymodbus.client import ModbusTcpClient
+from pymodbus.constants import ExcCodes
+from pymodbus.exceptions import ModbusIOException
 
 # 本地库导入
-from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterKey.ftp_registers_keys import ALL_REGISTER_NAMES, REGISTER_MAP, RegisterName
 from Register.RegisterBuild.RegisterFactory import register_factory
 from Register.RegisterSet.Register_FTP import Register_FTP
-from .RH56DFTP_base import RH56DFTPBase
-
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('rh56dftp.log'),
-        logging.StreamHandler()
-    ]
+from .RH56DFTP_base import TRANSPORT_ERRORS, RH56DFTPBase
+from .RH56DFTP_batchread import BatchReadMixin
+from .RH56DFTP_batchwrite import BatchWriteMixin
+from .RH56DFTP_cache import RegisterCache
+from .RH56DFTP_codec import (
+    MAX_COUNT_PER_READ,
+    decode_raw_value,
+    validate_write
+)
+from .RH56DFTP_decode import TactileLayout, decode_array
+from .RH56DFTP_index import (
+    RegisterDescriptor,
+    build_register_index,
+    lookup_register,
+    normalize_register_name
+)
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_metrics import (
+    DEFAULT_METRICS_PORT,
+    ClientMetrics,
+    LatencyHistogram,
+    MetricsServer,
+    serve_metrics
+)
+from .RH56DFTP_pipeline import PipelinedReadMixin, PipelineTransport
+from .RH56DFTP_plan import ReadPlanner
+from .RH56DFTP_scheduler import PRIORITY_COMMAND, RequestScheduler
+from .RH56DFTP_tuning import (
+    DEFAULT_PROBE_REPEATS,
+    DEFAULT_PROBE_SIZES,
+    ReadProfile,
+    load_read_profile,
+    probe_read_profile,
+    save_read_profile
 )
-logger = logging.getLogger('RH56DFTP')
 
-class RH56DFTPClient(RH56DFTPBase):
+# 日志器，默认只输出警告与错误，输出目标由 configure_logging() 配置
+logger = logging.getLogger(LOGGER_NAME)
+
+# 默认心跳间隔（秒）
+DEFAULT_HEARTBEAT_INTERVAL = 1.0
+# 构造时默认等待首次连接的时间（秒）
+DEFAULT_CONNECT_TIMEOUT = 3.0
+# 后台重连的初始与最大退避间隔（秒）
+DEFAULT_RECONNECT_MIN_DELAY = 0.1
+DEFAULT_RECONNECT_MAX_DELAY = 5.0
+# 心跳与主动探测使用的寄存器，必须是寄存器表中存在的只读安全地址
+HEARTBEAT_REGISTER = "HAND_ID"
+# pymodbus请求方法对应的Modbus功能码，用于指标统计
+FUNCTION_CODES = {"read_holding_registers": 3, "write_register": 6, "write_registers": 16}
+# 请求分类缓存的最大条目数，超过时清空重建
+ROUTE_CACHE_SIZE = 1024
+
+
+class _MeteredModbusTcpClient(ModbusTcpClient):
+    """
+    统计收发字节数的Modbus TCP客户端，开启分阶段计时时记录首次发送与最后一次接收的时刻
+    """
+
+    def __init__(self, metrics: ClientMetrics, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = metrics
+        self.phase_timing = False
+        # 本次请求首次发送前与最后一次收到数据后的时刻，由 _transact 在请求前清零
+        self.sent_at = 0.0
+        self.received_at = 0.0
+
+    # 收发只发生在持有调度器链路的线程中，彼此串行，字节计数不加锁；
+    # reset() 与之并发时最多丢失一次累加
+    def send(self, request, addr=None):
+        if self.phase_timing and not self.sent_at:
+            self.sent_at = time.perf_counter()
+        sent = super().send(request, addr)
+        if sent:
+            self.metrics.counters["bytes_sent"] += sent
+        return sent
+
+    def recv(self, size):
+        data = super().recv(size)
+        if data:
+            if self.phase_timing:
+                self.received_at = time.perf_counter()
+            self.metrics.counters["bytes_received"] += len(data)
+        return data
+
+
+class RH56DFTPClient(PipelinedReadMixin, BatchReadMixin, BatchWriteMixin, RH56DFTPBase):
     """
     RH56DFTP的TCP实现类，用于通过Modbus TCP协议与设备通信
     """
 
-    def __init__(self, host: str, port: int, config_folder_path: str = None):
+    def __init__(self, host: str, port: int, config_folder_path: str = None,
+                 heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+                 cache_ttl: Optional[Dict[str, float]] = None,
+                 tune_reads: bool = False, profile_path: Optional[str] = None,
+                 connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+                 reconnect_min_delay: float = DEFAULT_RECONNECT_MIN_DELAY,
+                 reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+                 phase_timing: bool = False):
         """
         初始化TCP连接
 
+        连接由后台线程建立，断开后按指数退避加随机抖动重连；离线期间的读写立即抛出 ConnectionError，
+        不会阻塞在socket超时上
+
         Args:
             host: 设备IP地址
             port: 设备端口号
             config_folder_path: 寄存器配置文件夹路径，默认为包内的配置路径
-
-        Raises:
-            ConnectionError: 当连接失败时抛出
+            heartbeat_interval: 后台心跳间隔（秒），链路空闲超过该时间才发送探测，
+                为0或None时关闭心跳
+            cache_ttl: 覆盖读缓存各类别的默认有效期（秒），如 {"command": 0.5}，
+                见 RH56DFTP_cache.DEFAULT_CACHE_TTL
+            tune_reads: 是否按设备调优单次读取的寄存器数量，优先复用该 host:port 的缓存结果，
+                没有缓存时探测并保存
+            profile_path: 调优结果缓存文件路径，默认为 RH56DFTP_tuning.DEFAULT_PROFILE_PATH
+            connect_timeout: 构造时等待首次连接尝试的最长时间（秒），首次尝试失败（如连接被拒绝）时
+                立即返回；为0时不等待，为None时一直等待首次尝试的结果；未连接时客户端以离线模式
+                继续在后台重连，可用 wait_connected() 等待
+            reconnect_min_delay: 重连的初始退避间隔（秒）
+            reconnect_max_delay: 重连的最大退避间隔（秒）
+            phase_timing: 是否按编码、网络等待与解码阶段统计请求耗时，见 phase_timing 属性
         """
-        logger.info("正在初始化连接到设备: %s:%s", host, port)
-        self.client = ModbusTcpClient(host=host, port=port, timeout=3)
-        self.is_connected = self.client.connect()
-        
-        if not self.is_connected:
-            logger.warning("连接失败：无法连接到 %s:%s，将以离线模式初始化", host, port)
-        else:
-            logger.info("成功连接到 %s:%s", host, port)
+        self.host = host
+        self.port = port
+        # 连接状态事件，is_connected 与之同步，可用 wait_connected() 等待
+        self.connected = threading.Event()
+        # 首次连接尝试已有结果（成功或失败），构造函数只等待这一次尝试
+        self._first_attempt = threading.Event()
 
         # 创建寄存器对象字典
         logger.debug("正在创建寄存器对象字典，使用内置配置")
@@ -57,63 +154,219 @@ class RH56DFTPClient(RH56DFTPBase):
             config_folder_path=None,
             strategy_name='ftp'
         )
-        
-        # 动态注入寄存器方法，用于IDE函数提示
-        logger.debug("正在动态注入寄存器方法")
-        for register_name in self.registers:
-            register = self.registers[register_name]
-            # 创建一个闭包，捕获当前寄存器名称
-            def create_getter(r_name, r_data_type, r_address, r_access_type, r_description):
-                # 定义动态方法
-                def getter():
-                    """动态生成的寄存器读取方法"""
-                    if not self.is_connected:
-                        raise ConnectionError("设备未连接")
-                    return self.get(r_name)
-                # 设置方法名称
-                getter.__name__ = f"get_{r_name}"
-                # 设置文档字符串
-                getter.__doc__ = f"获取寄存器 {r_name} 的值\n\n" + \
-                                f"地址: {r_address}\n" + \
-                                f"数据类型: {r_data_type}\n" + \
-                                f"访问类型: {r_access_type}\n" + \
-                                f"描述: {r_description}"
-                # 添加返回类型注解
-                # 根据数据类型设置返回类型
-                if r_data_type == "uint8":
-                    getter.__annotations__["return"] = int
-                elif r_data_type == "short":
-                    getter.__annotations__["return"] = int
-                else:
-                    getter.__annotations__["return"] = Any
-                return getter
-            
-            # 生成并添加方法到实例
-            getter_method = create_getter(
-                register_name, 
-                register.data_type, 
-                register.address, 
-                register.access_type, 
-                register.description
+        logger.info("已加载 %d 个寄存器", len(self.registers))
+
+        # 常开的请求延迟直方图与通信计数器
+        self._metrics = ClientMetrics(self.registers)
+
+        logger.info("正在初始化连接到设备: %s:%s", host, port)
+        self.client = _MeteredModbusTcpClient(self._metrics, host=host, port=port, timeout=3)
+        self.client.phase_timing = phase_timing
+        # 流水线读取适配器，pymodbus 缺少所需的内部接口时整帧读取退化为顺序读取
+        self._pipeline = PipelineTransport(self.client)
+        if not self._pipeline.supported:
+            logger.info("当前pymodbus版本缺少流水线读取所需的接口 %s，整帧读取将顺序进行",
+                        ", ".join(self._pipeline.missing))
+        # 最近一次成功收发的时间，心跳只在链路空闲时探测
+        self._last_io_time = time.perf_counter()
+        # 是否曾经连接成功，之后的连接计为重连
+        self._ever_connected = False
+        # 连续连接失败次数，只在首次失败时输出警告
+        self._connect_failures = 0
+
+        # 寄存器索引：名称、函数名与函数对象 -> 预编译的寄存器描述符
+        self._register_index: Dict[Any, RegisterDescriptor] = build_register_index(self.registers)
+
+        # 读缓存：持久配置寄存器缓存到写入或失效为止，实时寄存器从不缓存
+        self.read_cache = RegisterCache(self.registers, cache_ttl)
+
+        # 触觉帧布局，触觉寄存器按地址排序，用于整帧读取
+        self.tactile_layout = TactileLayout(self.registers)
+        self._tactile_names: List[RegisterName] = self.tactile_layout.names
+
+        # 单次读取的寄存器数量，调优或设备拒绝过大请求时调整
+        self.max_count_per_read = MAX_COUNT_PER_READ
+
+        # 读取计划编译器，缓存每组寄存器的合并读取方案
+        self.read_planner = ReadPlanner(self.registers, max_count=self.max_count_per_read)
+
+        # 请求调度器：写入优先于状态读取，状态优先于触觉，触觉优先于配置读取
+        self.scheduler = RequestScheduler(self.registers)
+        # (方法名, 地址, 数量) -> (优先级, 直方图)，避免每次请求重新分类
+        self._routes: Dict[Tuple[str, int, int],
+                           Tuple[int, Tuple[LatencyHistogram, LatencyHistogram]]] = {}
+
+        # 读取分块调优在首次连接成功后执行一次
+        self.profile_path = profile_path
+        self._tune_reads = tune_reads
+        self._tune_lock = threading.Lock()
+
+        # 启动后台连接与心跳线程，线程只持有弱引用，不影响客户端的回收
+        self._stop_event = threading.Event()
+        self._connect_wake = threading.Event()
+        self._connect_thread = threading.Thread(
+            target=self._connect_loop,
+            args=(weakref.ref(self), self._stop_event, self._connect_wake,
+                  reconnect_min_delay, reconnect_max_delay),
+            name=f"RH56DFTP-connect-{host}:{port}",
+            daemon=True
+        )
+        self._connect_thread.start()
+
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat_thread = None
+        if heartbeat_interval:
+            self._heartbeat_thread = threading.Thread(
+                target=self._heartbeat_loop,
+                args=(weakref.ref(self), self._stop_event, heartbeat_interval),
+                name=f"RH56DFTP-heartbeat-{host}:{port}",
+                daemon=True
             )
-            setattr(self, f"get_{register_name}", getter_method)
-        
-        logger.info("已加载 %d 个寄存器，动态注入了 %d 个方法", len(self.registers), len(self.registers))
+            self._heartbeat_thread.start()
+
+        # 只等待首次尝试的结果：连接被拒绝时立即返回，不会等满 connect_timeout
+        if connect_timeout != 0:
+            self._first_attempt.wait(connect_timeout)
+            if self.is_connected:
+                # 调优可能仍在后台线程中进行，等待其完成后再返回
+                self._apply_read_profile()
+            else:
+                logger.warning("连接失败：无法连接到 %s:%s，将以离线模式初始化并在后台重连",
+                               host, port)
+
+    @property
+    def is_connected(self) -> bool:
+        """连接是否正常，由后台连接线程、传输错误与心跳维护"""
+        return self.connected.is_set()
+
+    @is_connected.setter
+    def is_connected(self, value: bool) -> None:
+        if value:
+            self.connected.set()
+        else:
+            self.connected.clear()
+
+    @property
+    def phase_timing(self) -> bool:
+        """
+        是否按阶段统计请求耗时，结果见 metrics()["by_phase"]
+
+        每次请求多两次计时，默认关闭。日志输出在请求的计时区间之外，默认WARNING级别下逐次读写的
+        调试日志只做一次级别判断，不单独计时；流水线整帧读取的请求相互重叠，不参与分阶段统计
+        """
+        return self.client.phase_timing
+
+    @phase_timing.setter
+    def phase_timing(self, value: bool) -> None:
+        self.client.phase_timing = value
+
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待连接建立
+
+        Args:
+            timeout: 最长等待时间（秒），为None时一直等待
+
+        Returns:
+            连接是否已建立
+        """
+        return self.connected.wait(timeout)
+
+    def _transact(self, method, **kwargs):
+        """
+        执行一次Modbus请求并被动跟踪连接状态
+
+        请求前按优先级向调度器申请链路，传输层异常时将连接标记为断开，成功收到应答时刷新最近通信时间
+
+        Args:
+            method: pymodbus客户端的请求方法，如 self.client.read_holding_registers
+            **kwargs: 请求参数
+
+        Returns:
+            设备应答
+        """
+        address = kwargs.get("address", 0)
+        count = kwargs.get("count")
+        if count is None:
+            values = kwargs.get("values")
+            count = len(values) if values is not None else 1
+        key = (method.__name__, address, count)
+        route = self._routes.get(key)
+        if route is None:
+            route = self._route(*key)
+        priority, histograms = route
+
+        scheduler = self.scheduler
+        transport = self.client
+        scheduler.acquire(priority)
+        try:
+            transport.sent_at = 0.0
+            started = time.perf_counter()
+            try:
+                response = method(**kwargs)
+            except TRANSPORT_ERRORS as e:
+                # 没有应答时pymodbus已用完全部重发次数
+                timeout = isinstance(e, (ModbusIOException, TimeoutError))
+                self._metrics.record(histograms, time.perf_counter() - started, True,
+                                     self.client.retries if timeout else 0, timeout)
+                self._mark_disconnected()
+                raise
+            finished = time.perf_counter()
+            if transport.phase_timing and transport.sent_at:
+                self._metrics.record_phases(transport.sent_at - started,
+                                            transport.received_at - transport.sent_at,
+                                            finished - transport.received_at)
+        finally:
+            scheduler.release()
+        self._last_io_time = finished
+        self._metrics.record(histograms, finished - started, response.isError(),
+                             getattr(response, "retries", 0))
+        return response
+
+    def _route(self, method_name: str, address: int, count: int
+               ) -> Tuple[int, Tuple[LatencyHistogram, LatencyHistogram]]:
+        """
+        确定一种请求的调度优先级与指标直方图，结果按 (方法名, 地址, 数量) 缓存
+
+        Returns:
+            (优先级, (功能码直方图, 寄存器组直方图))
+        """
+        function_code = FUNCTION_CODES.get(method_name, 0)
+        route = (self.scheduler.classify(function_code, address, count),
+                 self._metrics.histograms(function_code, self._metrics.group_of(address, count)))
+        if len(self._routes) >= ROUTE_CACHE_SIZE:
+            self._routes.clear()
+        self._routes[(method_name, address, count)] = route
+        return route
+
+    def _mark_disconnected(self) -> None:
+        """将连接标记为断开并关闭底层socket，唤醒后台连接线程重连"""
+        if self.is_connected:
+            logger.warning("检测到传输错误，连接已标记为断开")
+        self.is_connected = False
+        self.client.close()
+        self._connect_wake.set()
+
+    def _describe(self, register_name: RegisterName | callable) -> Optional[RegisterDescriptor]:
+        """在寄存器索引中查找描述符，寄存器不存在时返回None"""
+        return lookup_register(self._register_index, register_name)
+
+    def _resolve_name(self, register_name: RegisterName | callable) -> RegisterName:
+        """将寄存器函数对象或函数名转换为寄存器名称，未知的键原样返回（函数对象返回函数名）"""
+        descriptor = lookup_register(self._register_index, register_name)
+        if descriptor is not None:
+            return descriptor.name
+        return register_name.__name__ if callable(register_name) else register_name
 
     def _process_raw_value(self, register, raw_value):
         """处理原始寄存器值，根据数据类型转换"""
-        if register.data_type == "uint8":
-            # uint8类型，只取低8位
-            return raw_value & 0xFF
-        if register.data_type == "short":
-            # short类型，处理16位有符号值
-            return raw_value - 65536 if raw_value > 32767 else raw_value
-        return raw_value
+        return decode_raw_value(register, raw_value)
 
     def _read_single_register(self, register, register_name):
         """读取单个寄存器"""
         logger.debug("读取单个地址寄存器 %s，地址: %d", register_name, register.address)
-        response = self.client.read_holding_registers(
+        response = self._transact(
+            self.client.read_holding_registers,
             address=register.address,
             count=1  # 单个寄存器（16位）
         )
@@ -122,33 +375,74 @@ class RH56DFTPClient(RH56DFTPBase):
             raise ValueError(f"读取寄存器 {register_name} 失败: {response}")
         raw_value = response.registers[0]
         value = self._process_raw_value(register, raw_value)
-        logger.info("成功读取寄存器 %s: 值=%d, 地址=%d", register_name, value, register.address)
+        logger.debug("成功读取寄存器 %s: 值=%d, 地址=%d", register_name, value, register.address)
         return value
 
-    def _read_register_batch(self, start_address, count):
-        """读取寄存器批次"""
-        max_count_per_read = 125
-        all_registers = []
-        current_addr = start_address
-        remaining = count
-
-        while remaining > 0:
-            batch_count = min(remaining, max_count_per_read)
-            logger.debug("读取批次: 起始地址=%d, 数量=%d, 剩余=%d",
-                        current_addr, batch_count, remaining - batch_count)
-
-            response = self.client.read_holding_registers(
-                address=current_addr,
-                count=batch_count
+    def tune_read_chunk(self, sizes: Iterable[int] = DEFAULT_PROBE_SIZES,
+                        repeats: int = DEFAULT_PROBE_REPEATS, save: bool = True,
+                        profile_path: Optional[str] = None) -> ReadProfile:
+        """
+        探测设备的应答时间并选择单次读取的寄存器数量
+
+        在触觉区域上依次测量各请求大小，设备拒绝某一大小时停止增大，
+        选中使整帧触觉读取估算耗时最短的大小并立即生效
+
+        Args:
+            sizes: 探测的请求大小
+            repeats: 每个请求大小的测量次数
+            save: 是否将结果保存到调优缓存，之后的连接不再探测
+            profile_path: 调优结果缓存文件路径，默认为构造时的 profile_path
+
+        Returns:
+            调优结果
+
+        Raises:
+            ConnectionError: 当连接不可用时抛出
+            ValueError: 当设备拒绝了所有探测大小或返回其他错误应答时抛出
+        """
+        if not self._check_connect():
+            raise ConnectionError("连接已断开")
+
+        def read_chunk(address: int, count: int) -> bool:
+            response = self._transact(
+                self.client.read_holding_registers,
+                address=address,
+                count=count
             )
+            if getattr(response, "exception_code", None) == ExcCodes.ILLEGAL_VALUE:
+                return False
             if response.isError():
                 raise ValueError(f"读取寄存器失败: {response}")
+            return True
+
+        profile = probe_read_profile(read_chunk, self.host, self.port, self.tactile_layout.start,
+                                     self.tactile_layout.count, sizes, repeats)
+        self._set_max_count_per_read(profile.max_count_per_read)
+        if save:
+            save_read_profile(profile, profile_path or self.profile_path)
+        return profile
+
+    def get_array(self, register_name: RegisterName | callable) -> "numpy.ndarray":
+        """
+        读取寄存器并解码为NumPy数组（需要安装numpy）
+
+        触觉寄存器按名称中的行列数返回二维int16数组，其余寄存器返回一维数组
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
 
-            all_registers.extend(response.registers)
-            current_addr += batch_count
-            remaining -= batch_count
+        Returns:
+            解码后的数组
 
-        return all_registers
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+            ImportError: 当未安装numpy时抛出
+        """
+        descriptor = self._describe(register_name)
+        if descriptor is None:
+            raise ValueError(f"寄存器 {self._resolve_name(register_name)} 不存在")
+        return decode_array(descriptor.register, self._read_descriptor_words(descriptor))
 
     def _read_range_register(self, register, register_name):
         """读取地址范围寄存器"""
@@ -163,20 +457,25 @@ class RH56DFTPClient(RH56DFTPBase):
         if register.data_type == "short" and count == 2:
             raw_value = all_registers[0]
             value = self._process_raw_value(register, raw_value)
-            logger.info("成功读取寄存器 %s: 值=%d, 地址范围=%d-%d",
-                       register_name, value, start_address, end_address)
+            logger.debug("成功读取寄存器 %s: 值=%d, 地址范围=%d-%d",
+                        register_name, value, start_address, end_address)
         else:
             value = all_registers
-            logger.info("成功读取寄存器 %s: 值=%s, 地址范围=%d-%d",
-                       register_name, value, start_address, end_address)
+            logger.debug("成功读取寄存器 %s: 值=%s, 地址范围=%d-%d",
+                        register_name, value, start_address, end_address)
         return value
 
-    def get(self, register_name: RegisterName | callable) -> Any:
+    def get(self, register_name: RegisterName | callable, verify: bool = False,
+            use_cache: bool = True) -> Any:
         """
         获取指定寄存器的值
 
+        可缓存的寄存器（见 read_cache）命中缓存时不访问设备
+
         Args:
             register_name: 寄存器名称或寄存器函数对象
+            verify: 是否在读取前发送一次同步探测确认连接，默认只检查被动跟踪的连接状态
+            use_cache: 是否使用读缓存，为False时总是从设备读取并刷新缓存
 
         Returns:
             寄存器的当前值
@@ -184,170 +483,101 @@ class RH56DFTPClient(RH56DFTPBase):
         Raises:
             ValueError: 当寄存器不存在或读取失败时抛出
         """
-        # 处理函数对象，提取函数名称作为寄存器名称
-        original_register_name = register_name
-        if callable(register_name):
-            # 从REGISTE_MAP中查找对应的寄存器名称
-            found_name = None
-            for name, func in self.registers.items():
-                func_name = name.replace("(", "_").replace(")", "")
-                if register_name.__name__ == func_name:
-                    found_name = name
-                    break
-            if found_name:
-                register_name = found_name
-            else:
-                register_name = register_name.__name__
-        
-        logger.info("开始读取寄存器: %s", register_name)
+        # 一次索引查找完成名称、函数名与函数对象的解析
+        descriptor = self._describe(register_name)
+        register_name = (descriptor.name if descriptor is not None
+                         else self._resolve_name(register_name))
+        logger.debug("开始读取寄存器: %s", register_name)
+
+        if use_cache and descriptor is not None:
+            hit, value = self.read_cache.lookup(register_name)
+            if hit:
+                return value
 
         # 检查连接状态
-        if not self._check_connect():
+        if not self._check_connect(verify):
             logger.error("读取寄存器 %s 失败: 连接已断开", register_name)
             raise ConnectionError("连接已断开")
 
         # 检查寄存器是否存在
-        if register_name not in self.registers:
+        if descriptor is None:
             logger.error("读取寄存器 %s 失败: 寄存器不存在", register_name)
             raise ValueError(f"寄存器 {register_name} 不存在")
 
-        register = self.registers[register_name]
+        register = descriptor.register
 
         try:
             # 根据地址类型处理
             if isinstance(register.address, int):
-                return self._read_single_register(register, register_name)
-            if isinstance(register.address, tuple) and len(register.address) == 2:
-                return self._read_range_register(register, register_name)
-            # 无效地址格式
-            logger.error("读取寄存器 %s 失败: 无效的地址格式 %s", register_name, register.address)
-            raise ValueError(f"无效的地址格式: {register.address}")
+                value = self._read_single_register(register, register_name)
+            elif isinstance(register.address, tuple) and len(register.address) == 2:
+                value = self._read_range_register(register, register_name)
+            else:
+                # 无效地址格式
+                logger.error("读取寄存器 %s 失败: 无效的地址格式 %s", register_name, register.address)
+                raise ValueError(f"无效的地址格式: {register.address}")
 
         except Exception as e:
             logger.error("读取寄存器 %s 时出错: %s", register_name, str(e))
             raise ValueError(f"读取寄存器 {register_name} 时出错: {str(e)}") from e
 
-    def set(self, register_name: RegisterName | callable, value: Any) -> bool:
+        self.read_cache.store(register_name, value)
+        return value
+
+    def set(self, register_name: RegisterName | callable, value: Any,
+            verify: bool = False) -> bool:
         """
         设置指定寄存器的值
 
         Args:
             register_name: 寄存器名称或寄存器函数对象
             value: 要设置的值
+            verify: 是否在写入前发送一次同步探测确认连接，默认只检查被动跟踪的连接状态
 
         Returns:
             设置是否成功
         """
-        # 处理函数对象，提取函数名称作为寄存器名称
-        if callable(register_name):
-            # 从REGISTE_MAP中查找对应的寄存器名称
-            found_name = None
-            for name, func in self.registers.items():
-                func_name = name.replace("(", "_").replace(")", "")
-                if register_name.__name__ == func_name:
-                    found_name = name
-                    break
-            if found_name:
-                register_name = found_name
-            else:
-                register_name = register_name.__name__
-        
-        logger.info("开始设置寄存器: %s, 值: %s", register_name, value)
+        # 一次索引查找完成名称、函数名与函数对象的解析
+        descriptor = self._describe(register_name)
+        register_name = (descriptor.name if descriptor is not None
+                         else self._resolve_name(register_name))
+        logger.debug("开始设置寄存器: %s, 值: %s", register_name, value)
 
         # 1. 检查连接状态
-        if not self._check_connect():
+        if not self._check_connect(verify):
             logger.error("设置寄存器 %s 失败: 连接已断开", register_name)
             return False
 
         # 2. 检查寄存器是否存在
-        if register_name not in self.registers:
+        if descriptor is None:
             logger.error("设置寄存器 %s 失败: 寄存器不存在", register_name)
             return False
 
-        register = self.registers[register_name]
+        register = descriptor.register
 
-        # 3. 检查访问权限
-        if register.access_type == "read-only":
-            logger.error("设置寄存器 %s 失败: 寄存器是只读的", register_name)
+        # 3. 检查访问权限与值范围
+        reason = validate_write(register, value)
+        if reason:
+            logger.error("设置寄存器 %s 失败: %s", register_name, reason)
             return False
 
-        # 4. 检查值范围
-        if isinstance(register.value_range, tuple) and len(register.value_range) == 2:
-            min_val, max_val = register.value_range
-            if not min_val <= value <= max_val:
-                logger.error("设置寄存器 %s 失败: 值 %s 超出范围 [%s, %s]",
-                            register_name, value, min_val, max_val)
-                return False
-
-        # 5. 处理写入操作
-        return self._write_register(register, value)
+        # 4. 处理写入操作，成功时更新读缓存，失败时设备上的值未知
+        if self._write_register(register, value):
+            self.read_cache.written({register_name: value})
+            return True
+        self.read_cache.invalidate([register_name])
+        return False
 
-    def _write_register(self, register: Register_FTP, value: Any) -> bool:
+    def _check_connect(self, verify: bool = False) -> bool:
         """
-        执行寄存器写入操作
-        
-        Args:
-            register: 寄存器对象
-            value: 要写入的值
-            
-        Returns:
-            写入是否成功
-        """
-        success = False
+        检查连接是否正常
 
-        try:
-            # 处理负数，转换为对应的无符号值
-            write_value = int(value)
-            # 如果是负数，转换为对应的无符号16位整数
-            if write_value < 0:
-                write_value = 65536 + write_value
-                logger.debug("将负数 %d 转换为无符号值 %d", int(value), write_value)
-
-            # 单个地址写入
-            if isinstance(register.address, int):
-                logger.debug("写入单个地址寄存器 %s，地址: %d, 值: %s, 转换后值: %d",
-                            register.name, register.address, value, write_value)
-                response = self.client.write_register(
-                    address=register.address,
-                    value=write_value
-                )
-                if not response.isError():
-                    logger.info("成功设置寄存器 %s: 值=%s, 地址=%d",
-                               register.name, value, register.address)
-                    success = True
-                else:
-                    logger.error("设置寄存器 %s 失败: %s", register.name, response)
-            # 地址范围写入
-            elif isinstance(register.address, tuple) and len(register.address) == 2:
-                start_address = register.address[0]
-                logger.debug("写入地址范围寄存器 %s，起始地址: %d, 值: %s, 转换后值: %d",
-                            register.name, start_address, value, write_value)
-
-                response = self.client.write_register(
-                    address=start_address,
-                    value=write_value
-                )
-                if not response.isError():
-                    logger.info("成功设置寄存器 %s: 值=%s, 起始地址=%d",
-                               register.name, value, start_address)
-                    success = True
-                else:
-                    logger.error("设置寄存器 %s 失败: %s", register.name, response)
-            # 无效地址格式
-            else:
-                logger.error("设置寄存器 %s 失败: 无效的地址格式 %s",
-                            register.name, register.address)
-        except (ValueError, TypeError) as e:
-            logger.error("设置寄存器 %s 时出错: %s", register.name, str(e))
-        except (ConnectionError, TimeoutError, OSError) as e:
-            logger.error("设置寄存器 %s 时发生连接错误: %s", register.name, str(e))
+        默认只返回被动跟踪的连接状态（由传输错误与后台心跳维护），不产生额外的总线流量；
+        连接已标记为断开时立即返回False，重连由后台连接线程完成
 
-        return success
+        Args:
+            verify: 是否发送一次同步探测请求确认连接
 
-    def _check_connect(self) -> bool:
-        """
-        检查连接是否正常
-        
         Returns:
             连接是否正常
         """
@@ -355,32 +585,198 @@ class RH56DFTPClient(RH56DFTPBase):
             logger.error("连接检查失败: 客户端对象为None")
             return False
 
-        def _attempt_reconnect() -> bool:
-            """尝试重新连接设备"""
-            try:
+        if not self.connected.is_set():
+            return False
+        if verify:
+            return self._probe()
+        return True
+
+    def _attempt_reconnect(self) -> bool:
+        """尝试连接设备一次，由后台连接线程调用"""
+        try:
+            # 持有链路，避免与其他线程已在进行的请求交错
+            with self.scheduler.slot(PRIORITY_COMMAND):
                 self.client.close()
-                if self.client.connect():
-                    logger.info("连接已成功重新建立")
-                    return True
-                logger.error("连接检查失败: 无法重新连接到设备")
-                return False
-            except (ConnectionError, TimeoutError, OSError) as re:
-                logger.error("连接检查失败: 重新连接时发生错误: %s", str(re))
-                return False
+                connected = self.client.connect()
+                if connected and self._stop_event.is_set():
+                    self.client.close()
+                    return False
+        except (ConnectionError, TimeoutError, OSError) as re:
+            connected = False
+            error = str(re)
+        else:
+            error = "无法连接到设备"
+        if not connected:
+            self._connect_failures += 1
+            log = logger.warning if self._connect_failures == 1 else logger.debug
+            log("连接 %s:%s 失败（第 %d 次）: %s", self.host, self.port, self._connect_failures, error)
+            self._first_attempt.set()
+            return False
+
+        self._connect_failures = 0
+        self._last_io_time = time.perf_counter()
+        if self._ever_connected:
+            logger.info("连接已成功重新建立")
+            self._metrics.increment("reconnects")
+            # 设备可能已重启，缓存的值不再可信
+            self.read_cache.invalidate()
+        else:
+            logger.info("成功连接到 %s:%s", self.host, self.port)
+            self._ever_connected = True
+        self.is_connected = True
+        self._first_attempt.set()
+        self._apply_read_profile()
+        return True
+
+    def _apply_read_profile(self) -> None:
+        """首次连接后应用读取分块调优结果，没有缓存时探测并保存"""
+        if not self._tune_reads:
+            return
+        with self._tune_lock:
+            if not self._tune_reads or not self.is_connected:
+                return
+            profile = load_read_profile(self.host, self.port, self.profile_path)
+            if profile is not None:
+                logger.info("复用读取分块调优结果: %d 个寄存器/次", profile.max_count_per_read)
+                self._set_max_count_per_read(profile.max_count_per_read)
+                self._tune_reads = False
+                return
+            try:
+                self.tune_read_chunk()
+                self._tune_reads = False
+            except ConnectionError as e:
+                # 探测过程中断开，下次连接后重试
+                logger.warning("读取分块调优因连接断开中止: %s", str(e))
+            except (ValueError, OSError) as e:
+                logger.warning("读取分块调优失败，继续使用 %d 个寄存器/次: %s",
+                               self.max_count_per_read, str(e))
+                self._tune_reads = False
+
+    @staticmethod
+    def _connect_loop(client_ref: "weakref.ref[RH56DFTPClient]", stop_event: threading.Event,
+                      wake_event: threading.Event, min_delay: float, max_delay: float) -> None:
+        """
+        后台连接线程
 
-        # 尝试发送一个简单的命令来验证连接
+        断开时按指数退避加随机抖动反复尝试连接，连接正常时等待断开通知；
+        客户端被回收或调用 close() 后退出
+
+        Args:
+            client_ref: 客户端弱引用
+            stop_event: 停止事件
+            wake_event: 断开通知事件
+            min_delay: 初始退避间隔（秒）
+            max_delay: 最大退避间隔（秒）
+        """
+        delay = min_delay
+        while not stop_event.is_set():
+            wake_event.clear()
+            client = client_ref()
+            if client is None:
+                return
+            if client.is_connected:
+                del client
+                delay = min_delay
+                # 定期醒来检查客户端是否已被回收
+                wake_event.wait(max_delay)
+                continue
+            connected = client._attempt_reconnect()  # pylint: disable=protected-access
+            del client
+            if connected:
+                delay = min_delay
+                continue
+            # 在 [delay/2, delay] 内随机等待，避免多个客户端同时重连
+            if stop_event.wait(random.uniform(delay / 2, delay)):
+                return
+            delay = min(delay * 2, max_delay)
+
+    def _probe(self) -> bool:
+        """
+        发送一次同步探测请求，读取心跳寄存器确认设备有应答
+
+        Returns:
+            设备是否正常应答
+        """
+        register = self.registers[HEARTBEAT_REGISTER]
         try:
-            # 使用一个不会改变设备状态的简单读取操作
-            # 这里使用0地址作为示例，实际应用中可能需要使用一个安全的地址
-            response = self.client.read_holding_registers(address=0, count=1)
+            response = self._transact(
+                self.client.read_holding_registers,
+                address=register.address,
+                count=1
+            )
             return not response.isError()
-        except (ConnectionError, TimeoutError, OSError) as e:
-            logger.warning("连接检查失败: %s，尝试重新连接", str(e))
-            return _attempt_reconnect()
+        except TRANSPORT_ERRORS as e:
+            logger.warning("连接检查失败: %s", str(e))
+            return False
         except (AttributeError, ValueError) as e:
             logger.error("连接检查失败: 客户端对象异常: %s", str(e))
             return False
 
+    @staticmethod
+    def _heartbeat_loop(client_ref: "weakref.ref[RH56DFTPClient]",
+                        stop_event: threading.Event, interval: float) -> None:
+        """
+        后台心跳线程
+
+        链路空闲超过心跳间隔时发送探测，探测失败时由后台连接线程重连；
+        客户端被回收或调用 close() 后退出
+
+        Args:
+            client_ref: 客户端弱引用
+            stop_event: 停止事件
+            interval: 心跳间隔（秒）
+        """
+        while not stop_event.wait(interval):
+            client = client_ref()
+            if client is None:
+                return
+            idle = time.perf_counter() - client._last_io_time  # pylint: disable=protected-access
+            if client.is_connected and idle >= interval:
+                client._probe()  # pylint: disable=protected-access
+            del client
+
+    def invalidate_cache(self, register_names: Optional[Iterable[RegisterName | callable]] = None
+                         ) -> None:
+        """
+        使读缓存失效，例如其他程序修改了设备配置之后
+
+        Args:
+            register_names: 要失效的寄存器名称或寄存器函数对象，默认为全部
+        """
+        if register_names is None:
+            self.read_cache.invalidate()
+        else:
+            self.read_cache.invalidate(self._resolve_name(name) for name in register_names)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        获取指标快照
+
+        Returns:
+            {"counters": 计数器, "by_function": {功能码: 直方图}, "by_group": {寄存器组: 直方图},
+            "by_phase": {阶段: 直方图}}，
+            直方图为 {"buckets": {上界(秒): 累计次数}, "count": 次数, "sum": 总耗时(秒)}
+        """
+        return self._metrics.snapshot()
+
+    def reset_metrics(self) -> None:
+        """清空指标"""
+        self._metrics.reset()
+
+    def serve_metrics(self, port: int = DEFAULT_METRICS_PORT,
+                      host: str = "127.0.0.1") -> MetricsServer:
+        """
+        在后台线程中以Prometheus文本格式提供本客户端的指标
+
+        Args:
+            port: 监听端口，为0时由系统分配
+            host: 监听地址，默认只监听本机
+
+        Returns:
+            已启动的指标服务，调用 stop() 停止
+        """
+        return serve_metrics([self], host, port)
+
     def get_register(self, register_name: RegisterName) -> Register_FTP:
         """
         获取寄存器对象
@@ -402,9 +798,14 @@ class RH56DFTPClient(RH56DFTPBase):
         """
         关闭连接
         """
-        if self.client:
+        stop_event = getattr(self, "_stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+            self._connect_wake.set()
+        if getattr(self, "client", None):
             logger.info("正在关闭连接")
             self.client.close()
+            self.is_connected = False
             logger.info("连接已关闭")
 
     def __del__(self) -> None:
@@ -413,5 +814,36 @@ class RH56DFTPClient(RH56DFTPBase):
         """
         self.close()
 
+def _make_register_getter(register_name: RegisterName):
+    """
+    生成寄存器读取方法，方法在类上只创建一次，通过实例的寄存器索引直接读取
+
+    Args:
+        register_name: 寄存器名称
+
+    Returns:
+        未绑定的读取方法
+    """
+    def getter(self: RH56DFTPClient) -> Any:
+        descriptor = self._register_index.get(register_name)  # pylint: disable=protected-access
+        if descriptor is None:
+            raise ValueError(f"寄存器 {register_name} 不存在")
+        return self._read_descriptor(descriptor)  # pylint: disable=protected-access
+
+    getter.__name__ = f"get_{normalize_register_name(register_name)}"
+    getter.__qualname__ = f"RH56DFTPClient.{getter.__name__}"
+    getter.__doc__ = f"获取寄存器 {register_name} 的值\n" + (REGISTER_MAP[register_name].__doc__ or "")
+    # 触觉寄存器返回原始寄存器值列表，其余寄存器返回单个值
+    getter.__annotations__["return"] = List[int] if register_name.startswith("TACTILE_") else int
+    return getter
+
+
+# 在类上注入寄存器读取方法，用于IDE函数提示：get_FORCE_ACT_0() 及兼容旧名称的 get_FORCE_ACT(0)
+for _register_name in ALL_REGISTER_NAMES:
+    _getter = _make_register_getter(_register_name)
+    setattr(RH56DFTPClient, f"get_{_register_name}", _getter)
+    setattr(RH56DFTPClient, _getter.__name__, _getter)
+del _register_name, _getter
+
 # 添加别名以保持向后兼容
 RH56DFTP_TCP = RH56DFTPClient  # pylint: disable=invalid-name
@@ -1,7 +1,15 @@
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
 from .RH56DFTP_base import RH56DFTP_base
+from .RH56DFTP_cache import RegisterCache
 from Register.RegisterKey.ftp_registers_keys import RegisterName
 from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_decode import TactileFrame, TactileLayout
+from .RH56DFTP_metrics import MetricsServer
+from .RH56DFTP_plan import ReadPlanner
+from .RH56DFTP_scheduler import RequestScheduler
+from .RH56DFTP_tuning import ReadProfile
+from .RH56DFTP_state import HandState
 from pymodbus.client import ModbusTcpClient
 
 class RH56DFTP_TCP(RH56DFTP_base):
@@ -9,28 +17,68 @@ class RH56DFTP_TCP(RH56DFTP_base):
     RH56DFTP的TCP实现类，用于通过Modbus TCP协议与设备通信
     """
     
+    host: str
+    port: int
     client: ModbusTcpClient
     registers: Dict[RegisterName, Register_FTP]
+    is_connected: bool
+    phase_timing: bool
+    connected: threading.Event
+    read_planner: ReadPlanner
+    tactile_layout: TactileLayout
+    heartbeat_interval: float
+    read_cache: RegisterCache
+    scheduler: RequestScheduler
+    max_count_per_read: int
+    profile_path: Optional[str]
     
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, config_folder_path: str = None,
+                 heartbeat_interval: float = 1.0,
+                 cache_ttl: Optional[Dict[str, float]] = None,
+                 tune_reads: bool = False, profile_path: Optional[str] = None,
+                 connect_timeout: Optional[float] = 3.0,
+                 reconnect_min_delay: float = 0.1,
+                 reconnect_max_delay: float = 5.0,
+                 phase_timing: bool = False) -> None:
         """
-        初始化TCP连接
+        初始化TCP连接，连接由后台线程建立并在断开后按指数退避重连
         
         Args:
             host: 设备IP地址
             port: 设备端口号
-        
-        Raises:
-            ConnectionError: 当连接失败时抛出
+            config_folder_path: 寄存器配置文件夹路径
+            heartbeat_interval: 后台心跳间隔（秒），为0时关闭心跳
+            cache_ttl: 覆盖读缓存各类别的默认有效期（秒），如 {"command": 0.5}
+            tune_reads: 是否按设备调优单次读取的寄存器数量，优先复用该 host:port 的缓存结果
+            profile_path: 调优结果缓存文件路径，默认为 ~/.rh56dftp/read_profiles.json
+            connect_timeout: 构造时等待首次连接尝试的最长时间（秒），首次尝试失败时立即返回，为0时不等待
+            reconnect_min_delay: 重连的初始退避间隔（秒）
+            reconnect_max_delay: 重连的最大退避间隔（秒）
+            phase_timing: 是否按编码、网络等待与解码阶段统计请求耗时
+        """
+        ...
+
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待连接建立
+
+        Args:
+            timeout: 最长等待时间（秒），为None时一直等待
+
+        Returns:
+            连接是否已建立
         """
         ...
     
-    def get(self, register_name: RegisterName) -> Any:
+    def get(self, register_name: RegisterName, verify: bool = False,
+            use_cache: bool = True) -> Any:
         """
         获取指定寄存器的值
         
         Args:
             register_name: 寄存器名称
+            verify: 是否在读取前发送一次同步探测确认连接
+            use_cache: 是否使用读缓存
             
         Returns:
             寄存器的当前值
@@ -41,19 +89,257 @@ class RH56DFTP_TCP(RH56DFTP_base):
         """
         ...
     
-    def set(self, register_name: RegisterName, value: Any) -> bool:
+    def read_many(self, register_names: Iterable[RegisterName],
+                  verify: bool = False, use_cache: bool = True) -> Dict[RegisterName, Any]:
+        """
+        按读取计划批量读取任意一组寄存器
+        
+        Args:
+            register_names: 寄存器名称序列
+            verify: 是否在读取前发送一次同步探测确认连接
+            use_cache: 是否使用读缓存
+            
+        Returns:
+            寄存器名称 -> 值，值的格式与 get() 一致
+        
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        ...
+    
+    def read_state(self, include_setpoints: bool = False) -> HandState:
+        """
+        批量读取整手状态快照
+        
+        Args:
+            include_setpoints: 是否同时读取设定值块（ANGLE_SET/POS_SET）
+            
+        Returns:
+            整手状态快照
+        
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        ...
+    
+    def read_tactile_frame(self, max_in_flight: int = 8) -> Dict[RegisterName, List[int]]:
+        """
+        流水线读取全部17个触觉寄存器的整帧数据
+        
+        Args:
+            max_in_flight: 同一连接上的最大在途事务数
+            
+        Returns:
+            触觉寄存器名称 -> 原始寄存器值列表
+        
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        ...
+    
+    def read_tactile_tensor(self, max_in_flight: int = 8) -> TactileFrame:
+        """
+        流水线读取整帧触觉数据并向量化解码为NumPy数组（需要安装numpy）
+        
+        Args:
+            max_in_flight: 同一连接上的最大在途事务数
+            
+        Returns:
+            触觉帧，data 为全手int16一维数组，pads 为各触觉区域的二维视图
+        """
+        ...
+    
+    def get_array(self, register_name: RegisterName) -> "numpy.ndarray":
+        """
+        读取寄存器并解码为NumPy数组（需要安装numpy）
+        
+        Args:
+            register_name: 寄存器名称
+            
+        Returns:
+            触觉寄存器为二维int16数组，其余寄存器为一维数组
+        """
+        ...
+    
+    def set(self, register_name: RegisterName, value: Any, verify: bool = False) -> bool:
         """
         设置指定寄存器的值
         
         Args:
             register_name: 寄存器名称
             value: 要设置的值
+            verify: 是否在写入前发送一次同步探测确认连接
             
         Returns:
             设置是否成功
         """
         ...
     
+    def set_many(self, values: Dict[RegisterName, Any], verify: bool = False) -> bool:
+        """
+        批量设置多个寄存器的值，值所在地址连续的寄存器合并为一次 write_registers 请求
+        
+        Args:
+            values: 寄存器名称 -> 要设置的值
+            verify: 是否在写入前发送一次同步探测确认连接
+            
+        Returns:
+            全部写入是否成功
+        """
+        ...
+    
+    def set_pose(self, values: Sequence[int], mode: Literal["angle", "pos"] = "angle",
+                 verify: bool = False) -> bool:
+        """
+        一次性设置六个自由度的角度或位置设定值
+        
+        Args:
+            values: 六个自由度的设定值
+            mode: "angle" 写入 ANGLE_SET，"pos" 写入 POS_SET
+            verify: 是否在写入前发送一次同步探测确认连接
+            
+        Returns:
+            全部写入是否成功
+        
+        Raises:
+            ValueError: 当值的数量或模式不正确时抛出
+        """
+        ...
+    
+    # 寄存器读取方法，在类上生成；带括号的旧名称 get_FORCE_ACT(0) 只能通过 getattr 访问
+    def get_HAND_ID(self) -> int: ...
+    def get_REDU_RATIO(self) -> int: ...
+    def get_CLEAR_ERROR(self) -> int: ...
+    def get_SAVE(self) -> int: ...
+    def get_RESET_PARA(self) -> int: ...
+    def get_GESTURE_FORCE_CALIB(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_0(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_1(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_2(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_3(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_4(self) -> int: ...
+    def get_DEFAULT_SPEED_SET_5(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_0(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_1(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_2(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_3(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_4(self) -> int: ...
+    def get_DEFAULT_FORCE_SET_5(self) -> int: ...
+    def get_POS_SET_0(self) -> int: ...
+    def get_POS_SET_1(self) -> int: ...
+    def get_POS_SET_2(self) -> int: ...
+    def get_POS_SET_3(self) -> int: ...
+    def get_POS_SET_4(self) -> int: ...
+    def get_POS_SET_5(self) -> int: ...
+    def get_ANGLE_SET_0(self) -> int: ...
+    def get_ANGLE_SET_1(self) -> int: ...
+    def get_ANGLE_SET_2(self) -> int: ...
+    def get_ANGLE_SET_3(self) -> int: ...
+    def get_ANGLE_SET_4(self) -> int: ...
+    def get_ANGLE_SET_5(self) -> int: ...
+    def get_FORCE_ACT_0(self) -> int: ...
+    def get_FORCE_ACT_1(self) -> int: ...
+    def get_FORCE_ACT_2(self) -> int: ...
+    def get_FORCE_ACT_3(self) -> int: ...
+    def get_FORCE_ACT_4(self) -> int: ...
+    def get_FORCE_ACT_5(self) -> int: ...
+    def get_CURRENT_0(self) -> int: ...
+    def get_CURRENT_1(self) -> int: ...
+    def get_CURRENT_2(self) -> int: ...
+    def get_CURRENT_3(self) -> int: ...
+    def get_CURRENT_4(self) -> int: ...
+    def get_CURRENT_5(self) -> int: ...
+    def get_ERROR_0(self) -> int: ...
+    def get_ERROR_1(self) -> int: ...
+    def get_ERROR_2(self) -> int: ...
+    def get_ERROR_3(self) -> int: ...
+    def get_ERROR_4(self) -> int: ...
+    def get_ERROR_5(self) -> int: ...
+    def get_TEMP_0(self) -> int: ...
+    def get_TEMP_1(self) -> int: ...
+    def get_TEMP_2(self) -> int: ...
+    def get_TEMP_3(self) -> int: ...
+    def get_TEMP_4(self) -> int: ...
+    def get_TEMP_5(self) -> int: ...
+    def get_TACTILE_SMALL_FINGER_TIP_3x3(self) -> List[int]: ...
+    def get_TACTILE_SMALL_FINGER_TIP_12x8(self) -> List[int]: ...
+    def get_TACTILE_SMALL_FINGER_PALM_10x8(self) -> List[int]: ...
+    def get_TACTILE_RING_FINGER_TIP_3x3(self) -> List[int]: ...
+    def get_TACTILE_RING_FINGER_TIP_12x8(self) -> List[int]: ...
+    def get_TACTILE_RING_FINGER_PALM_10x8(self) -> List[int]: ...
+    def get_TACTILE_MIDDLE_FINGER_TIP_3x3(self) -> List[int]: ...
+    def get_TACTILE_MIDDLE_FINGER_TIP_12x8(self) -> List[int]: ...
+    def get_TACTILE_MIDDLE_FINGER_PALM_10x8(self) -> List[int]: ...
+    def get_TACTILE_INDEX_FINGER_TIP_3x3(self) -> List[int]: ...
+    def get_TACTILE_INDEX_FINGER_TIP_12x8(self) -> List[int]: ...
+    def get_TACTILE_INDEX_FINGER_PALM_10x8(self) -> List[int]: ...
+    def get_TACTILE_THUMB_TIP_3x3(self) -> List[int]: ...
+    def get_TACTILE_THUMB_TIP_12x8(self) -> List[int]: ...
+    def get_TACTILE_THUMB_MIDDLE_3x3(self) -> List[int]: ...
+    def get_TACTILE_THUMB_PALM_12x8(self) -> List[int]: ...
+    def get_TACTILE_PALM_8x14(self) -> List[int]: ...
+    
+    def tune_read_chunk(self, sizes: Iterable[int] = (16, 32, 64, 96, 125), repeats: int = 5,
+                        save: bool = True, profile_path: Optional[str] = None) -> ReadProfile:
+        """
+        探测设备的应答时间并选择单次读取的寄存器数量
+
+        Args:
+            sizes: 探测的请求大小
+            repeats: 每个请求大小的测量次数
+            save: 是否将结果保存到调优缓存
+            profile_path: 调优结果缓存文件路径
+
+        Returns:
+            调优结果
+
+        Raises:
+            ConnectionError: 当连接不可用时抛出
+            ValueError: 当设备拒绝了所有探测大小时抛出
+        """
+        ...
+
+    def invalidate_cache(self, register_names: Optional[Iterable[RegisterName]] = None) -> None:
+        """
+        使读缓存失效
+        
+        Args:
+            register_names: 要失效的寄存器，默认为全部
+        """
+        ...
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        获取指标快照
+        
+        Returns:
+            {"counters": 计数器, "by_function": {功能码: 直方图}, "by_group": {寄存器组: 直方图},
+            "by_phase": {阶段: 直方图}}
+        """
+        ...
+    
+    def reset_metrics(self) -> None:
+        """
+        清空指标
+        """
+        ...
+    
+    def serve_metrics(self, port: int = 9108, host: str = "127.0.0.1") -> MetricsServer:
+        """
+        在后台线程中以Prometheus文本格式提供本客户端的指标
+        
+        Args:
+            port: 监听端口，为0时由系统分配
+            host: 监听地址，默认只监听本机
+            
+        Returns:
+            已启动的指标服务
+        """
+        ...
+    
     def get_register(self, register_name: RegisterName) -> Register_FTP:
         """
         获取寄存器对象
@@ -69,10 +355,13 @@ class RH56DFTP_TCP(RH56DFTP_base):
         """
         ...
     
-    def _check_connect(self) -> bool:
+    def _check_connect(self, verify: bool = False) -> bool:
         """
-        检查连接是否正常
+        检查连接是否正常，默认只返回被动跟踪的连接状态，离线时立即返回False
         
+        Args:
+            verify: 是否发送一次同步探测请求确认连接
+            
         Returns:
             连接是否正常
         """
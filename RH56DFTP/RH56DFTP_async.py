@@ -0,0 +1,434 @@
+"""
+RH56DFTP 异步实现模块，基于asyncio通过Modbus TCP协议与设备通信
+"""
+# 标准库导入
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# 第三方库导入
+from pymodbus.client import AsyncModbusTcpClient
+
+# 本地库导入
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterBuild.RegisterFactory import register_factory
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import (
+    MAX_COUNT_PER_READ,
+    encode_raw_value,
+    encode_register_words,
+    merge_write_runs,
+    register_span,
+    validate_write
+)
+from .RH56DFTP_index import RegisterDescriptor, build_register_index, lookup_register
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_plan import ReadPlanner
+from .RH56DFTP_base import TRANSPORT_ERRORS
+from .RH56DFTP_state import (
+    HandState,
+    STATE_BLOCK_START,
+    STATE_BLOCK_COUNT,
+    SETPOINT_BLOCK_START,
+    SETPOINT_BLOCK_COUNT
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class AsyncRH56DFTPClient:
+    """
+    RH56DFTP的异步TCP实现类，接口与RH56DFTPClient保持一致，所有IO方法均为协程
+
+    pymodbus的异步客户端在同一连接上逐个执行请求，多个协程并发调用时请求依次发出，不会在链路上重叠
+
+    Example::
+
+        async with AsyncRH56DFTPClient("192.168.11.210", 6000) as client:
+            force = await client.get("FORCE_ACT(0)")
+            await client.set("ANGLE_SET(0)", 500)
+    """
+
+    def __init__(self, host: str, port: int, config_folder_path: str = None):
+        """
+        创建异步客户端，连接需调用 connect() 或使用 async with 建立
+
+        Args:
+            host: 设备IP地址
+            port: 设备端口号
+            config_folder_path: 寄存器配置文件夹路径，默认为包内的配置路径
+        """
+        self.host = host
+        self.port = port
+        self.client = AsyncModbusTcpClient(host=host, port=port, timeout=3)
+        self.is_connected = False
+
+        # 与同步客户端共用同一份寄存器表
+        self.registers: Dict[RegisterName, Register_FTP] = register_factory.create_registers(
+            config_folder_path=None,
+            strategy_name='ftp'
+        )
+        self._register_index: Dict[Any, RegisterDescriptor] = build_register_index(self.registers)
+        # 与同步客户端相同的读取计划编译器
+        self.read_planner = ReadPlanner(self.registers)
+        self._tactile_names: List[RegisterName] = sorted(
+            (name for name in self.registers if name.startswith("TACTILE_")),
+            key=lambda name: register_span(self.registers[name])[0]
+        )
+
+    async def connect(self) -> bool:
+        """
+        建立连接
+
+        Returns:
+            连接是否成功
+        """
+        logger.info("正在初始化连接到设备: %s:%s", self.host, self.port)
+        self.is_connected = await self.client.connect()
+        if not self.is_connected:
+            logger.warning("连接失败：无法连接到 %s:%s，将以离线模式初始化", self.host, self.port)
+        else:
+            logger.info("成功连接到 %s:%s", self.host, self.port)
+        return self.is_connected
+
+    async def _transact(self, method, **kwargs):
+        """
+        执行一次Modbus请求并被动跟踪连接状态，传输层异常时将连接标记为断开
+
+        Args:
+            method: pymodbus异步客户端的请求方法，如 self.client.read_holding_registers
+            **kwargs: 请求参数
+
+        Returns:
+            设备应答
+        """
+        try:
+            response = await method(**kwargs)
+        except TRANSPORT_ERRORS:
+            if self.is_connected:
+                logger.warning("检测到传输错误，连接已标记为断开")
+            self.is_connected = False
+            raise
+        self.is_connected = True
+        return response
+
+    def _describe(self, register_name: RegisterName | callable) -> Optional[RegisterDescriptor]:
+        """在寄存器索引中查找描述符，寄存器不存在时返回None"""
+        return lookup_register(self._register_index, register_name)
+
+    def _resolve_name(self, register_name: RegisterName | callable) -> RegisterName:
+        """将寄存器函数对象或函数名转换为寄存器名称，未知的键原样返回（函数对象返回函数名）"""
+        descriptor = lookup_register(self._register_index, register_name)
+        if descriptor is not None:
+            return descriptor.name
+        return register_name.__name__ if callable(register_name) else register_name
+
+    async def read_registers(self, start_address: int, count: int) -> List[int]:
+        """
+        批量读取连续寄存器，超过单次读取上限时自动分批
+
+        Args:
+            start_address: 起始地址
+            count: 寄存器数量
+
+        Returns:
+            按地址顺序排列的原始寄存器值
+
+        Raises:
+            ValueError: 当读取失败时抛出
+        """
+        all_registers = []
+        current_addr = start_address
+        remaining = count
+
+        while remaining > 0:
+            batch_count = min(remaining, MAX_COUNT_PER_READ)
+            response = await self._transact(
+                self.client.read_holding_registers,
+                address=current_addr,
+                count=batch_count
+            )
+            if response.isError():
+                raise ValueError(f"读取寄存器失败: {response}")
+
+            all_registers.extend(response.registers)
+            current_addr += batch_count
+            remaining -= batch_count
+
+        return all_registers
+
+    async def get(self, register_name: RegisterName | callable) -> Any:
+        """
+        获取指定寄存器的值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+
+        Returns:
+            寄存器的当前值，返回格式与 RH56DFTPClient.get() 一致
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        descriptor = self._describe(register_name)
+        register_name = (descriptor.name if descriptor is not None
+                         else self._resolve_name(register_name))
+        logger.debug("开始读取寄存器: %s", register_name)
+
+        if not self.client.connected:
+            logger.error("读取寄存器 %s 失败: 连接已断开", register_name)
+            raise ConnectionError("连接已断开")
+
+        if descriptor is None:
+            logger.error("读取寄存器 %s 失败: 寄存器不存在", register_name)
+            raise ValueError(f"寄存器 {register_name} 不存在")
+
+        try:
+            words = await self.read_registers(descriptor.address, descriptor.count)
+        except Exception as e:
+            logger.error("读取寄存器 %s 时出错: %s", register_name, str(e))
+            raise ValueError(f"读取寄存器 {register_name} 时出错: {str(e)}") from e
+
+        # 与同步客户端一致：单地址与双地址short返回单个值，其余返回原始列表
+        value = descriptor.decode(words)
+        logger.debug("成功读取寄存器 %s: 值=%s", register_name, value)
+        return value
+
+    async def set(self, register_name: RegisterName | callable, value: Any) -> bool:
+        """
+        设置指定寄存器的值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            value: 要设置的值
+
+        Returns:
+            设置是否成功
+        """
+        descriptor = self._describe(register_name)
+        register_name = (descriptor.name if descriptor is not None
+                         else self._resolve_name(register_name))
+        logger.debug("开始设置寄存器: %s, 值: %s", register_name, value)
+
+        if not self.client.connected:
+            logger.error("设置寄存器 %s 失败: 连接已断开", register_name)
+            return False
+
+        if descriptor is None:
+            logger.error("设置寄存器 %s 失败: 寄存器不存在", register_name)
+            return False
+
+        reason = validate_write(descriptor.register, value)
+        if reason:
+            logger.error("设置寄存器 %s 失败: %s", register_name, reason)
+            return False
+
+        try:
+            start_address = descriptor.address
+            response = await self._transact(
+                self.client.write_register,
+                address=start_address,
+                value=encode_raw_value(value)
+            )
+        except (ValueError, TypeError) as e:
+            logger.error("设置寄存器 %s 时出错: %s", register_name, str(e))
+            return False
+        except TRANSPORT_ERRORS as e:
+            logger.error("设置寄存器 %s 时发生连接错误: %s", register_name, str(e))
+            return False
+
+        if response.isError():
+            logger.error("设置寄存器 %s 失败: %s", register_name, response)
+            return False
+        logger.debug("成功设置寄存器 %s: 值=%s, 地址=%d", register_name, value, start_address)
+        return True
+
+    async def read_many(self, register_names: Iterable[RegisterName | callable]
+                        ) -> Dict[RegisterName, Any]:
+        """
+        按读取计划批量读取任意一组寄存器，参见 RH56DFTPClient.read_many()
+
+        Args:
+            register_names: 寄存器名称或寄存器函数对象序列
+
+        Returns:
+            寄存器名称 -> 值，值的格式与 get() 一致
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        plan = self.read_planner.plan(self._resolve_name(name) for name in register_names)
+
+        if not self.client.connected:
+            logger.error("批量读取寄存器失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            segment_words = [
+                await self.read_registers(segment.start, segment.count)
+                for segment in plan.segments
+            ]
+        except Exception as e:
+            logger.error("批量读取寄存器时出错: %s", str(e))
+            raise ValueError(f"批量读取寄存器时出错: {str(e)}") from e
+
+        values = {
+            register_name: self._register_index[register_name].decode(words)
+            for register_name, words in plan.extract(segment_words).items()
+        }
+        logger.debug("成功批量读取 %d 个寄存器，共 %d 次请求", len(values), plan.request_count)
+        return values
+
+    async def set_many(self, values: Dict[RegisterName | callable, Any]) -> bool:
+        """
+        批量设置多个寄存器的值，参见 RH56DFTPClient.set_many()
+
+        先对全部值进行校验，任一值不合法时不写入任何寄存器；值所在地址连续的寄存器合并为一次写入
+
+        Args:
+            values: 寄存器名称或寄存器函数对象 -> 要设置的值
+
+        Returns:
+            全部写入是否成功
+        """
+        if not self.client.connected:
+            logger.error("批量设置寄存器失败: 连接已断开")
+            return False
+
+        items = []
+        for name, value in values.items():
+            descriptor = self._describe(name)
+            if descriptor is None:
+                logger.error("批量设置寄存器失败: 寄存器 %s 不存在", self._resolve_name(name))
+                return False
+            reason = validate_write(descriptor.register, value)
+            if reason:
+                logger.error("批量设置寄存器失败: 寄存器 %s %s", descriptor.name, reason)
+                return False
+            try:
+                items.append((descriptor.address,
+                              encode_register_words(descriptor.register, value)))
+            except (ValueError, TypeError) as e:
+                logger.error("批量设置寄存器失败: 寄存器 %s 编码出错: %s", descriptor.name, str(e))
+                return False
+
+        try:
+            for start_address, words in merge_write_runs(items):
+                if len(words) == 1:
+                    response = await self._transact(
+                        self.client.write_register, address=start_address, value=words[0]
+                    )
+                else:
+                    response = await self._transact(
+                        self.client.write_registers, address=start_address, values=words
+                    )
+                if response.isError():
+                    logger.error("批量写入失败: 起始地址=%d, %s", start_address, response)
+                    return False
+        except TRANSPORT_ERRORS as e:
+            logger.error("批量写入时发生连接错误: %s", str(e))
+            return False
+        return True
+
+    async def read_state(self, include_setpoints: bool = False) -> HandState:
+        """
+        批量读取整手状态快照，参见 RH56DFTPClient.read_state()
+
+        Args:
+            include_setpoints: 是否同时读取设定值块
+
+        Returns:
+            整手状态快照
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        if not self.client.connected:
+            logger.error("读取状态快照失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            state_words = await self.read_registers(STATE_BLOCK_START, STATE_BLOCK_COUNT)
+            setpoint_words = None
+            if include_setpoints:
+                setpoint_words = await self.read_registers(
+                    SETPOINT_BLOCK_START, SETPOINT_BLOCK_COUNT
+                )
+            state = HandState.from_blocks(
+                self.registers, state_words, setpoint_words, timestamp=time.time()
+            )
+        except Exception as e:
+            logger.error("读取状态快照时出错: %s", str(e))
+            raise ValueError(f"读取状态快照时出错: {str(e)}") from e
+
+        logger.debug("成功读取状态快照: %s", state)
+        return state
+
+    async def read_tactile_frame(self) -> Dict[RegisterName, List[int]]:
+        """
+        读取全部17个触觉寄存器的整帧数据（地址3000-5123）
+
+        Returns:
+            触觉寄存器名称 -> 原始寄存器值列表
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        frame_start = register_span(self.registers[self._tactile_names[0]])[0]
+        last_start, last_count = register_span(self.registers[self._tactile_names[-1]])
+        frame_count = last_start + last_count - frame_start
+
+        if not self.client.connected:
+            logger.error("读取触觉帧失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            words = await self.read_registers(frame_start, frame_count)
+        except Exception as e:
+            logger.error("读取触觉帧时出错: %s", str(e))
+            raise ValueError(f"读取触觉帧时出错: {str(e)}") from e
+
+        frame = {}
+        for register_name in self._tactile_names:
+            start_address, register_count = register_span(self.registers[register_name])
+            offset = start_address - frame_start
+            frame[register_name] = words[offset:offset + register_count]
+        return frame
+
+    def get_register(self, register_name: RegisterName) -> Register_FTP:
+        """
+        获取寄存器对象
+
+        Args:
+            register_name: 寄存器名称
+
+        Returns:
+            对应的Register_FTP对象
+
+        Raises:
+            ValueError: 当寄存器不存在时抛出
+        """
+        if register_name not in self.registers:
+            raise ValueError(f"寄存器 {register_name} 不存在")
+        return self.registers[register_name]
+
+    def close(self) -> None:
+        """
+        关闭连接
+        """
+        if self.client:
+            logger.info("正在关闭连接")
+            self.client.close()
+            self.is_connected = False
+            logger.info("连接已关闭")
+
+    async def __aenter__(self) -> "AsyncRH56DFTPClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -2,8 +2,14 @@
 RH56DFTP 基类模块，定义了设备通信的基本接口
 """
 from abc import ABC, abstractmethod
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
 from Register.RegisterKey.ftp_registers_keys import RegisterName
 
+# 视为连接失效的传输层异常
+TRANSPORT_ERRORS = (ConnectionException, ModbusIOException, ConnectionError, TimeoutError, OSError)
+
 class RH56DFTPBase(ABC):
     """
     RH56DFTP 基类，后期可以根据协议不同而重写
@@ -45,9 +51,12 @@ class RH56DFTPBase(ABC):
         """
 
     @abstractmethod
-    def _check_connect(self) -> bool:
+    def _check_connect(self, verify: bool = False) -> bool:
         """
-        每次使用set与get时检查连接,默认set与get为低频操作，有性能要求加入另外的get,set.
+        每次使用set与get时检查连接，默认只返回被动跟踪的连接状态，不应产生额外的总线流量
+
+        Args:
+            verify: 是否发送一次同步探测请求确认连接
 
         Returns:
             连接是否正常
@@ -0,0 +1,227 @@
+"""
+RH56DFTP 批量读取模块，按单次读取上限分块读取连续地址，并按读取计划合并任意一组寄存器
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List
+
+from pymodbus.constants import ExcCodes
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_index import RegisterDescriptor
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_plan import ReadPlanner
+from .RH56DFTP_state import (
+    HandState,
+    STATE_BLOCK_START,
+    STATE_BLOCK_COUNT,
+    SETPOINT_BLOCK_START,
+    SETPOINT_BLOCK_COUNT
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class BatchReadMixin:
+    """
+    RH56DFTPClient 的分块读取、按计划批量读取与整手状态快照
+
+    依赖宿主类提供 registers、client、read_cache、read_planner、max_count_per_read、
+    _register_index、_transact()、_resolve_name() 与 _check_connect()
+    """
+
+    def _set_max_count_per_read(self, max_count_per_read: int) -> None:
+        """设置单次读取的寄存器数量，并按新的上限重建读取计划"""
+        self.max_count_per_read = max_count_per_read
+        self.read_planner = ReadPlanner(self.registers,
+                                        gap_threshold=self.read_planner.gap_threshold,
+                                        max_count=max_count_per_read)
+
+    def _shrink_on_rejection(self, response, batch_count: int) -> bool:
+        """
+        设备以非法数据值拒绝读取分块时减小单次读取的寄存器数量
+
+        Args:
+            response: 设备应答
+            batch_count: 该分块的寄存器数量
+
+        Returns:
+            是否已减小，为True时应按新的上限重试
+        """
+        if (response is None or getattr(response, "exception_code", None) != ExcCodes.ILLEGAL_VALUE
+                or batch_count <= 1):
+            return False
+        if batch_count <= self.max_count_per_read:
+            logger.warning("设备拒绝了 %d 个寄存器的读取请求，单次读取数量降为 %d",
+                           batch_count, batch_count // 2)
+            self._set_max_count_per_read(batch_count // 2)
+        return True
+
+    def _read_register_batch(self, start_address, count):
+        """
+        读取寄存器批次，每个分块单独向调度器申请链路，高优先级请求可在分块之间插入
+
+        设备以非法数据值拒绝分块时将 max_count_per_read 减半后重试该分块
+        """
+        all_registers = []
+        current_addr = start_address
+        remaining = count
+
+        while remaining > 0:
+            batch_count = min(remaining, self.max_count_per_read)
+            logger.debug("读取批次: 起始地址=%d, 数量=%d, 剩余=%d",
+                        current_addr, batch_count, remaining - batch_count)
+
+            response = self._transact(
+                self.client.read_holding_registers,
+                address=current_addr,
+                count=batch_count
+            )
+            if self._shrink_on_rejection(response, batch_count):
+                continue
+            if response.isError():
+                raise ValueError(f"读取寄存器失败: {response}")
+
+            all_registers.extend(response.registers)
+            current_addr += batch_count
+            remaining -= batch_count
+
+        return all_registers
+
+    def _read_descriptor(self, descriptor: RegisterDescriptor) -> Any:
+        """
+        按预编译的寄存器描述符读取并解码，跳过 get() 的键解析与地址格式判断
+
+        Args:
+            descriptor: 寄存器描述符
+
+        Returns:
+            寄存器的当前值，格式与 get() 一致
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        hit, value = self.read_cache.lookup(descriptor.name)
+        if hit:
+            return value
+        value = descriptor.decode(self._read_descriptor_words(descriptor))
+        self.read_cache.store(descriptor.name, value)
+        return value
+
+    def _read_descriptor_words(self, descriptor: RegisterDescriptor) -> List[int]:
+        """
+        读取寄存器描述符覆盖的全部原始寄存器值，不经过读缓存
+
+        Args:
+            descriptor: 寄存器描述符
+
+        Returns:
+            原始寄存器值
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        if not self._check_connect():
+            logger.error("读取寄存器 %s 失败: 连接已断开", descriptor.name)
+            raise ConnectionError("连接已断开")
+        try:
+            return self._read_register_batch(descriptor.address, descriptor.count)
+        except Exception as e:
+            logger.error("读取寄存器 %s 时出错: %s", descriptor.name, str(e))
+            raise ValueError(f"读取寄存器 {descriptor.name} 时出错: {str(e)}") from e
+
+    def read_many(self, register_names: Iterable[RegisterName | callable],
+                  verify: bool = False, use_cache: bool = True) -> Dict[RegisterName, Any]:
+        """
+        按读取计划批量读取任意一组寄存器
+
+        地址区间按 read_planner 合并为最少的批量读取，同一组寄存器的计划会被缓存；
+        命中读缓存的寄存器不参与读取
+
+        Args:
+            register_names: 寄存器名称或寄存器函数对象序列
+            verify: 是否在读取前发送一次同步探测确认连接
+            use_cache: 是否使用读缓存，为False时全部从设备读取并刷新缓存
+
+        Returns:
+            寄存器名称 -> 值，值的格式与 get() 一致
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        names = [self._resolve_name(name) for name in register_names]
+        cached = {}
+        if use_cache:
+            for register_name in names:
+                if self.read_cache.is_cacheable(register_name):
+                    hit, value = self.read_cache.lookup(register_name)
+                    if hit:
+                        cached[register_name] = value
+            if cached and len(cached) == len(set(names)):
+                return cached
+        plan = self.read_planner.plan(name for name in names if name not in cached)
+
+        if not self._check_connect(verify):
+            logger.error("批量读取寄存器失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            segment_words = [
+                self._read_register_batch(segment.start, segment.count)
+                for segment in plan.segments
+            ]
+        except Exception as e:
+            logger.error("批量读取寄存器时出错: %s", str(e))
+            raise ValueError(f"批量读取寄存器时出错: {str(e)}") from e
+
+        values = {
+            register_name: self._register_index[register_name].decode(words)
+            for register_name, words in plan.extract(segment_words).items()
+        }
+        for register_name, value in values.items():
+            self.read_cache.store(register_name, value)
+        logger.debug("成功批量读取 %d 个寄存器，共 %d 次请求，%d 个命中缓存",
+                     len(values), plan.request_count, len(cached))
+        values.update(cached)
+        return values
+
+    def read_state(self, include_setpoints: bool = False) -> HandState:
+        """
+        批量读取整手状态快照
+
+        实时状态块（FORCE_ACT/CURRENT/ERROR/TEMP，地址1582-1623）在一次事务中读取，
+        include_setpoints为True时再用一次事务读取设定值块（ANGLE_SET/POS_SET，地址1464-1487）
+
+        Args:
+            include_setpoints: 是否同时读取设定值块
+
+        Returns:
+            整手状态快照
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        if not self._check_connect():
+            logger.error("读取状态快照失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            state_words = self._read_register_batch(STATE_BLOCK_START, STATE_BLOCK_COUNT)
+            setpoint_words = None
+            if include_setpoints:
+                setpoint_words = self._read_register_batch(
+                    SETPOINT_BLOCK_START, SETPOINT_BLOCK_COUNT
+                )
+            state = HandState.from_blocks(
+                self.registers, state_words, setpoint_words, timestamp=time.time()
+            )
+        except Exception as e:
+            logger.error("读取状态快照时出错: %s", str(e))
+            raise ValueError(f"读取状态快照时出错: {str(e)}") from e
+
+        logger.debug("成功读取状态快照: %s", state)
+        return state
@@ -0,0 +1,192 @@
+"""
+RH56DFTP 批量写入模块，校验并编码一组寄存器的值，将地址连续的写入合并为最少的请求
+"""
+import logging
+from typing import Any, Dict, List, Literal, Sequence, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_base import TRANSPORT_ERRORS
+from .RH56DFTP_codec import (
+    encode_raw_value,
+    encode_register_words,
+    merge_write_runs,
+    validate_write
+)
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import DOF_COUNT, POSE_PREFIXES, group_register_names
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class BatchWriteMixin:
+    """
+    RH56DFTPClient 的单个与批量寄存器写入
+
+    依赖宿主类提供 client、read_cache、_register_index、_transact()、_resolve_name()
+    与 _check_connect()
+    """
+
+    def set_many(self, values: Dict[RegisterName | callable, Any], verify: bool = False) -> bool:
+        """
+        批量设置多个寄存器的值
+
+        先对全部值进行校验，任一值不合法时不写入任何寄存器；
+        值所在地址连续的寄存器合并为一次 write_registers（功能码16）请求，单独的寄存器与 set() 一样
+        用 write_register（功能码6）写入起始地址；short寄存器的占位字不写入，见 encode_register_words()
+
+        Args:
+            values: 寄存器名称或寄存器函数对象 -> 要设置的值
+            verify: 是否在写入前发送一次同步探测确认连接
+
+        Returns:
+            全部写入是否成功
+        """
+        resolved = {self._resolve_name(name): value for name, value in values.items()}
+        logger.debug("开始批量设置寄存器: %s", resolved)
+
+        if not self._check_connect(verify):
+            logger.error("批量设置寄存器失败: 连接已断开")
+            return False
+
+        # 批量校验并编码
+        items = []
+        for register_name, value in resolved.items():
+            descriptor = self._register_index.get(register_name)
+            if descriptor is None:
+                logger.error("批量设置寄存器失败: 寄存器 %s 不存在", register_name)
+                return False
+            register = descriptor.register
+            reason = validate_write(register, value)
+            if reason:
+                logger.error("批量设置寄存器失败: 寄存器 %s %s", register_name, reason)
+                return False
+            try:
+                items.append((descriptor.address, encode_register_words(register, value)))
+            except (ValueError, TypeError) as e:
+                logger.error("批量设置寄存器失败: 寄存器 %s 编码出错: %s", register_name, str(e))
+                return False
+
+        if self._write_runs(merge_write_runs(items)):
+            self.read_cache.written(resolved)
+            return True
+        self.read_cache.invalidate(resolved)
+        return False
+
+    def set_pose(self, values: Sequence[int], mode: Literal["angle", "pos"] = "angle",
+                 verify: bool = False) -> bool:
+        """
+        一次性设置六个自由度的角度或位置设定值
+
+        Args:
+            values: 六个自由度的设定值，按 ANGLE_SET(0..5) 或 POS_SET(0..5) 顺序
+            mode: "angle" 写入 ANGLE_SET，"pos" 写入 POS_SET
+            verify: 是否在写入前发送一次同步探测确认连接
+
+        Returns:
+            全部写入是否成功
+
+        Raises:
+            ValueError: 当值的数量或模式不正确时抛出
+        """
+        if mode not in POSE_PREFIXES:
+            raise ValueError(f"无效的模式: {mode}")
+        if len(values) != DOF_COUNT:
+            raise ValueError(f"需要 {DOF_COUNT} 个设定值，实际为 {len(values)} 个")
+        names = group_register_names(POSE_PREFIXES[mode])
+        return self.set_many(dict(zip(names, values)), verify)
+
+    def _write_runs(self, runs: List[Tuple[int, List[int]]]) -> bool:
+        """
+        依次执行合并后的连续写入段，只有一个字的写入段使用 write_register，与 set() 的请求相同
+
+        Args:
+            runs: (起始地址, 寄存器字列表) 写入段
+
+        Returns:
+            全部写入是否成功
+        """
+        try:
+            for start_address, words in runs:
+                logger.debug("批量写入: 起始地址=%d, 数量=%d, 值=%s",
+                             start_address, len(words), words)
+                if len(words) == 1:
+                    response = self._transact(
+                        self.client.write_register,
+                        address=start_address,
+                        value=words[0]
+                    )
+                else:
+                    response = self._transact(
+                        self.client.write_registers,
+                        address=start_address,
+                        values=words
+                    )
+                if response.isError():
+                    logger.error("批量写入失败: 起始地址=%d, %s", start_address, response)
+                    return False
+        except TRANSPORT_ERRORS as e:
+            logger.error("批量写入时发生连接错误: %s", str(e))
+            return False
+        logger.debug("成功批量写入 %d 段寄存器", len(runs))
+        return True
+
+    def _write_register(self, register: Register_FTP, value: Any) -> bool:
+        """
+        执行寄存器写入操作
+        
+        Args:
+            register: 寄存器对象
+            value: 要写入的值
+            
+        Returns:
+            写入是否成功
+        """
+        success = False
+
+        try:
+            # 处理负数，转换为对应的无符号值
+            write_value = encode_raw_value(value)
+
+            # 单个地址写入
+            if isinstance(register.address, int):
+                logger.debug("写入单个地址寄存器 %s，地址: %d, 值: %s, 转换后值: %d",
+                            register.name, register.address, value, write_value)
+                response = self._transact(
+                    self.client.write_register,
+                    address=register.address,
+                    value=write_value
+                )
+                if not response.isError():
+                    logger.debug("成功设置寄存器 %s: 值=%s, 地址=%d",
+                                register.name, value, register.address)
+                    success = True
+                else:
+                    logger.error("设置寄存器 %s 失败: %s", register.name, response)
+            # 地址范围写入
+            elif isinstance(register.address, tuple) and len(register.address) == 2:
+                start_address = register.address[0]
+                logger.debug("写入地址范围寄存器 %s，起始地址: %d, 值: %s, 转换后值: %d",
+                            register.name, start_address, value, write_value)
+
+                response = self._transact(
+                    self.client.write_register,
+                    address=start_address,
+                    value=write_value
+                )
+                if not response.isError():
+                    logger.debug("成功设置寄存器 %s: 值=%s, 起始地址=%d",
+                                register.name, value, start_address)
+                    success = True
+                else:
+                    logger.error("设置寄存器 %s 失败: %s", register.name, response)
+            # 无效地址格式
+            else:
+                logger.error("设置寄存器 %s 失败: 无效的地址格式 %s",
+                            register.name, register.address)
+        except (ValueError, TypeError) as e:
+            logger.error("设置寄存器 %s 时出错: %s", register.name, str(e))
+        except TRANSPORT_ERRORS as e:
+            logger.error("设置寄存器 %s 时发生连接错误: %s", register.name, str(e))
+
+        return success
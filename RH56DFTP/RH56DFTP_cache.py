@@ -0,0 +1,174 @@
+"""
+RH56DFTP 读缓存模块，按寄存器类别的有效期（TTL）缓存读取结果
+
+寄存器分为四类：
+- persistent: 掉电保存的配置寄存器（is_persistent），默认缓存到写入或失效为止
+- setpoint: 运动设定值（ANGLE_SET、POS_SET），虽掉电保存但会被网关、其他进程或轨迹播放改写，默认不缓存
+- command: 非持久的可写寄存器（CLEAR_ERROR、SAVE 等触发类寄存器），设备会自行复位，默认不缓存
+- live: 只读的实时传感器寄存器，从不缓存
+"""
+import math
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+
+# 寄存器类别
+PERSISTENT_CLASS = "persistent"
+SETPOINT_CLASS = "setpoint"
+COMMAND_CLASS = "command"
+LIVE_CLASS = "live"
+# 各类别的默认有效期（秒），math.inf 表示缓存到写入或失效为止，0表示不缓存
+DEFAULT_CACHE_TTL: Dict[str, float] = {
+    PERSISTENT_CLASS: math.inf,
+    SETPOINT_CLASS: 0.0,
+    COMMAND_CLASS: 0.0,
+    LIVE_CLASS: 0.0
+}
+# 运动设定值寄存器组前缀
+SETPOINT_PREFIXES = ("ANGLE_SET", "POS_SET")
+# 写入后会改变其他寄存器的值、需要清空整个缓存的寄存器
+INVALIDATE_ALL_ON_WRITE = ("RESET_PARA",)
+
+
+def register_cache_class(register: Register_FTP) -> str:
+    """
+    获取寄存器的缓存类别
+
+    Args:
+        register: 寄存器对象
+
+    Returns:
+        "persistent"、"setpoint"、"command" 或 "live"
+    """
+    if register.access_type == "read-only":
+        return LIVE_CLASS
+    if register.name.startswith(SETPOINT_PREFIXES):
+        return SETPOINT_CLASS
+    if register.is_persistent:
+        return PERSISTENT_CLASS
+    return COMMAND_CLASS
+
+
+class RegisterCache:
+    """
+    线程安全的寄存器读缓存，以寄存器名称为键
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 ttl: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            registers: 寄存器对象字典
+            ttl: 覆盖默认值的类别有效期（秒），如 {"command": 0.5}；live 类别始终不缓存
+        """
+        self.classes: Dict[RegisterName, str] = {
+            name: register_cache_class(register) for name, register in registers.items()
+        }
+        self.ttl: Dict[str, float] = dict(DEFAULT_CACHE_TTL, **(ttl or {}))
+        self.ttl[LIVE_CLASS] = 0.0
+        self._entries: Dict[RegisterName, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[weakref.WeakMethod] = []
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, register_name: RegisterName) -> Tuple[bool, Any]:
+        """
+        查找缓存
+
+        Args:
+            register_name: 寄存器名称
+
+        Returns:
+            (是否命中, 缓存的值)
+        """
+        with self._lock:
+            entry = self._entries.get(register_name)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at == math.inf or time.monotonic() < expires_at:
+                    self.hits += 1
+                    return True, value
+                del self._entries[register_name]
+            self.misses += 1
+            return False, None
+
+    def store(self, register_name: RegisterName, value: Any) -> None:
+        """
+        写入缓存，所属类别不缓存时不做任何操作
+
+        Args:
+            register_name: 寄存器名称
+            value: 读取或成功写入的值
+        """
+        ttl = self.ttl.get(self.classes.get(register_name, LIVE_CLASS), 0.0)
+        if ttl <= 0:
+            return
+        expires_at = math.inf if ttl == math.inf else time.monotonic() + ttl
+        with self._lock:
+            self._entries[register_name] = (value, expires_at)
+
+    def written(self, values: Dict[RegisterName, Any]) -> None:
+        """
+        写入成功后更新缓存
+
+        Args:
+            values: 寄存器名称 -> 写入的值
+        """
+        if not values.keys().isdisjoint(INVALIDATE_ALL_ON_WRITE):
+            self.invalidate()
+            return
+        for register_name, value in values.items():
+            self.store(register_name, value)
+
+    def invalidate(self, register_names: Optional[Iterable[RegisterName]] = None) -> None:
+        """
+        使缓存失效
+
+        Args:
+            register_names: 要失效的寄存器，默认为全部
+        """
+        if register_names is not None:
+            register_names = list(register_names)
+        with self._lock:
+            if register_names is None:
+                self._entries.clear()
+            else:
+                for register_name in register_names:
+                    self._entries.pop(register_name, None)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            callback = listener()
+            if callback is not None:
+                callback(register_names)
+
+    def subscribe(self, callback: Callable[[Optional[List[RegisterName]]], None]) -> None:
+        """
+        注册失效回调，缓存失效（写入失败、重连、RESET_PARA 等）时调用，用于同步其他保存设备状态的对象
+
+        Args:
+            callback: 绑定方法，以失效的寄存器名称列表调用，全部失效时为None；
+                以弱引用保存，所属对象被回收后自动失效
+        """
+        with self._lock:
+            self._listeners = [listener for listener in self._listeners if listener() is not None]
+            self._listeners.append(weakref.WeakMethod(callback))
+
+    def is_cacheable(self, register_name: RegisterName) -> bool:
+        """
+        寄存器所属类别是否会被缓存
+
+        Args:
+            register_name: 寄存器名称
+
+        Returns:
+            是否可缓存
+        """
+        return self.ttl.get(self.classes.get(register_name, LIVE_CLASS), 0.0) > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,201 @@
+"""
+RH56DFTP 寄存器编解码模块，集中处理寄存器地址跨度与原始值的转换
+"""
+import bisect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+
+# Modbus 单次读取保持寄存器的最大数量
+MAX_COUNT_PER_READ = 125
+# Modbus 功能码16单次写入的最大寄存器数量
+MAX_COUNT_PER_WRITE = 123
+
+
+def register_span(register: Register_FTP) -> Tuple[int, int]:
+    """
+    获取寄存器占用的起始地址与寄存器数量
+
+    Args:
+        register: 寄存器对象
+
+    Returns:
+        (起始地址, 数量)
+
+    Raises:
+        ValueError: 当地址格式无效时抛出
+    """
+    if isinstance(register.address, int):
+        return register.address, 1
+    if isinstance(register.address, tuple) and len(register.address) == 2:
+        start_address, end_address = register.address
+        return start_address, end_address - start_address + 1
+    raise ValueError(f"无效的地址格式: {register.address}")
+
+
+class AddressIntervals:
+    """
+    按地址查找寄存器标签的区间表
+
+    寄存器区间按起始地址排序后二分查找，构建开销与寄存器数量成正比，不需要为每个地址建立字典项
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 label: Callable[[RegisterName, Register_FTP], Any], default: Any = None):
+        """
+        Args:
+            registers: 寄存器对象字典
+            label: (寄存器名称, 寄存器对象) -> 标签
+            default: 地址不属于任何寄存器时返回的标签
+        """
+        intervals = sorted(
+            register_span(register) + (label(register_name, register),)
+            for register_name, register in registers.items()
+        )
+        self._starts = [start_address for start_address, _, _ in intervals]
+        self._ends = [start_address + count for start_address, count, _ in intervals]
+        self._labels = [item_label for _, _, item_label in intervals]
+        self.default = default
+
+    def lookup(self, address: int) -> Any:
+        """
+        查找地址所属寄存器的标签
+
+        Args:
+            address: 寄存器地址
+
+        Returns:
+            标签，地址不属于任何寄存器时返回 default
+        """
+        index = bisect.bisect_right(self._starts, address) - 1
+        if index >= 0 and address < self._ends[index]:
+            return self._labels[index]
+        return self.default
+
+
+def decode_raw_value(register: Register_FTP, raw_value: int) -> int:
+    """
+    处理原始寄存器值，根据数据类型转换
+
+    Args:
+        register: 寄存器对象
+        raw_value: 16位原始寄存器值
+
+    Returns:
+        转换后的值
+    """
+    if register.data_type == "uint8":
+        # uint8类型，只取低8位
+        return raw_value & 0xFF
+    if register.data_type == "short":
+        # short类型，处理16位有符号值
+        return raw_value - 65536 if raw_value > 32767 else raw_value
+    return raw_value
+
+
+def encode_raw_value(value: Any) -> int:
+    """
+    将要写入的值转换为16位无符号寄存器值
+
+    Args:
+        value: 要写入的值，负数按16位补码处理
+
+    Returns:
+        16位无符号寄存器值
+
+    Raises:
+        ValueError: 当值无法转换为整数时抛出
+        TypeError: 当值类型无法转换为整数时抛出
+    """
+    write_value = int(value)
+    # 如果是负数，转换为对应的无符号16位整数
+    if write_value < 0:
+        write_value = 65536 + write_value
+    return write_value
+
+
+def validate_write(register: Register_FTP, value: Any) -> Optional[str]:
+    """
+    检查寄存器是否可写以及写入值是否在范围内
+
+    Args:
+        register: 寄存器对象
+        value: 要写入的值
+
+    Returns:
+        校验失败的原因，校验通过时返回None
+    """
+    if register.access_type == "read-only":
+        return "寄存器是只读的"
+    if isinstance(register.value_range, (tuple, list)) and len(register.value_range) == 2:
+        min_val, max_val = register.value_range
+        if not min_val <= value <= max_val:
+            return f"值 {value} 超出范围 [{min_val}, {max_val}]"
+    return None
+
+
+def encode_register_words(register: Register_FTP, value: Any) -> List[int]:
+    """
+    将写入值编码为写入时需要发送的16位字
+
+    双地址short寄存器只写值所在的起始地址，不写第二个地址的占位字：手册没有定义占位字被写入时
+    固件的行为，单寄存器写入（set()）从来只写起始地址，批量写入与其保持一致，两条路径触达的设备地址完全相同。
+    因此相邻的short寄存器之间隔着占位字，merge_write_runs() 不会把它们合并为同一个写入段
+
+    Args:
+        register: 寄存器对象
+        value: 要写入的值
+
+    Returns:
+        从起始地址开始的寄存器字列表
+
+    Raises:
+        ValueError: 当寄存器不是单值寄存器时抛出
+    """
+    _, count = register_span(register)
+    if count == 1 or (count == 2 and register.data_type == "short"):
+        return [encode_raw_value(value)]
+    raise ValueError(f"寄存器 {register.name} 不是单值寄存器，无法编码写入")
+
+
+def merge_write_runs(items: Iterable[Tuple[int, List[int]]],
+                     max_count: int = MAX_COUNT_PER_WRITE) -> List[Tuple[int, List[int]]]:
+    """
+    将多个寄存器写入合并为最少的连续写入段
+
+    Args:
+        items: (起始地址, 寄存器字列表) 序列
+        max_count: 单次写入的最大寄存器数量
+
+    Returns:
+        按地址排序的 (起始地址, 寄存器字列表) 写入段，每段可用一次 write_registers 完成
+    """
+    runs: List[Tuple[int, List[int]]] = []
+    for start_address, words in sorted(items, key=lambda item: item[0]):
+        if runs:
+            run_start, run_words = runs[-1]
+            if (run_start + len(run_words) == start_address
+                    and len(run_words) + len(words) <= max_count):
+                run_words.extend(words)
+                continue
+        runs.append((start_address, list(words)))
+    return runs
+
+
+def decode_register_words(register: Register_FTP, words: Sequence[int]) -> Any:
+    """
+    将寄存器占用的全部原始字解码为 get() 的返回格式
+
+    单地址寄存器与双地址short寄存器返回单个值，其余范围寄存器返回原始值列表
+
+    Args:
+        register: 寄存器对象
+        words: 从起始地址开始的原始寄存器值
+
+    Returns:
+        解码后的值
+    """
+    if len(words) == 1 or (register.data_type == "short" and len(words) == 2):
+        return decode_raw_value(register, words[0])
+    return list(words)
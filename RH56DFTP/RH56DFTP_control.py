@@ -0,0 +1,305 @@
+"""
+RH56DFTP 固定频率控制循环模块
+
+每个周期读取一次整手状态快照，调用用户回调，并将回调返回的指令批量写入；
+周期按绝对截止时间调度，不会因单次耗时波动而累积漂移
+"""
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import HandState
+from .RH56DFTP_TCP import RH56DFTPClient
+from .RH56DFTP_writebuffer import WriteBuffer
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 截止时间前改为忙等的时间（秒），弥补 time.sleep 的唤醒误差
+DEFAULT_SPIN_TIME = 0.0002
+
+
+@dataclass(frozen=True)
+class ControlTick:
+    """
+    传给回调的周期信息
+    """
+    index: int
+    """周期序号，从0开始；跳过的周期不分配序号"""
+
+    deadline: float
+    """本周期的计划开始时间（time.monotonic()）"""
+
+    period: float
+    """控制周期（秒）"""
+
+
+class _RunningStats:
+    """在线统计均值、标准差与极值（Welford算法）"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """加入一个样本"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """总体标准差，样本少于两个时为0"""
+        return math.sqrt(self._m2 / self.count) if self.count > 1 else 0.0
+
+
+@dataclass(frozen=True)
+class LoopStats:
+    """
+    控制循环统计，时间单位均为秒
+    """
+    cycles: int
+    """已执行的周期数"""
+
+    overruns: int
+    """超时的周期数（周期结束时已过下一截止时间）"""
+
+    skipped: int
+    """因超时而跳过的周期数"""
+
+    errors: int
+    """读取、回调或写入失败的周期数"""
+
+    cycle_mean: float
+    """每周期的工作耗时（读状态、回调、写入）均值"""
+
+    cycle_max: float
+    """每周期的工作耗时最大值"""
+
+    jitter_mean: float
+    """实际开始时间相对截止时间的延迟均值"""
+
+    jitter_std: float
+    """开始延迟的标准差"""
+
+    jitter_max: float
+    """开始延迟的最大值"""
+
+    @property
+    def overrun_ratio(self) -> float:
+        """超时周期占比"""
+        return self.overruns / self.cycles if self.cycles else 0.0
+
+
+class ControlLoop:
+    """
+    固定频率控制循环
+
+    回调签名为 callback(state: HandState, tick: ControlTick)，返回 {寄存器: 值} 字典时
+    通过 set_many() 写入（地址连续的寄存器合并为一次请求），返回None时本周期不写入；
+    指定 write_buffer 时指令先进入写缓冲，与上次写入相同的值被丢弃，周期结束时统一刷新
+
+    Example::
+
+        def track(state, tick):
+            return {"ANGLE_SET(0)": 1000 if state.force_act[0] < 300 else 800}
+
+        loop = ControlLoop(client, track, rate_hz=200)
+        loop.run(duration=10)
+        print(loop.stats())
+    """
+
+    def __init__(self, client: RH56DFTPClient,
+                 callback: Callable[[HandState, ControlTick], Optional[Dict[RegisterName, Any]]],
+                 rate_hz: float, include_setpoints: bool = False,
+                 spin_time: float = DEFAULT_SPIN_TIME,
+                 write_buffer: Optional[WriteBuffer] = None):
+        """
+        Args:
+            client: 已创建的客户端
+            callback: 每周期调用的回调
+            rate_hz: 控制频率（Hz）
+            include_setpoints: 状态快照是否同时读取设定值块
+            spin_time: 截止时间前忙等的时间（秒），为0时只使用 sleep
+            write_buffer: 写缓冲，为None时每周期直接通过 set_many() 写入
+
+        Raises:
+            ValueError: 当频率不是正数时抛出
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"控制频率必须为正数: {rate_hz}")
+        self.client = client
+        self.callback = callback
+        self.period = 1.0 / rate_hz
+        self.include_setpoints = include_setpoints
+        self.spin_time = spin_time
+        self.write_buffer = write_buffer
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[Exception] = None
+        """使循环停止的回调异常，正常结束时为None"""
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """清空统计"""
+        self._cycle = _RunningStats()
+        self._jitter = _RunningStats()
+        self._overruns = 0
+        self._skipped = 0
+        self._errors = 0
+
+    def stats(self) -> LoopStats:
+        """
+        获取统计快照
+
+        Returns:
+            控制循环统计
+        """
+        return LoopStats(
+            cycles=self._cycle.count,
+            overruns=self._overruns,
+            skipped=self._skipped,
+            errors=self._errors,
+            cycle_mean=self._cycle.mean,
+            cycle_max=max(self._cycle.max, 0.0),
+            jitter_mean=self._jitter.mean,
+            jitter_std=self._jitter.std,
+            jitter_max=max(self._jitter.max, 0.0)
+        )
+
+    def _wait_until(self, deadline: float) -> bool:
+        """
+        等待到截止时间
+
+        Returns:
+            是否在等待期间收到停止请求
+        """
+        delay = deadline - time.monotonic() - self.spin_time
+        if delay > 0 and self._stop_event.wait(delay):
+            return True
+        while time.monotonic() < deadline:
+            pass
+        return self._stop_event.is_set()
+
+    def run(self, duration: Optional[float] = None, cycles: Optional[int] = None) -> LoopStats:
+        """
+        在当前线程中运行控制循环，直到达到时长或周期数，或调用 stop()
+
+        回调抛出的异常会记录日志、停止循环并向上抛出；读取或写入失败只计入 errors，循环继续
+
+        Args:
+            duration: 运行时长（秒），为None时不限
+            cycles: 运行周期数，为None时不限
+
+        Returns:
+            控制循环统计
+
+        Raises:
+            Exception: 回调抛出的异常
+        """
+        self._stop_event.clear()
+        stats = self._run(duration, cycles)
+        if self.error is not None:
+            raise self.error
+        return stats
+
+    def _write(self, commands: Dict[RegisterName, Any]) -> bool:
+        """写入一个周期的指令"""
+        if self.write_buffer is None:
+            return self.client.set_many(commands)
+        accepted = self.write_buffer.update(commands)
+        return self.write_buffer.flush() and accepted
+
+    def _run(self, duration: Optional[float], cycles: Optional[int]) -> LoopStats:
+        """控制循环主体"""
+        period = self.period
+        start = time.monotonic()
+        end = start + duration if duration is not None else math.inf
+        deadline = start
+        index = 0
+        self.error = None
+
+        while (cycles is None or index < cycles) and deadline < end:
+            if self._wait_until(deadline):
+                break
+            begin = time.monotonic()
+            self._jitter.add(begin - deadline)
+
+            try:
+                state = self.client.read_state(self.include_setpoints)
+            except (ConnectionError, ValueError) as e:
+                self._errors += 1
+                logger.warning("控制周期 %d 读取状态失败: %s", index, str(e))
+            else:
+                try:
+                    commands = self.callback(state, ControlTick(index, deadline, period))
+                except Exception as e:  # pylint: disable=broad-except
+                    # 回调出错时不再写入任何指令，停止循环，后台线程也不会无声退出
+                    self._errors += 1
+                    self.error = e
+                    self._stop_event.set()
+                    logger.exception("控制周期 %d 回调出错，控制循环已停止", index)
+                    break
+                if commands and not self._write(commands):
+                    self._errors += 1
+                    logger.warning("控制周期 %d 写入指令失败", index)
+
+            finished = time.monotonic()
+            self._cycle.add(finished - begin)
+            index += 1
+
+            # 保持相位不漂移；超时则跳过已错过的周期
+            deadline += period
+            if finished > deadline:
+                self._overruns += 1
+                missed = int((finished - deadline) // period) + 1
+                self._skipped += missed
+                deadline += missed * period
+
+        return self.stats()
+
+    def start(self, duration: Optional[float] = None) -> None:
+        """
+        在后台线程中运行控制循环，已启动时不做任何操作
+
+        回调抛出异常时循环记录日志后停止，异常保存在 error 属性中
+
+        Args:
+            duration: 运行时长（秒），为None时运行到 stop()
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(duration, None), name="RH56DFTP-control", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        停止控制循环
+
+        Args:
+            timeout: 等待后台线程退出的最长时间（秒）
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "ControlLoop":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
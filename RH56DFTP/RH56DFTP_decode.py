@@ -0,0 +1,206 @@
+"""
+RH56DFTP NumPy解码模块，将寄存器原始数据向量化解码为带形状与数据类型的数组
+
+需要安装可选依赖 numpy: pip install plusml-rh56dftp[numpy]
+
+寄存器表中每个short值占用两个地址，值位于第一个地址，第二个地址为占位字；
+触觉寄存器的地址跨度因此是其行列数的两倍，例如 3*3 的指端数据占用18个地址
+"""
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import register_span
+
+# 从寄存器名称末尾解析行列数，如 TACTILE_PALM_8x14
+_SHAPE_PATTERN = re.compile(r"_(\d+)x(\d+)$")
+
+
+def _require_numpy() -> None:
+    """检查numpy是否可用"""
+    if np is None:
+        raise ImportError("NumPy解码需要安装numpy: pip install plusml-rh56dftp[numpy]")
+
+
+def register_shape(register: Register_FTP) -> Optional[Tuple[int, int]]:
+    """
+    从寄存器名称解析二维形状
+
+    Args:
+        register: 寄存器对象
+
+    Returns:
+        (行数, 列数)，名称中不含形状时返回None
+    """
+    match = _SHAPE_PATTERN.search(register.name)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def register_dtype(register: Register_FTP) -> "np.dtype":
+    """
+    获取寄存器数据类型对应的NumPy数据类型
+
+    Args:
+        register: 寄存器对象
+
+    Returns:
+        NumPy数据类型
+    """
+    _require_numpy()
+    if register.data_type == "short":
+        return np.dtype(np.int16)
+    if register.data_type == "uint8":
+        return np.dtype(np.uint8)
+    return np.dtype(np.uint16)
+
+
+def _value_words(register: Register_FTP, words: "np.ndarray") -> "np.ndarray":
+    """去掉short寄存器的占位字，只保留值所在的字"""
+    if register.data_type == "short" and len(words) % 2 == 0:
+        return words[0::2]
+    return words
+
+
+def decode_array(register: Register_FTP, words: Sequence[int]) -> "np.ndarray":
+    """
+    将寄存器的原始字解码为NumPy数组
+
+    Args:
+        register: 寄存器对象
+        words: 从起始地址开始的原始寄存器值
+
+    Returns:
+        名称中带形状的寄存器返回二维数组，其余返回一维数组
+
+    Raises:
+        ValueError: 当数据长度与寄存器形状不匹配时抛出
+    """
+    _require_numpy()
+    raw = _value_words(register, np.asarray(words, dtype=np.uint16))
+    dtype = register_dtype(register)
+    if dtype == np.uint8:
+        values = (raw & 0xFF).astype(np.uint8)
+    else:
+        values = raw.view(dtype)
+
+    shape = register_shape(register)
+    if shape is None:
+        return values
+    if values.size != shape[0] * shape[1]:
+        raise ValueError(
+            f"寄存器 {register.name} 的数据长度 {values.size} 与形状 {shape} 不匹配"
+        )
+    return values.reshape(shape)
+
+
+class TactileFrame:
+    """
+    全手触觉帧
+
+    data 为全部触觉点按地址顺序排列的一维int16数组（全手张量），
+    pads 中每个触觉区域的二维数组都是 data 的视图，不复制数据
+    """
+
+    def __init__(self, data: "np.ndarray", pads: Dict[RegisterName, "np.ndarray"]):
+        self.data = data
+        self.pads = pads
+
+    def __getitem__(self, register_name: RegisterName) -> "np.ndarray":
+        return self.pads[register_name]
+
+    def __iter__(self):
+        return iter(self.pads)
+
+    def __len__(self) -> int:
+        return len(self.pads)
+
+
+class TactileLayout:
+    """
+    触觉帧布局，由寄存器元数据一次性计算，之后每帧只做向量化切片
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP]):
+        """
+        Args:
+            registers: 寄存器对象字典，使用其中所有 TACTILE_ 开头的寄存器
+
+        Raises:
+            ValueError: 当触觉寄存器的地址或形状不符合布局要求时抛出
+        """
+        tactile = sorted(
+            (register for name, register in registers.items() if name.startswith("TACTILE_")),
+            key=lambda register: register_span(register)[0]
+        )
+        if not tactile:
+            raise ValueError("寄存器表中没有触觉寄存器")
+
+        self.start = register_span(tactile[0])[0]
+        last_start, last_count = register_span(tactile[-1])
+        self.count = last_start + last_count - self.start
+        """整帧占用的地址数量"""
+
+        self.names: List[RegisterName] = []
+        self._slices: List[Tuple[RegisterName, int, Tuple[int, int]]] = []
+        for register in tactile:
+            start_address, count = register_span(register)
+            shape = register_shape(register)
+            offset = start_address - self.start
+            if shape is None or offset % 2 or count != 2 * shape[0] * shape[1]:
+                raise ValueError(f"触觉寄存器 {register.name} 不符合帧布局")
+            self.names.append(register.name)
+            self._slices.append((register.name, offset // 2, shape))
+        self.size = self.count // 2
+        """整帧的触觉点数量"""
+
+    @property
+    def slices(self) -> List[Tuple[RegisterName, int, Tuple[int, int]]]:
+        """各触觉区域的 (名称, 在整帧触觉点中的偏移, 形状)，按地址排序"""
+        return list(self._slices)
+
+    def decode(self, words: Sequence[int]) -> TactileFrame:
+        """
+        解码整帧原始数据
+
+        Args:
+            words: 从帧起始地址开始的全部原始寄存器值
+
+        Returns:
+            触觉帧
+
+        Raises:
+            ValueError: 当数据长度与布局不匹配时抛出
+        """
+        _require_numpy()
+        raw = np.asarray(words, dtype=np.uint16)
+        if raw.size != self.count:
+            raise ValueError(f"触觉帧数据长度 {raw.size} 与布局长度 {self.count} 不匹配")
+        data = np.ascontiguousarray(raw[0::2]).view(np.int16)
+        pads = {
+            name: data[offset:offset + shape[0] * shape[1]].reshape(shape)
+            for name, offset, shape in self._slices
+        }
+        return TactileFrame(data, pads)
+
+    def decode_pads(self, frame: Dict[RegisterName, Sequence[int]]) -> TactileFrame:
+        """
+        解码 read_tactile_frame() 返回的按寄存器拆分的原始数据
+
+        Args:
+            frame: 触觉寄存器名称 -> 原始寄存器值列表
+
+        Returns:
+            触觉帧
+        """
+        words: List[int] = []
+        for name in self.names:
+            words.extend(frame[name])
+        return self.decode(words)
@@ -0,0 +1,760 @@
+"""
+RH56DFTP 网关模块，由一个本地进程独占设备的Modbus连接，其他程序通过Unix域套接字访问
+
+网关的调度线程是唯一访问设备的线程：
+- 写入按优先级（数值越小越优先）逐个执行，先于读取
+- 同一时间窗口内来自不同客户端的读取合并执行：寄存器读取取并集后通过 read_many() 按读取计划
+  合并为最少的事务，状态快照与触觉帧读取各只执行一次，结果分发给全部请求者
+
+消息格式为 4字节大端长度 + UTF-8 JSON
+"""
+import argparse
+import heapq
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Set
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_base import RH56DFTPBase
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import DOF_COUNT, POSE_PREFIXES, HandState, group_register_names
+from .RH56DFTP_TCP import RH56DFTPClient
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 默认套接字路径
+DEFAULT_GATEWAY_SOCKET = "/tmp/rh56dftp.sock"
+# 默认写入优先级，数值越小越优先
+DEFAULT_WRITE_PRIORITY = 10
+# 默认读取合并窗口（秒）：第一个读取请求到达后等待其他读取请求的时间
+DEFAULT_MERGE_WINDOW = 0.001
+# 默认的单个请求等待时间（秒），小于网关客户端默认的套接字超时，客户端能收到超时应答
+DEFAULT_REQUEST_TIMEOUT = 3.0
+# 消息长度字段
+_LENGTH = struct.Struct(">I")
+# 单条消息的最大长度
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+# 允许跨进程传递的异常类型
+_ERROR_TYPES = {"ConnectionError": ConnectionError, "ValueError": ValueError}
+
+
+def _validate_args(op: Any, args: Any) -> Optional[str]:
+    """
+    检查请求参数的格式
+
+    Args:
+        op: 请求名称
+        args: 请求参数
+
+    Returns:
+        参数无效时返回原因，有效时返回None
+    """
+    if not isinstance(args, dict):
+        return "请求参数必须是对象"
+    priority = args.get("priority", DEFAULT_WRITE_PRIORITY)
+    if op in ("set", "set_many") and (not isinstance(priority, int) or isinstance(priority, bool)):
+        return "priority 必须是整数"
+    if op == "set" and (not isinstance(args.get("name"), str) or "value" not in args):
+        return "set 请求需要字符串 name 与 value"
+    if op == "set_many":
+        values = args.get("values")
+        if not isinstance(values, dict) or not all(isinstance(name, str) for name in values):
+            return "set_many 请求需要以寄存器名称为键的 values 对象"
+    if op == "read_many":
+        names = args.get("names")
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            return "read_many 请求需要字符串列表 names"
+    return None
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """
+    发送一条消息
+
+    Args:
+        sock: 套接字
+        message: 可JSON序列化的字典
+    """
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """读取指定字节数，对端关闭时返回None"""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    接收一条消息
+
+    Args:
+        sock: 套接字
+
+    Returns:
+        消息字典，对端关闭时返回None
+
+    Raises:
+        ValueError: 当消息过长时抛出
+    """
+    header = _recv_exact(sock, _LENGTH.size)
+    if header is None:
+        return None
+    (size,) = _LENGTH.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ValueError(f"消息长度 {size} 超出上限")
+    body = _recv_exact(sock, size)
+    if body is None:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+
+class _Request:
+    """等待调度线程执行的请求"""
+
+    __slots__ = ("op", "args", "done", "result", "error")
+
+    def __init__(self, op: str, args: Dict[str, Any]):
+        self.op = op
+        self.args = args
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def finish(self, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """记录结果并唤醒等待的连接线程"""
+        self.result = result
+        self.error = error
+        self.done.set()
+
+
+@dataclass(frozen=True)
+class GatewayStats:
+    """
+    网关统计
+    """
+    requests: int
+    """收到的请求数"""
+
+    writes: int
+    """执行的写入请求数"""
+
+    read_requests: int
+    """收到的读取请求数"""
+
+    read_batches: int
+    """合并后实际执行的读取批次数"""
+
+    clients: int
+    """当前连接的客户端数"""
+
+
+class RH56DFTPGateway:
+    """
+    网关服务
+
+    Example::
+
+        client = RH56DFTPClient("192.168.11.210", 6000)
+        with RH56DFTPGateway(client, "/tmp/rh56dftp.sock"):
+            ...   # 其他进程使用 RH56DFTPGatewayClient("/tmp/rh56dftp.sock")
+    """
+
+    def __init__(self, client: RH56DFTPClient, path: str = DEFAULT_GATEWAY_SOCKET,
+                 merge_window: float = DEFAULT_MERGE_WINDOW,
+                 request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT):
+        """
+        Args:
+            client: 独占设备连接的客户端
+            path: Unix域套接字路径
+            merge_window: 读取合并窗口（秒），为0时不等待
+            request_timeout: 单个请求的最长等待时间（秒），超时的请求以 ConnectionError 应答，
+                为None时一直等待
+        """
+        self.client = client
+        self.path = path
+        self.merge_window = merge_window
+        self.request_timeout = request_timeout
+        self._cond = threading.Condition()
+        self._writes: List[Any] = []
+        self._reads: List[_Request] = []
+        self._order = itertools.count()
+        self._stop_event = threading.Event()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._threads: List[threading.Thread] = []
+        self._connections: Set[socket.socket] = set()
+        self._requests = 0
+        self._write_count = 0
+        self._read_requests = 0
+        self._read_batches = 0
+        self._clients = 0
+
+    def start(self) -> "RH56DFTPGateway":
+        """
+        开始监听并启动调度线程
+
+        Raises:
+            OSError: 当套接字路径已被另一个运行中的网关占用时抛出
+        """
+        self._remove_stale_socket()
+        gateway = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            """单个客户端连接，按顺序处理其请求"""
+
+            def handle(self) -> None:
+                gateway._serve_connection(self.request)  # pylint: disable=protected-access
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.path, Handler)
+        self._server.daemon_threads = True
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._dispatch_loop, name="RH56DFTP-gateway", daemon=True),
+            threading.Thread(target=self._server.serve_forever, name="RH56DFTP-gateway-accept",
+                             daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("网关已启动: %s -> %s:%s", self.path, self.client.host, self.client.port)
+        return self
+
+    def _remove_stale_socket(self) -> None:
+        """删除上次异常退出残留的套接字文件"""
+        if not os.path.exists(self.path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except OSError:
+            os.unlink(self.path)
+        else:
+            raise OSError(f"套接字 {self.path} 已被运行中的网关占用")
+        finally:
+            probe.close()
+
+    def stop(self) -> None:
+        """停止服务并删除套接字文件，未完成的请求以 ConnectionError 结束"""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        with self._cond:
+            for sock in self._connections:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            pending = [request for _, _, request in self._writes] + self._reads
+            self._writes, self._reads = [], []
+        for request in pending:
+            request.finish(error=ConnectionError("网关已停止"))
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        logger.info("网关已停止")
+
+    def stats(self) -> GatewayStats:
+        """
+        获取统计快照
+
+        Returns:
+            网关统计
+        """
+        with self._cond:
+            return GatewayStats(
+                requests=self._requests,
+                writes=self._write_count,
+                read_requests=self._read_requests,
+                read_batches=self._read_batches,
+                clients=self._clients
+            )
+
+    def _serve_connection(self, sock: socket.socket) -> None:
+        """处理一个客户端连接，直到对端关闭"""
+        with self._cond:
+            self._clients += 1
+            self._connections.add(sock)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    message = recv_message(sock)
+                except (OSError, ValueError) as e:
+                    logger.warning("网关读取客户端消息失败: %s", str(e))
+                    return
+                if message is None:
+                    return
+                response = self._handle(message)
+                try:
+                    send_message(sock, response)
+                except OSError as e:
+                    logger.warning("网关发送应答失败: %s", str(e))
+                    return
+        finally:
+            with self._cond:
+                self._clients -= 1
+                self._connections.discard(sock)
+
+    def _handle(self, message: Any) -> Dict[str, Any]:
+        """提交一个请求并等待调度线程执行完成"""
+        if not isinstance(message, dict):
+            return {"id": None, "ok": False, "type": "ValueError", "error": "消息必须是对象"}
+        request_id = message.get("id")
+        op = message.get("op")
+        args = message.get("args") or {}
+        request = _Request(op, args)
+        reason = _validate_args(op, args)
+        probe = False
+        with self._cond:
+            self._requests += 1
+            if reason is not None:
+                request.finish(error=ValueError(reason))
+            elif op in ("set", "set_many"):
+                priority = args.get("priority", DEFAULT_WRITE_PRIORITY)
+                heapq.heappush(self._writes, (priority, next(self._order), request))
+            elif op in ("read_many", "read_state", "read_tactile_frame"):
+                self._read_requests += 1
+                # 不存在的寄存器在合并前拒绝，避免影响同批次的其他请求
+                unknown = [
+                    name for name in args.get("names", []) if name not in self.client.registers
+                ]
+                if unknown:
+                    request.finish(error=ValueError(f"寄存器 {unknown[0]} 不存在"))
+                else:
+                    self._reads.append(request)
+            elif op == "ping":
+                # 带 verify 的探测需要访问设备，在锁外同步执行
+                probe = bool(args.get("verify"))
+                if not probe:
+                    request.finish(True)
+            else:
+                request.finish(error=ValueError(f"未知的请求: {op}"))
+            self._cond.notify_all()
+        if probe:
+            request.finish(self.client._check_connect(True))  # pylint: disable=protected-access
+        if not request.done.wait(self.request_timeout):
+            # 仍在队列中的请求直接撤回；已开始执行的再等待一个超时周期，之后不再阻塞客户端
+            if self._withdraw(request) or not request.done.wait(self.request_timeout):
+                logger.warning("网关请求 %s 等待超过 %.1f 秒，按超时应答", op, self.request_timeout)
+                return {"id": request_id, "ok": False, "type": "ConnectionError",
+                        "error": f"网关请求超时（{self.request_timeout} 秒）"}
+        if request.error is not None:
+            error_type = type(request.error).__name__
+            if error_type not in _ERROR_TYPES:
+                error_type = "ValueError"
+            return {"id": request_id, "ok": False, "type": error_type, "error": str(request.error)}
+        return {"id": request_id, "ok": True, "result": request.result}
+
+    def _withdraw(self, request: _Request) -> bool:
+        """
+        将尚未开始执行的请求移出队列
+
+        Returns:
+            是否已移出；请求已被调度线程取走时返回False，由调用方继续等待其完成
+        """
+        with self._cond:
+            if request in self._reads:
+                self._reads.remove(request)
+                return True
+            for index, (_, _, queued) in enumerate(self._writes):
+                if queued is request:
+                    self._writes.pop(index)
+                    heapq.heapify(self._writes)
+                    return True
+        return False
+
+    def _dispatch_loop(self) -> None:
+        """调度线程主体：写入按优先级逐个执行，读取按窗口合并执行"""
+        while True:
+            with self._cond:
+                while not self._writes and not self._reads and not self._stop_event.is_set():
+                    self._cond.wait()
+                if self._stop_event.is_set():
+                    return
+                if self._writes:
+                    _, _, request = heapq.heappop(self._writes)
+                    self._write_count += 1
+                else:
+                    request = None
+
+            if request is not None:
+                self._execute_write(request)
+                continue
+
+            if self.merge_window > 0:
+                time.sleep(self.merge_window)
+            with self._cond:
+                # 等待期间到达的写入先执行，读取留到下一轮继续合并
+                if self._writes:
+                    continue
+                reads, self._reads = self._reads, []
+                self._read_batches += 1
+            try:
+                self._execute_reads(reads)
+            except Exception as e:  # pylint: disable=broad-except
+                # 合并阶段的意外错误不能终止调度线程，否则所有客户端都会一直等待
+                logger.error("网关执行读取时出错: %s", str(e))
+                for request in reads:
+                    if not request.done.is_set():
+                        request.finish(error=e)
+
+    def _execute_write(self, request: _Request) -> None:
+        """执行一个写入请求"""
+        try:
+            if request.op == "set":
+                result = self.client.set(request.args["name"], request.args["value"])
+            else:
+                result = self.client.set_many(request.args["values"])
+            request.finish(result)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("网关执行写入时出错: %s", str(e))
+            request.finish(error=e)
+
+    def _execute_reads(self, reads: List[_Request]) -> None:
+        """合并执行一批读取请求"""
+        names = set()
+        include_setpoints = False
+        need_state = need_tactile = False
+        for request in reads:
+            if request.op == "read_many":
+                names.update(request.args["names"])
+            elif request.op == "read_state":
+                need_state = True
+                if request.args.get("include_setpoints", False):
+                    include_setpoints = True
+            else:
+                need_tactile = True
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        jobs = (
+            ("read_many", bool(names), lambda: self.client.read_many(sorted(names))),
+            ("read_state", need_state,
+             lambda: asdict(self.client.read_state(include_setpoints=include_setpoints))),
+            ("read_tactile_frame", need_tactile, self.client.read_tactile_frame)
+        )
+        for op, needed, job in jobs:
+            if not needed:
+                continue
+            try:
+                results[op] = job()
+            except Exception as e:  # pylint: disable=broad-except
+                errors[op] = e
+
+        for request in reads:
+            # 单个请求的分发失败只影响该请求，调度线程继续服务其他客户端
+            try:
+                if request.op in errors:
+                    request.finish(error=errors[request.op])
+                elif request.op == "read_many":
+                    values = results["read_many"]
+                    request.finish({name: values[name] for name in request.args["names"]})
+                elif (request.op == "read_state"
+                      and not request.args.get("include_setpoints", False)):
+                    state = dict(results["read_state"], angle_set=None, pos_set=None)
+                    request.finish(state)
+                else:
+                    request.finish(results[request.op])
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("网关分发读取结果时出错: %s", str(e))
+                request.finish(error=e)
+
+    def __enter__(self) -> "RH56DFTPGateway":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+class RH56DFTPGatewayClient(RH56DFTPBase):
+    """
+    网关客户端，接口与 RH56DFTPClient 的读写方法一致，可在多个线程中共用
+    """
+
+    def __init__(self, path: str = DEFAULT_GATEWAY_SOCKET, timeout: Optional[float] = 5.0,
+                 priority: int = DEFAULT_WRITE_PRIORITY):
+        """
+        Args:
+            path: 网关的Unix域套接字路径
+            timeout: 单次请求的超时时间（秒）
+            priority: 本客户端写入的默认优先级，数值越小越优先
+
+        Raises:
+            ConnectionError: 当无法连接网关时抛出
+        """
+        self.path = path
+        self.timeout = timeout
+        self.priority = priority
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._sock: Optional[socket.socket] = None
+        self.is_connected = False
+        if not self._connect():
+            raise ConnectionError(f"无法连接网关: {path}")
+
+    def _connect(self) -> bool:
+        """连接网关"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            logger.error("连接网关 %s 失败: %s", self.path, str(e))
+            sock.close()
+            return False
+        self._sock = sock
+        self.is_connected = True
+        return True
+
+    def _call(self, op: str, **args: Any) -> Any:
+        """
+        发送请求并等待应答
+
+        Raises:
+            ConnectionError: 当网关连接断开或设备连接断开时抛出
+            ValueError: 当请求执行失败时抛出
+        """
+        with self._lock:
+            if not self.is_connected and not self._connect():
+                raise ConnectionError("网关连接已断开")
+            request_id = next(self._ids)
+            try:
+                send_message(self._sock, {"id": request_id, "op": op, "args": args})
+                response = recv_message(self._sock)
+            except (OSError, ValueError) as e:
+                self._disconnect()
+                raise ConnectionError(f"网关通信失败: {str(e)}") from e
+            if response is None:
+                self._disconnect()
+                raise ConnectionError("网关已关闭连接")
+        if not response["ok"]:
+            raise _ERROR_TYPES.get(response["type"], ValueError)(response["error"])
+        return response["result"]
+
+    def _disconnect(self) -> None:
+        """关闭与网关的连接"""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self.is_connected = False
+
+    @staticmethod
+    def _name(register_name: RegisterName | callable) -> RegisterName:
+        """将寄存器函数对象解析为寄存器名称"""
+        return register_name.__name__ if callable(register_name) else register_name
+
+    def get(self, register_name: RegisterName | callable, verify: bool = False) -> Any:
+        """
+        获取指定寄存器的值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            verify: 是否在读取前经由网关向设备发送一次同步探测确认连接
+
+        Returns:
+            寄存器的当前值
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        register_name = self._name(register_name)
+        return self.read_many([register_name], verify)[register_name]
+
+    def read_many(self, register_names: Iterable[RegisterName | callable],
+                  verify: bool = False) -> Dict[RegisterName, Any]:
+        """
+        批量读取一组寄存器，网关与其他客户端的读取合并执行
+
+        Args:
+            register_names: 寄存器名称或寄存器函数对象序列
+            verify: 是否在读取前经由网关向设备发送一次同步探测确认连接
+
+        Returns:
+            寄存器名称 -> 值
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当寄存器不存在或读取失败时抛出
+        """
+        if verify and not self._check_connect(True):
+            logger.error("通过网关读取寄存器失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+        return self._call("read_many", names=[self._name(name) for name in register_names])
+
+    def read_state(self, include_setpoints: bool = False) -> HandState:
+        """
+        读取整手状态快照
+
+        Args:
+            include_setpoints: 是否同时读取设定值块
+
+        Returns:
+            整手状态快照
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        fields = self._call("read_state", include_setpoints=include_setpoints)
+        return HandState(**{
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in fields.items()
+        })
+
+    def read_tactile_frame(self) -> Dict[RegisterName, List[int]]:
+        """
+        读取整帧触觉数据
+
+        Returns:
+            触觉寄存器名称 -> 原始寄存器值列表
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        return self._call("read_tactile_frame")
+
+    def set(self, register_name: RegisterName | callable, value: Any,
+            verify: bool = False, priority: Optional[int] = None) -> bool:
+        """
+        设置指定寄存器的值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            value: 要设置的值
+            verify: 是否在写入前经由网关向设备发送一次同步探测确认连接
+            priority: 写入优先级，默认使用客户端的优先级
+
+        Returns:
+            设置是否成功
+        """
+        if verify and not self._check_connect(True):
+            logger.error("通过网关设置寄存器 %s 失败: 连接已断开", self._name(register_name))
+            return False
+        try:
+            return self._call("set", name=self._name(register_name), value=value,
+                              priority=self.priority if priority is None else priority)
+        except (ConnectionError, ValueError) as e:
+            logger.error("通过网关设置寄存器 %s 失败: %s", self._name(register_name), str(e))
+            return False
+
+    def set_many(self, values: Dict[RegisterName | callable, Any], verify: bool = False,
+                 priority: Optional[int] = None) -> bool:
+        """
+        批量设置多个寄存器的值
+
+        Args:
+            values: 寄存器名称或寄存器函数对象 -> 要设置的值
+            verify: 是否在写入前经由网关向设备发送一次同步探测确认连接
+            priority: 写入优先级，默认使用客户端的优先级
+
+        Returns:
+            全部写入是否成功
+        """
+        if verify and not self._check_connect(True):
+            logger.error("通过网关批量设置寄存器失败: 连接已断开")
+            return False
+        try:
+            return self._call("set_many",
+                              values={self._name(name): value for name, value in values.items()},
+                              priority=self.priority if priority is None else priority)
+        except (ConnectionError, ValueError) as e:
+            logger.error("通过网关批量设置寄存器失败: %s", str(e))
+            return False
+
+    def set_pose(self, values: Sequence[int], mode: Literal["angle", "pos"] = "angle",
+                 verify: bool = False, priority: Optional[int] = None) -> bool:
+        """
+        一次性设置六个自由度的角度或位置设定值
+
+        Args:
+            values: 六个自由度的设定值
+            mode: "angle" 写入 ANGLE_SET，"pos" 写入 POS_SET
+            verify: 是否在写入前经由网关向设备发送一次同步探测确认连接
+            priority: 写入优先级，默认使用客户端的优先级
+
+        Returns:
+            全部写入是否成功
+
+        Raises:
+            ValueError: 当值的数量或模式不正确时抛出
+        """
+        if mode not in POSE_PREFIXES:
+            raise ValueError(f"无效的模式: {mode}")
+        if len(values) != DOF_COUNT:
+            raise ValueError(f"需要 {DOF_COUNT} 个设定值，实际为 {len(values)} 个")
+        names = group_register_names(POSE_PREFIXES[mode])
+        return self.set_many(dict(zip(names, values)), verify, priority)
+
+    def _check_connect(self, verify: bool = False) -> bool:
+        """
+        检查与网关的连接
+
+        Args:
+            verify: 是否经由网关向设备发送一次同步探测请求，否则只确认网关可达
+
+        Returns:
+            连接是否正常
+        """
+        if not verify:
+            return self.is_connected or self._connect()
+        try:
+            return bool(self._call("ping", verify=True))
+        except (ConnectionError, ValueError):
+            return False
+
+    def close(self) -> None:
+        """关闭与网关的连接"""
+        with self._lock:
+            self._disconnect()
+
+    def __enter__(self) -> "RH56DFTPGatewayClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def main() -> None:
+    """命令行入口，以独立进程运行网关直到按下Ctrl+C"""
+    parser = argparse.ArgumentParser(description="RH56DFTP Unix域套接字网关")
+    parser.add_argument("--host", default="192.168.11.210", help="设备IP地址")
+    parser.add_argument("--port", type=int, default=6000, help="设备端口号")
+    parser.add_argument("--socket", default=DEFAULT_GATEWAY_SOCKET, help="Unix域套接字路径")
+    parser.add_argument("--merge-window", type=float, default=DEFAULT_MERGE_WINDOW,
+                        help="读取合并窗口（秒）")
+    args = parser.parse_args()
+
+    client = RH56DFTPClient(args.host, args.port)
+    with RH56DFTPGateway(client, args.socket, merge_window=args.merge_window) as gateway:
+        print(f"网关运行于 {gateway.path} -> {args.host}:{args.port}，按 Ctrl+C 退出", flush=True)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+RH56DFTP 寄存器索引模块，预先编译寄存器描述符，使键解析为一次字典查找
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from Register.RegisterKey.ftp_registers_keys import REGISTER_MAP, RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import decode_register_words, register_span
+
+
+def normalize_register_name(register_name: str) -> str:
+    """
+    将寄存器名称转换为对应的函数名，如 "FORCE_ACT(0)" -> "FORCE_ACT_0"
+
+    Args:
+        register_name: 寄存器名称
+
+    Returns:
+        函数名
+    """
+    return register_name.replace("(", "_").replace(")", "")
+
+
+def _make_decoder(register: Register_FTP, count: int) -> Callable[[Sequence[int]], Any]:
+    """为寄存器生成专用的解码函数，避免每次读取时重复判断数据类型"""
+    if count == 1 or (register.data_type == "short" and count == 2):
+        if register.data_type == "uint8":
+            return lambda words: words[0] & 0xFF
+        if register.data_type == "short":
+            return lambda words: words[0] - 65536 if words[0] > 32767 else words[0]
+        return lambda words: words[0]
+    return lambda words: decode_register_words(register, words)
+
+
+@dataclass(frozen=True)
+class RegisterDescriptor:
+    """
+    编译后的寄存器描述符
+    """
+    name: RegisterName
+    """寄存器名称"""
+
+    register: Register_FTP
+    """寄存器对象"""
+
+    address: int
+    """起始地址"""
+
+    count: int
+    """占用的寄存器数量"""
+
+    decode: Callable[[Sequence[int]], Any]
+    """原始字 -> get() 返回值的解码函数"""
+
+    readable: bool
+    """是否可读"""
+
+    writable: bool
+    """是否可写"""
+
+
+def build_register_index(registers: Dict[RegisterName, Register_FTP]
+                         ) -> Dict[Any, RegisterDescriptor]:
+    """
+    构建寄存器索引
+
+    每个寄存器以三种键登记：寄存器名称、规范化的函数名、ftp_registers_keys 中的函数对象
+
+    Args:
+        registers: 寄存器对象字典
+
+    Returns:
+        键 -> 寄存器描述符
+    """
+    index: Dict[Any, RegisterDescriptor] = {}
+    for register_name, register in registers.items():
+        address, count = register_span(register)
+        descriptor = RegisterDescriptor(
+            name=register_name,
+            register=register,
+            address=address,
+            count=count,
+            decode=_make_decoder(register, count),
+            readable=register.access_type != "write-only",
+            writable=register.access_type != "read-only"
+        )
+        index[register_name] = descriptor
+        index[normalize_register_name(register_name)] = descriptor
+        register_func = REGISTER_MAP.get(register_name)
+        if register_func is not None:
+            index[register_func] = descriptor
+    return index
+
+
+def lookup_register(index: Dict[Any, RegisterDescriptor],
+                    register_name: Any) -> Optional[RegisterDescriptor]:
+    """
+    在索引中查找寄存器描述符
+
+    其他模块中同名的寄存器函数按函数名查找，找到后登记到索引中，下次同样只需一次查找
+
+    Args:
+        index: build_register_index() 构建的索引
+        register_name: 寄存器名称、函数名或寄存器函数对象
+
+    Returns:
+        寄存器描述符，不存在时返回None
+    """
+    descriptor = index.get(register_name)
+    if descriptor is None and callable(register_name):
+        descriptor = index.get(getattr(register_name, "__name__", None))
+        if descriptor is not None:
+            index[register_name] = descriptor
+    return descriptor
@@ -0,0 +1,89 @@
+"""
+RH56DFTP 日志配置模块
+
+导入库时不再修改根日志器：'RH56DFTP' 日志器默认只输出WARNING及以上级别，
+应用未配置日志时由 logging 的默认处理器打印到stderr。需要输出到文件时调用 configure_logging()，
+日志记录通过 QueueHandler 交给后台 QueueListener 线程写出，不阻塞读写调用
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+LOGGER_NAME = 'RH56DFTP'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = 'rh56dftp.log'
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.setLevel(logging.WARNING)
+
+# 当前由 configure_logging() 安装的处理器与后台监听器
+_installed_handlers: List[logging.Handler] = []
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: int = logging.WARNING,
+                      log_file: Optional[str] = DEFAULT_LOG_FILE,
+                      console: bool = True,
+                      use_queue: bool = True) -> logging.Logger:
+    """
+    配置 'RH56DFTP' 日志器，重复调用会替换上一次的配置
+
+    Args:
+        level: 日志级别，默认只保留警告与错误；设为 logging.DEBUG 时才会格式化
+            每次读写的详细信息（包括触觉数据等大块数据）
+        log_file: 日志文件路径，为None时不写文件
+        console: 是否输出到控制台
+        use_queue: 是否通过 QueueHandler/QueueListener 在后台线程写出日志
+
+    Returns:
+        配置后的日志器
+    """
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = []
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    global _listener  # pylint: disable=global-statement
+    if use_queue and handlers:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        installed = [QueueHandler(log_queue)]
+    else:
+        installed = handlers
+
+    for handler in installed:
+        logger.addHandler(handler)
+    _installed_handlers.extend(installed)
+    # 已有专用处理器，不再向根日志器传播，避免重复输出
+    logger.propagate = not installed
+    logger.setLevel(level)
+    return logger
+
+
+def shutdown_logging() -> None:
+    """
+    停止后台日志线程并移除 configure_logging() 安装的处理器，剩余日志会先被写出
+    """
+    global _listener  # pylint: disable=global-statement
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    for handler in _installed_handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    _installed_handlers.clear()
+    logger.propagate = True
+
+
+atexit.register(shutdown_logging)
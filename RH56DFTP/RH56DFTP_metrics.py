@@ -0,0 +1,402 @@
+"""
+RH56DFTP 指标模块，统计请求延迟直方图与通信计数器，并导出为Prometheus文本格式
+
+直方图使用固定的桶边界，每次记录只做一次二分查找与几次加法，可以常开
+"""
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import AddressIntervals
+
+# 默认延迟桶上界（秒），最后一个桶为 +Inf
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+# 请求范围跨越多个寄存器组时使用的组名称
+MULTI_GROUP = "multi"
+# 地址不属于任何寄存器时使用的组名称
+UNMAPPED_GROUP = "unmapped"
+# 计数器名称
+COUNTER_NAMES = (
+    "requests", "errors", "retries", "timeouts", "reconnects", "bytes_sent", "bytes_received"
+)
+# 分阶段计时的阶段名称：请求构建与编码、发送到收齐应答、应答解码
+PHASE_NAMES = ("encode", "network", "decode")
+# 指标服务默认端口
+DEFAULT_METRICS_PORT = 9108
+# Prometheus指标名称前缀
+METRIC_PREFIX = "rh56dftp"
+
+
+def register_group_name(register_name: RegisterName) -> str:
+    """
+    获取寄存器所属的组名称，如 "FORCE_ACT(0)" -> "FORCE_ACT"，触觉寄存器统一为 "TACTILE"
+
+    Args:
+        register_name: 寄存器名称
+
+    Returns:
+        组名称
+    """
+    if register_name.startswith("TACTILE_"):
+        return "TACTILE"
+    return register_name.split("(", 1)[0]
+
+
+class LatencyHistogram:
+    """
+    固定桶延迟直方图，不加锁，由 ClientMetrics 负责同步
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        """各桶的计数（非累计），最后一个为 +Inf 桶"""
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """记录次数，由各桶计数求和，记录时少维护一个字段"""
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        """
+        记录一次延迟
+
+        Args:
+            seconds: 延迟（秒）
+        """
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+
+    def reset(self) -> None:
+        """清零"""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取直方图快照
+
+        Returns:
+            包含 buckets（上界 -> 累计计数）、count 与 sum 的字典
+        """
+        cumulative = {}
+        total = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), self.counts):
+            total += bucket_count
+            cumulative[bound] = total
+        return {"buckets": cumulative, "count": self.count, "sum": self.sum}
+
+
+class ClientMetrics:
+    """
+    单个客户端的指标
+
+    按Modbus功能码与寄存器组分别统计请求延迟，另有重试、超时、重连与收发字节数等计数器；
+    开启分阶段计时时还按编码、网络等待与解码阶段统计
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            registers: 寄存器对象字典，用于按地址确定寄存器组
+            buckets: 延迟桶上界（秒）
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._groups = AddressIntervals(
+            registers, lambda register_name, _: register_group_name(register_name), UNMAPPED_GROUP
+        )
+        self.by_function: Dict[int, LatencyHistogram] = {}
+        self.by_group: Dict[str, LatencyHistogram] = {}
+        # 分阶段计时默认关闭，开启后才会创建各阶段的直方图
+        self.by_phase: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
+
+    def group_of(self, address: int, count: int) -> str:
+        """
+        确定一次请求所属的寄存器组
+
+        Args:
+            address: 起始地址
+            count: 寄存器数量
+
+        Returns:
+            首尾地址属于同一组时返回该组名称，否则返回 "multi"
+        """
+        first = self._groups.lookup(address)
+        last = self._groups.lookup(address + count - 1)
+        return first if first == last else MULTI_GROUP
+
+    def observe(self, function_code: int, address: int, count: int, seconds: float,
+                error: bool = False, retries: int = 0, timeout: bool = False) -> None:
+        """
+        记录一次请求
+
+        Args:
+            function_code: Modbus功能码
+            address: 起始地址
+            count: 寄存器数量
+            seconds: 请求耗时（秒）
+            error: 是否失败（异常应答或传输错误）
+            retries: pymodbus内部的重发次数
+            timeout: 是否因超时失败
+        """
+        self.record(self.histograms(function_code, self.group_of(address, count)),
+                    seconds, error, retries, timeout)
+
+    def histograms(self, function_code: int, group: str
+                   ) -> Tuple[LatencyHistogram, LatencyHistogram]:
+        """
+        获取功能码与寄存器组对应的直方图，不存在时创建
+
+        直方图在 reset() 时原地清零，调用方可以缓存返回值，之后通过 record() 记录
+
+        Args:
+            function_code: Modbus功能码
+            group: 寄存器组名称
+
+        Returns:
+            (功能码直方图, 寄存器组直方图)
+        """
+        with self._lock:
+            by_function = self.by_function.get(function_code)
+            if by_function is None:
+                by_function = self.by_function[function_code] = LatencyHistogram(self.buckets)
+            by_group = self.by_group.get(group)
+            if by_group is None:
+                by_group = self.by_group[group] = LatencyHistogram(self.buckets)
+            return by_function, by_group
+
+    def record(self, histograms: Tuple[LatencyHistogram, LatencyHistogram], seconds: float,
+               error: bool = False, retries: int = 0, timeout: bool = False) -> None:
+        """
+        将一次请求记录到 histograms() 返回的直方图中
+
+        Args:
+            histograms: 直方图
+            seconds: 请求耗时（秒）
+            error: 是否失败（异常应答或传输错误）
+            retries: pymodbus内部的重发次数
+            timeout: 是否因超时失败
+        """
+        # 各直方图的桶边界相同，只做一次二分查找
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        by_function, by_group = histograms
+        with self._lock:
+            by_function.counts[bucket] += 1
+            by_function.sum += seconds
+            by_group.counts[bucket] += 1
+            by_group.sum += seconds
+
+            # 请求总数在快照时由功能码直方图求和，这里只维护少见的失败计数
+            if error or retries:
+                counters = self.counters
+                if error:
+                    counters["errors"] += 1
+                if retries:
+                    counters["retries"] += retries
+                if timeout:
+                    counters["timeouts"] += 1
+
+    def record_phases(self, encode: float, network: float, decode: float) -> None:
+        """
+        记录一次请求各阶段的耗时，只在开启分阶段计时时调用
+
+        Args:
+            encode: 从发起请求到开始发送的耗时（秒）
+            network: 从开始发送到收齐应答的耗时（秒），包含设备处理时间
+            decode: 从收齐应答到返回的耗时（秒）
+        """
+        with self._lock:
+            for phase, seconds in zip(PHASE_NAMES, (encode, network, decode)):
+                histogram = self.by_phase.get(phase)
+                if histogram is None:
+                    histogram = self.by_phase[phase] = LatencyHistogram(self.buckets)
+                histogram.observe(seconds)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """
+        增加计数器
+
+        Args:
+            counter: 计数器名称，见 COUNTER_NAMES
+            amount: 增量
+        """
+        with self._lock:
+            self.counters[counter] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取全部指标的快照
+
+        Returns:
+            {"counters": {...}, "by_function": {功能码: 直方图快照}, "by_group": {组名称: 直方图快照},
+            "by_phase": {阶段名称: 直方图快照}}，未开启分阶段计时时 by_phase 为空
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            counters["requests"] = sum(histogram.count for histogram in self.by_function.values())
+            return {
+                "counters": counters,
+                "by_function": {
+                    code: histogram.snapshot() for code, histogram in self.by_function.items()
+                },
+                "by_group": {
+                    group: histogram.snapshot() for group, histogram in self.by_group.items()
+                },
+                "by_phase": {
+                    phase: histogram.snapshot() for phase, histogram in self.by_phase.items()
+                }
+            }
+
+    def reset(self) -> None:
+        """清空全部指标，已有的直方图与计数器原地清零，调用方缓存的引用保持有效"""
+        with self._lock:
+            for histogram in (list(self.by_function.values()) + list(self.by_group.values())
+                              + list(self.by_phase.values())):
+                histogram.reset()
+            for counter in self.counters:
+                self.counters[counter] = 0
+
+
+def _escape_label_value(value: Any) -> str:
+    """转义Prometheus标签值中的反斜杠、引号与换行"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    """格式化Prometheus标签"""
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()
+    ) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    """格式化直方图桶上界"""
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def to_prometheus(snapshots: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+                  prefix: str = METRIC_PREFIX) -> str:
+    """
+    将指标快照转换为Prometheus文本格式
+
+    Args:
+        snapshots: (快照, 附加标签) 序列，附加标签用于区分多个客户端，如 {"device": "192.168.11.210:6000"}
+        prefix: 指标名称前缀
+
+    Returns:
+        Prometheus文本格式的指标
+    """
+    snapshots = list(snapshots)
+    lines: List[str] = []
+
+    for counter in COUNTER_NAMES:
+        name = f"{prefix}_{counter}_total"
+        lines.append(f"# TYPE {name} counter")
+        for snapshot, labels in snapshots:
+            lines.append(f"{name}{_format_labels(labels)} {snapshot['counters'][counter]}")
+
+    for section, name, label_name in (
+            ("by_function", f"{prefix}_function_duration_seconds", "function_code"),
+            ("by_group", f"{prefix}_group_duration_seconds", "group"),
+            ("by_phase", f"{prefix}_phase_duration_seconds", "phase")):
+        lines.append(f"# TYPE {name} histogram")
+        for snapshot, labels in snapshots:
+            for key, histogram in sorted(snapshot[section].items(), key=lambda item: str(item[0])):
+                series = dict(labels, **{label_name: key})
+                for bound, cumulative in histogram["buckets"].items():
+                    bucket_labels = _format_labels(dict(series, le=_format_bound(bound)))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(series)} {histogram['sum']!r}")
+                lines.append(f"{name}_count{_format_labels(series)} {histogram['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    在后台线程中通过HTTP提供Prometheus文本格式指标（任意路径均返回指标）
+    """
+
+    def __init__(self, render: Callable[[], str], host: str = "127.0.0.1",
+                 port: int = DEFAULT_METRICS_PORT):
+        """
+        Args:
+            render: 生成指标文本的函数，每次请求调用一次
+            host: 监听地址，默认只监听本机
+            port: 监听端口，为0时由系统分配
+        """
+        class Handler(BaseHTTPRequestHandler):
+            """指标请求处理器"""
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                body = render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self.host, self.port = self._httpd.server_address[:2]
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        """启动服务线程"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="RH56DFTP-metrics", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止服务并释放端口"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def serve_metrics(clients: Iterable[Any], host: str = "127.0.0.1",
+                  port: int = DEFAULT_METRICS_PORT) -> MetricsServer:
+    """
+    启动指标服务，导出一个或多个客户端的指标
+
+    Args:
+        clients: RH56DFTPClient 序列，各客户端以 device="主机:端口" 标签区分
+        host: 监听地址
+        port: 监听端口
+
+    Returns:
+        已启动的指标服务
+    """
+    clients = list(clients)
+
+    def render() -> str:
+        return to_prometheus(
+            (client.metrics(), {"device": f"{client.host}:{client.port}"}) for client in clients
+        )
+
+    return MetricsServer(render, host, port).start()
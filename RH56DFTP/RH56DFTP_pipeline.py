@@ -0,0 +1,404 @@
+"""
+RH56DFTP 流水线读取模块，在同一Modbus TCP连接上同时保持多个在途事务
+
+pymodbus 没有公开的流水线接口，只能借助同步客户端的事务锁、事务ID分配与帧编解码器实现；
+这些内部接口集中在 PipelineTransport 适配器中，构造时逐项检查，缺失时（pymodbus 版本变化）
+客户端退化为顺序读取，而不是在运行时抛出 AttributeError
+"""
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+from pymodbus.client import ModbusTcpClient
+from pymodbus.pdu.register_message import ReadHoldingRegistersRequest
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_base import TRANSPORT_ERRORS
+from .RH56DFTP_decode import TactileFrame
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_scheduler import READ_FUNCTION_CODE
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 同一连接上默认的最大在途事务数
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# 流水线读取依赖的 pymodbus 内部属性
+REQUIRED_ATTRIBUTES = (
+    "transaction._sync_lock",
+    "transaction.getNextTID",
+    "framer.buildFrame",
+    "framer.decode",
+    "framer.decoder.decode",
+)
+
+
+def missing_attributes(client: ModbusTcpClient) -> List[str]:
+    """
+    检查客户端缺少哪些流水线读取依赖的内部属性
+
+    Args:
+        client: pymodbus 同步TCP客户端
+
+    Returns:
+        缺少的属性路径，全部存在时为空
+    """
+    missing = []
+    for path in REQUIRED_ATTRIBUTES:
+        target: Any = client
+        for attribute in path.split("."):
+            target = getattr(target, attribute, None)
+            if target is None:
+                missing.append(path)
+                break
+    return missing
+
+
+def split_chunks(start_address: int, count: int, max_count: int) -> List[Tuple[int, int]]:
+    """
+    将地址区间按单次读取上限分块
+
+    Args:
+        start_address: 起始地址
+        count: 寄存器数量
+        max_count: 单次读取的最大寄存器数量
+
+    Returns:
+        (起始地址, 数量) 分块列表
+    """
+    chunks = []
+    current_addr = start_address
+    remaining = count
+    while remaining > 0:
+        batch_count = min(remaining, max_count)
+        chunks.append((current_addr, batch_count))
+        current_addr += batch_count
+        remaining -= batch_count
+    return chunks
+
+
+class PipelineTransport:
+    """
+    pymodbus 同步客户端内部接口的适配器
+
+    只有 supported 为True时才能调用其余方法；调用方需在 lock() 内完成整次流水线读取，
+    避免其他线程经由 pymodbus 的请求插入到在途事务之间
+    """
+
+    def __init__(self, client: ModbusTcpClient, dev_id: int = 1):
+        """
+        Args:
+            client: pymodbus 同步TCP客户端
+            dev_id: 设备地址
+        """
+        self.client = client
+        self.dev_id = dev_id
+        self.missing = missing_attributes(client)
+        """缺少的内部属性，为空时支持流水线读取"""
+
+    @property
+    def supported(self) -> bool:
+        """当前 pymodbus 版本是否提供流水线读取所需的全部内部接口"""
+        return not self.missing
+
+    def lock(self):
+        """pymodbus 的同步事务锁，持有期间其他线程无法经由 pymodbus 发出请求"""
+        return self.client.transaction._sync_lock  # pylint: disable=protected-access
+
+    def send_read(self, address: int, count: int) -> int:
+        """
+        发送一个读取保持寄存器请求，不等待应答
+
+        Args:
+            address: 起始地址
+            count: 寄存器数量
+
+        Returns:
+            请求的事务ID
+        """
+        request = ReadHoldingRegistersRequest(
+            address=address,
+            count=count,
+            dev_id=self.dev_id,
+            transaction_id=self.client.transaction.getNextTID()
+        )
+        self.client.send(self.client.framer.buildFrame(request))
+        return request.transaction_id
+
+    def receive(self) -> bytes:
+        """
+        接收已到达的数据
+
+        Returns:
+            收到的字节，超时时为空
+        """
+        return self.client.recv(None)
+
+    def split_frames(self, buffer: bytes) -> Tuple[bytes, List[Tuple[int, Any]]]:
+        """
+        拆分缓冲区中所有完整的应答帧
+
+        Args:
+            buffer: 已接收但尚未解码的字节
+
+        Returns:
+            (剩余的不完整字节, [(事务ID, 应答), ...])，无法解码的应答为None
+        """
+        framer = self.client.framer
+        frames = []
+        while True:
+            used_len, _, tid, frame_data = framer.decode(buffer)
+            if not used_len:
+                return buffer, frames
+            buffer = buffer[used_len:]
+            frames.append((tid, framer.decoder.decode(frame_data)))
+
+
+class PipelinedRead:
+    """
+    一次流水线读取的进度：发送窗口、在途事务与已完成的分块
+
+    只记录状态，不处理错误应答与链路调度，由客户端决定如何重试或让出链路
+    """
+
+    def __init__(self, transport: PipelineTransport, chunks: List[Tuple[int, int]]):
+        """
+        Args:
+            transport: 流水线传输适配器
+            chunks: (起始地址, 数量) 分块列表
+        """
+        self.transport = transport
+        self.chunks = chunks
+        self.results: Dict[int, List[int]] = {}
+        # 事务ID -> (分块序号, 发送时间)
+        self.pending: Dict[int, Tuple[int, float]] = {}
+        self.next_chunk = 0
+        self._buffer = b""
+
+    @property
+    def unsent(self) -> int:
+        """尚未发送的分块数量"""
+        return len(self.chunks) - self.next_chunk
+
+    def fill_window(self, max_in_flight: int) -> None:
+        """
+        补满发送窗口
+
+        Args:
+            max_in_flight: 最大在途事务数
+        """
+        while self.next_chunk < len(self.chunks) and len(self.pending) < max_in_flight:
+            tid = self.transport.send_read(*self.chunks[self.next_chunk])
+            self.pending[tid] = (self.next_chunk, time.perf_counter())
+            self.next_chunk += 1
+
+    def receive(self) -> List[Tuple[int, Any, float]]:
+        """
+        接收一次数据并取出其中完整的应答，忽略未知事务ID的应答
+
+        Returns:
+            [(分块序号, 应答, 往返耗时), ...]，无法解码的应答为None
+
+        Raises:
+            TimeoutError: 当等待应答超时时抛出
+        """
+        data = self.transport.receive()
+        if not data:
+            raise TimeoutError(f"等待应答超时，仍有 {len(self.pending)} 个事务未完成")
+        self._buffer, frames = self.transport.split_frames(self._buffer + data)
+        now = time.perf_counter()
+        responses = []
+        for tid, response in frames:
+            if tid not in self.pending:
+                logger.warning("收到未知事务ID %d 的应答，已忽略", tid)
+                continue
+            index, sent_at = self.pending.pop(tid)
+            responses.append((index, response, now - sent_at))
+        return responses
+
+    def words(self) -> List[int]:
+        """
+        按地址顺序拼接全部分块的寄存器值
+
+        Returns:
+            原始寄存器值
+        """
+        all_registers = []
+        for index in range(len(self.chunks)):
+            all_registers.extend(self.results[index])
+        return all_registers
+
+
+class PipelinedReadMixin:
+    """
+    RH56DFTPClient 的流水线整帧触觉读取
+
+    依赖宿主类提供 client、scheduler、tactile_layout、max_count_per_read、_pipeline、_metrics、
+    _register_index、_tactile_names、_read_register_batch()、_shrink_on_rejection()、
+    _mark_disconnected() 与 _check_connect()
+    """
+
+    def _read_register_pipelined(self, start_address: int, count: int,
+                                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> List[int]:
+        """
+        流水线读取寄存器批次
+
+        与 _read_register_batch 的分块方式相同，但在同一TCP连接上同时保持多个
+        事务ID在途，按事务ID重组应答，总耗时约为一次往返加上传输时间；
+        有更高优先级的请求等待时停止发送新分块，收完在途应答后让出链路，再继续剩余分块。
+        pymodbus 缺少流水线所需的内部接口时退化为 _read_register_batch 顺序读取
+
+        Args:
+            start_address: 起始地址
+            count: 寄存器数量
+            max_in_flight: 最大在途事务数
+
+        Returns:
+            按地址顺序排列的原始寄存器值
+
+        Raises:
+            ValueError: 当设备返回错误应答时抛出
+            TimeoutError: 当等待应答超时时抛出
+            ConnectionError: 当连接不可用时抛出
+        """
+        if not self._pipeline.supported:
+            return self._read_register_batch(start_address, count)
+        if not self.client.connected:
+            self._mark_disconnected()
+            raise ConnectionError("连接已断开")
+
+        priority = self.scheduler.classify(READ_FUNCTION_CODE, start_address, count)
+        read = PipelinedRead(
+            self._pipeline, split_chunks(start_address, count, self.max_count_per_read)
+        )
+        # 被设备拒绝的分块大小，收完在途应答后按减小的分块重新读取
+        rejected = False
+        while read.unsent and not rejected:
+            rejected = self._pipeline_round(read, priority, max_in_flight)
+        self._last_io_time = time.perf_counter()
+        if rejected:
+            return self._read_register_pipelined(start_address, count, max_in_flight)
+        return read.words()
+
+    def _pipeline_round(self, read: PipelinedRead, priority: int, max_in_flight: int) -> bool:
+        """
+        持有一次链路，发送分块并收完在途应答，直到全部完成、被更高优先级请求抢占或设备拒绝分块
+
+        Args:
+            read: 流水线读取进度
+            priority: 读取的优先级
+            max_in_flight: 最大在途事务数
+
+        Returns:
+            是否有分块因过大被设备拒绝
+        """
+        rejected = False
+        # 持有调度器与pymodbus的事务锁，避免其他线程的请求插入到流水线中
+        with self.scheduler.slot(priority), self._pipeline.lock():
+            try:
+                while read.unsent or read.pending:
+                    preempted = rejected or self.scheduler.preempt_requested(priority)
+                    if preempted and not read.pending:
+                        logger.debug("流水线读取让出链路，剩余 %d 个分块", read.unsent)
+                        break
+                    if not preempted:
+                        read.fill_window(max_in_flight)
+                    rejected = self._collect_responses(read) or rejected
+            except TRANSPORT_ERRORS as e:
+                self._metrics.increment("errors")
+                if isinstance(e, TimeoutError):
+                    self._metrics.increment("timeouts")
+                self._mark_disconnected()
+                raise
+            except Exception:
+                # 连接上可能残留未读取的应答，关闭连接以便下次重新同步
+                self.client.close()
+                raise
+        return rejected
+
+    def _collect_responses(self, read: PipelinedRead) -> bool:
+        """
+        接收一次数据，记录完整应答的延迟并保存分块结果
+
+        Args:
+            read: 流水线读取进度
+
+        Returns:
+            是否有分块因过大被设备拒绝
+
+        Raises:
+            ValueError: 当设备返回其他错误应答时抛出
+            TimeoutError: 当等待应答超时时抛出
+        """
+        rejected = False
+        for index, response, elapsed in read.receive():
+            failed = response is None or response.isError()
+            self._metrics.observe(READ_FUNCTION_CODE, *read.chunks[index], elapsed, error=failed)
+            if failed and self._shrink_on_rejection(response, read.chunks[index][1]):
+                rejected = True
+                continue
+            if failed:
+                raise ValueError(f"读取寄存器失败: {response}")
+            read.results[index] = response.registers
+        return rejected
+
+    def read_tactile_frame(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+                           ) -> Dict[RegisterName, List[int]]:
+        """
+        流水线读取全部17个触觉寄存器的整帧数据（地址3000-5123）
+
+        Args:
+            max_in_flight: 同一连接上的最大在途事务数，为1时退化为顺序读取
+
+        Returns:
+            触觉寄存器名称 -> 原始寄存器值列表，与 get() 的返回格式一致
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        frame_start = self.tactile_layout.start
+        words = self._read_tactile_words(max_in_flight)
+
+        frame = {}
+        for register_name in self._tactile_names:
+            descriptor = self._register_index[register_name]
+            offset = descriptor.address - frame_start
+            frame[register_name] = words[offset:offset + descriptor.count]
+        return frame
+
+    def read_tactile_tensor(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> TactileFrame:
+        """
+        流水线读取整帧触觉数据并向量化解码为NumPy数组（需要安装numpy）
+
+        Args:
+            max_in_flight: 同一连接上的最大在途事务数
+
+        Returns:
+            触觉帧，data 为全手int16一维数组，pads 为各触觉区域的二维视图
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+            ImportError: 当未安装numpy时抛出
+        """
+        return self.tactile_layout.decode(self._read_tactile_words(max_in_flight))
+
+    def _read_tactile_words(self, max_in_flight: int) -> List[int]:
+        """流水线读取整帧触觉区域的原始寄存器值"""
+        frame_start = self.tactile_layout.start
+        frame_count = self.tactile_layout.count
+
+        if not self._check_connect():
+            logger.error("读取触觉帧失败: 连接已断开")
+            raise ConnectionError("连接已断开")
+
+        try:
+            words = self._read_register_pipelined(frame_start, frame_count, max_in_flight)
+        except Exception as e:
+            logger.error("读取触觉帧时出错: %s", str(e))
+            raise ValueError(f"读取触觉帧时出错: {str(e)}") from e
+
+        logger.debug("成功读取触觉帧: 地址范围=%d-%d, 数量=%d",
+                     frame_start, frame_start + frame_count - 1, frame_count)
+        return words
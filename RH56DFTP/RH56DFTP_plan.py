@@ -0,0 +1,154 @@
+"""
+RH56DFTP 读取计划模块，将任意寄存器集合合并为最少的批量读取
+"""
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import MAX_COUNT_PER_READ, register_span
+
+# 默认间隔阈值：两个地址区间之间不超过该数量的未用寄存器时，顺带读取比多一次往返更划算
+DEFAULT_GAP_THRESHOLD = 16
+
+
+def _read_count(count: int, max_count: int) -> int:
+    """读取count个连续寄存器所需的请求次数"""
+    return -(-count // max_count)
+
+
+@dataclass(frozen=True)
+class ReadSegment:
+    """
+    一段连续读取的地址区间，超过单次读取上限时由客户端自动分批
+    """
+    start: int
+    count: int
+
+
+@dataclass(frozen=True)
+class ReadSlot:
+    """
+    寄存器在读取结果中的位置
+    """
+    name: RegisterName
+    segment: int
+    offset: int
+    count: int
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """
+    编译后的读取计划
+    """
+    segments: Tuple[ReadSegment, ...]
+    """按地址排序的连续读取区间"""
+
+    slots: Tuple[ReadSlot, ...]
+    """每个寄存器在对应区间中的偏移"""
+
+    request_count: int
+    """执行该计划所需的Modbus请求次数"""
+
+    def extract(self, segment_words: List[List[int]]) -> Dict[RegisterName, List[int]]:
+        """
+        从各区间的原始数据中取出每个寄存器的原始字
+
+        Args:
+            segment_words: 与 segments 一一对应的原始寄存器值
+
+        Returns:
+            寄存器名称 -> 原始寄存器值列表
+        """
+        return {
+            slot.name: segment_words[slot.segment][slot.offset:slot.offset + slot.count]
+            for slot in self.slots
+        }
+
+
+class ReadPlanner:
+    """
+    读取计划编译器
+
+    按 Register_FTP.address 对地址区间排序，在不超过间隔阈值且能减少请求次数时合并相邻区间；
+    编译结果按寄存器集合缓存，重复轮询同一组寄存器时不再重新规划
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 gap_threshold: int = DEFAULT_GAP_THRESHOLD,
+                 max_count: int = MAX_COUNT_PER_READ):
+        """
+        Args:
+            registers: 寄存器对象字典
+            gap_threshold: 允许顺带读取的最大未用寄存器数量
+            max_count: 单次读取的最大寄存器数量
+        """
+        self.registers = registers
+        self.gap_threshold = gap_threshold
+        self.max_count = max_count
+        self._cache: Dict[FrozenSet[RegisterName], ReadPlan] = {}
+
+    def plan(self, register_names: Iterable[RegisterName]) -> ReadPlan:
+        """
+        获取寄存器集合的读取计划
+
+        Args:
+            register_names: 寄存器名称序列，重复项会被合并
+
+        Returns:
+            读取计划
+
+        Raises:
+            ValueError: 当寄存器不存在时抛出
+        """
+        key = frozenset(register_names)
+        plan = self._cache.get(key)
+        if plan is None:
+            plan = self._compile(key)
+            self._cache[key] = plan
+        return plan
+
+    def clear_cache(self) -> None:
+        """清空已缓存的读取计划"""
+        self._cache.clear()
+
+    def _compile(self, register_names: FrozenSet[RegisterName]) -> ReadPlan:
+        """编译读取计划"""
+        intervals = []
+        for register_name in register_names:
+            if register_name not in self.registers:
+                raise ValueError(f"寄存器 {register_name} 不存在")
+            start_address, count = register_span(self.registers[register_name])
+            intervals.append((start_address, start_address + count, register_name))
+        intervals.sort()
+
+        # 合并区间: [起始地址, 结束地址(不含)]
+        merged: List[List[int]] = []
+        for start_address, end_address, _ in intervals:
+            if merged:
+                current = merged[-1]
+                gap = start_address - current[1]
+                merged_end = max(current[1], end_address)
+                separate = (_read_count(current[1] - current[0], self.max_count)
+                            + _read_count(end_address - start_address, self.max_count))
+                if gap <= 0 or (gap <= self.gap_threshold and
+                                _read_count(merged_end - current[0], self.max_count) < separate):
+                    current[1] = merged_end
+                    continue
+            merged.append([start_address, end_address])
+
+        segments = tuple(ReadSegment(start, end - start) for start, end in merged)
+        slots = []
+        segment_index = 0
+        for start_address, end_address, register_name in intervals:
+            while start_address >= merged[segment_index][1]:
+                segment_index += 1
+            slots.append(ReadSlot(
+                name=register_name,
+                segment=segment_index,
+                offset=start_address - merged[segment_index][0],
+                count=end_address - start_address
+            ))
+        request_count = sum(_read_count(segment.count, self.max_count) for segment in segments)
+        return ReadPlan(segments=segments, slots=tuple(slots), request_count=request_count)
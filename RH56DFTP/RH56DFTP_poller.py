@@ -0,0 +1,325 @@
+"""
+RH56DFTP 后台轮询模块，在独立线程中按各组频率采样寄存器并写入环形缓冲区
+"""
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_TCP import RH56DFTPClient
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 每组默认保留的采样数量
+DEFAULT_CAPACITY = 1024
+
+
+@dataclass(frozen=True)
+class Sample:
+    """
+    带时间戳的采样
+    """
+    timestamp: float
+    """采样完成时的时间戳（time.time()）"""
+
+    sequence: int
+    """该组内的采样序号，从0开始递增"""
+
+    values: Any
+    """采样值，格式由采样组的读取函数决定"""
+
+
+class SampleRing:
+    """
+    固定容量的环形缓冲区
+
+    槽位列表长度固定，每次写入会新建一个不可变的 Sample 放入槽位；
+    只允许一个写线程，读线程无需加锁：写入时先填充槽位再发布计数，
+    读取时通过槽位中的序号识别已被覆盖的旧采样
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: 缓冲区容量
+
+        Raises:
+            ValueError: 当容量不是正数时抛出
+        """
+        if capacity <= 0:
+            raise ValueError(f"缓冲区容量必须为正数: {capacity}")
+        self.capacity = capacity
+        self._slots: List[Optional[Sample]] = [None] * capacity
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """累计写入的采样数量"""
+        return self._count
+
+    def push(self, timestamp: float, values: Any) -> None:
+        """
+        写入一个采样，缓冲区满时覆盖最旧的采样
+
+        Args:
+            timestamp: 时间戳
+            values: 采样值
+        """
+        sequence = self._count
+        self._slots[sequence % self.capacity] = Sample(timestamp, sequence, values)
+        # 槽位写完后再发布，读线程看到的计数总是指向完整的采样
+        self._count = sequence + 1
+
+    def latest(self) -> Optional[Sample]:
+        """
+        获取最新采样
+
+        Returns:
+            最新采样，尚无采样时返回None
+        """
+        count = self._count
+        if count == 0:
+            return None
+        return self._slots[(count - 1) % self.capacity]
+
+    def last(self, n: int) -> List[Sample]:
+        """
+        获取最近的n个采样
+
+        Args:
+            n: 采样数量
+
+        Returns:
+            按时间先后排列的采样列表，数量可能少于n
+        """
+        count = self._count
+        n = min(n, count, self.capacity)
+        samples = []
+        for sequence in range(count - n, count):
+            sample = self._slots[sequence % self.capacity]
+            # 读取期间被写线程覆盖的槽位序号会变大，跳过
+            if sample is not None and sample.sequence == sequence:
+                samples.append(sample)
+        return samples
+
+
+@dataclass(frozen=True)
+class PollGroup:
+    """
+    轮询组：以固定频率调用读取函数
+    """
+    name: str
+    """组名称，用于获取采样"""
+
+    rate_hz: float
+    """采样频率（Hz）"""
+
+    read: Callable[[RH56DFTPClient], Any]
+    """读取函数，参数为客户端，返回采样值"""
+
+    capacity: int = DEFAULT_CAPACITY
+    """环形缓冲区容量"""
+
+
+def state_group(rate_hz: float = 200.0, include_setpoints: bool = False,
+                capacity: int = DEFAULT_CAPACITY) -> PollGroup:
+    """
+    创建整手状态轮询组，采样值为 HandState
+
+    Args:
+        rate_hz: 采样频率（Hz）
+        include_setpoints: 是否同时读取设定值块
+        capacity: 环形缓冲区容量
+
+    Returns:
+        名为 "state" 的轮询组
+    """
+    return PollGroup(
+        name="state",
+        rate_hz=rate_hz,
+        read=lambda client: client.read_state(include_setpoints),
+        capacity=capacity
+    )
+
+
+def tactile_group(rate_hz: float = 50.0, capacity: int = DEFAULT_CAPACITY) -> PollGroup:
+    """
+    创建触觉整帧轮询组，采样值为 read_tactile_frame() 的返回值
+
+    Args:
+        rate_hz: 采样频率（Hz）
+        capacity: 环形缓冲区容量
+
+    Returns:
+        名为 "tactile" 的轮询组
+    """
+    return PollGroup(
+        name="tactile",
+        rate_hz=rate_hz,
+        read=lambda client: client.read_tactile_frame(),
+        capacity=capacity
+    )
+
+
+def register_group(name: str, register_names: Iterable[RegisterName], rate_hz: float,
+                   capacity: int = DEFAULT_CAPACITY) -> PollGroup:
+    """
+    创建任意寄存器集合的轮询组，采样值为 read_many() 的返回值
+
+    Args:
+        name: 组名称
+        register_names: 寄存器名称序列
+        rate_hz: 采样频率（Hz）
+        capacity: 环形缓冲区容量
+
+    Returns:
+        轮询组
+    """
+    register_names = tuple(register_names)
+    return PollGroup(
+        name=name,
+        rate_hz=rate_hz,
+        read=lambda client: client.read_many(register_names),
+        capacity=capacity
+    )
+
+
+class RH56DFTPPoller:
+    """
+    后台轮询器
+
+    在独立线程中按各组频率采样，采样写入各组的环形缓冲区；
+    应用线程通过 latest()/last() 获取数据，不直接访问socket
+
+    Example::
+
+        poller = RH56DFTPPoller(client, [state_group(200), tactile_group(50)])
+        with poller:
+            state = poller.latest("state").values
+    """
+
+    def __init__(self, client: RH56DFTPClient, groups: Iterable[PollGroup]):
+        """
+        Args:
+            client: 已创建的客户端
+            groups: 轮询组
+
+        Raises:
+            ValueError: 当组名称重复或频率不是正数时抛出
+        """
+        self.client = client
+        self.groups: Dict[str, PollGroup] = {}
+        self.buffers: Dict[str, SampleRing] = {}
+        self.error_counts: Dict[str, int] = {}
+        for group in groups:
+            if group.name in self.groups:
+                raise ValueError(f"轮询组名称重复: {group.name}")
+            if group.rate_hz <= 0:
+                raise ValueError(f"轮询组 {group.name} 的频率必须为正数: {group.rate_hz}")
+            self.groups[group.name] = group
+            self.buffers[group.name] = SampleRing(group.capacity)
+            self.error_counts[group.name] = 0
+        # 处于连续采样失败状态的组，仅在状态切换时输出警告
+        self._failing: Dict[str, bool] = {name: False for name in self.groups}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """启动轮询线程，已启动时不做任何操作"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="RH56DFTP-poller", daemon=True)
+        self._thread.start()
+        logger.info("轮询线程已启动: %s", ", ".join(
+            f"{name}@{group.rate_hz}Hz" for name, group in self.groups.items()))
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        停止轮询线程
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("轮询线程已停止")
+
+    def latest(self, group_name: str) -> Optional[Sample]:
+        """
+        获取指定组的最新采样
+
+        Args:
+            group_name: 组名称
+
+        Returns:
+            最新采样，尚无采样时返回None
+        """
+        return self.buffers[group_name].latest()
+
+    def last(self, group_name: str, n: int) -> List[Sample]:
+        """
+        获取指定组最近的n个采样
+
+        Args:
+            group_name: 组名称
+            n: 采样数量
+
+        Returns:
+            按时间先后排列的采样列表
+        """
+        return self.buffers[group_name].last(n)
+
+    def _run(self) -> None:
+        """轮询线程主循环，按绝对截止时间调度各组"""
+        now = time.monotonic()
+        # (截止时间, 组名称)
+        schedule = [(now, name) for name in self.groups]
+        heapq.heapify(schedule)
+
+        while not self._stop_event.is_set():
+            deadline, name = schedule[0]
+            delay = deadline - time.monotonic()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+
+            group = self.groups[name]
+            try:
+                values = group.read(self.client)
+            except Exception as e:  # pylint: disable=broad-except
+                self.error_counts[name] += 1
+                if self._failing[name]:
+                    logger.debug("轮询组 %s 采样失败: %s", name, str(e))
+                else:
+                    self._failing[name] = True
+                    logger.warning("轮询组 %s 采样失败，恢复前不再逐次警告: %s", name, str(e))
+            else:
+                self.buffers[name].push(time.time(), values)
+                if self._failing[name]:
+                    self._failing[name] = False
+                    logger.info("轮询组 %s 采样已恢复，累计失败 %d 次",
+                                name, self.error_counts[name])
+
+            # 保持相位不漂移；落后超过一个周期时跳过错过的采样点
+            period = 1.0 / group.rate_hz
+            next_deadline = deadline + period
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline += ((now - next_deadline) // period + 1) * period
+            heapq.heapreplace(schedule, (next_deadline, name))
+
+    def __enter__(self) -> "RH56DFTPPoller":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,489 @@
+"""
+RH56DFTP 会话录制模块，将状态快照与整帧触觉数据以定长二进制记录追加写入文件
+
+需要安装可选依赖 numpy: pip install plusml-rh56dftp[numpy]
+
+文件由一个JSON文件头和若干定长记录组成，记录长度由寄存器表计算得到，
+因此可以按采样序号直接定位；读取端通过内存映射以NumPy数组访问，不复制数据
+
+文件格式（小端）::
+
+    magic(8字节) | 文件头总长度(uint32) | JSON文件头（空格填充到64字节对齐）
+    记录0 | 记录1 | ...
+
+每条记录依次为 timestamp(float64)、state(int16[4][6])、
+可选的 setpoints(int16[2][6]) 与可选的 tactile(int16[触觉点数])
+"""
+import json
+import logging
+import os
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_decode import TactileFrame, TactileLayout
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import DOF_COUNT, SETPOINT_GROUPS, STATE_GROUPS, HandState
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 文件标识
+RECORDING_MAGIC = b"RH56REC\x00"
+# 文件格式版本
+RECORDING_VERSION = 1
+# 文件头对齐字节数
+HEADER_ALIGNMENT = 64
+# 默认每批写入的记录数
+DEFAULT_BATCH_SIZE = 64
+# magic 与文件头长度字段
+_PREAMBLE = struct.Struct("<8sI")
+
+
+def _require_numpy() -> None:
+    """检查numpy是否可用"""
+    if np is None:
+        raise ImportError("会话录制需要安装numpy: pip install plusml-rh56dftp[numpy]")
+
+
+def build_layout(registers: Dict[RegisterName, Register_FTP], include_setpoints: bool = False,
+                 include_tactile: bool = True) -> Dict[str, Any]:
+    """
+    由寄存器表计算记录布局，作为文件头保存
+
+    Args:
+        registers: 寄存器对象字典
+        include_setpoints: 是否记录设定值块
+        include_tactile: 是否记录整帧触觉数据
+
+    Returns:
+        记录布局字典
+    """
+    layout: Dict[str, Any] = {
+        "version": RECORDING_VERSION,
+        "dof_count": DOF_COUNT,
+        "state_groups": list(STATE_GROUPS),
+        "setpoint_groups": list(SETPOINT_GROUPS) if include_setpoints else [],
+        "tactile": []
+    }
+    if include_tactile:
+        tactile_layout = TactileLayout(registers)
+        layout["tactile"] = [
+            {"name": name, "offset": offset, "shape": list(shape)}
+            for name, offset, shape in tactile_layout.slices
+        ]
+        layout["tactile_size"] = tactile_layout.size
+    return layout
+
+
+def record_dtype(layout: Dict[str, Any]) -> "np.dtype":
+    """
+    由记录布局生成NumPy结构化数据类型
+
+    Args:
+        layout: 记录布局字典
+
+    Returns:
+        定长记录的数据类型，itemsize 即记录长度
+    """
+    _require_numpy()
+    dof_count = layout["dof_count"]
+    fields: List[Tuple[Any, ...]] = [
+        ("timestamp", "<f8"),
+        ("state", "<i2", (len(layout["state_groups"]), dof_count))
+    ]
+    if layout["setpoint_groups"]:
+        fields.append(("setpoints", "<i2", (len(layout["setpoint_groups"]), dof_count)))
+    if layout["tactile"]:
+        fields.append(("tactile", "<i2", (layout["tactile_size"],)))
+    return np.dtype(fields)
+
+
+def fill_record(layout: Dict[str, Any], record: "np.void", state: HandState,
+                tactile: Optional[TactileFrame | Sequence[int]] = None,
+                timestamp: Optional[float] = None) -> None:
+    """
+    按记录布局将状态快照与触觉数据写入一条记录
+
+    Args:
+        layout: 记录布局字典
+        record: 结构化数组中的一条记录
+        state: 状态快照，布局包含设定值块时需包含设定值
+        tactile: 触觉帧或全手一维触觉数据，布局包含触觉数据时必须提供
+        timestamp: 时间戳，默认使用 state.timestamp
+
+    Raises:
+        ValueError: 当缺少布局要求的数据时抛出
+    """
+    record["timestamp"] = state.timestamp if timestamp is None else timestamp
+    record["state"] = [getattr(state, group.lower()) for group in layout["state_groups"]]
+    if layout["setpoint_groups"]:
+        setpoints = [getattr(state, group.lower()) for group in layout["setpoint_groups"]]
+        if any(values is None for values in setpoints):
+            raise ValueError("记录设定值块需要包含设定值的状态快照")
+        record["setpoints"] = setpoints
+    if layout["tactile"]:
+        if tactile is None:
+            raise ValueError("记录触觉数据需要提供触觉帧")
+        record["tactile"] = tactile.data if isinstance(tactile, TactileFrame) else tactile
+
+
+def record_state(layout: Dict[str, Any], record: "np.void") -> HandState:
+    """
+    将一条记录还原为状态快照
+
+    Args:
+        layout: 记录布局字典
+        record: 结构化数组中的一条记录
+
+    Returns:
+        状态快照
+    """
+    fields = {
+        group.lower(): tuple(int(value) for value in values)
+        for group, values in zip(layout["state_groups"], record["state"])
+    }
+    if layout["setpoint_groups"]:
+        fields.update({
+            group.lower(): tuple(int(value) for value in values)
+            for group, values in zip(layout["setpoint_groups"], record["setpoints"])
+        })
+    return HandState(timestamp=float(record["timestamp"]), **fields)
+
+
+def record_frame(layout: Dict[str, Any], record: "np.void") -> TactileFrame:
+    """
+    将一条记录的触觉数据还原为触觉帧（视图，不复制数据）
+
+    Args:
+        layout: 记录布局字典
+        record: 结构化数组中的一条记录
+
+    Returns:
+        触觉帧
+
+    Raises:
+        ValueError: 当布局不包含触觉数据时抛出
+    """
+    if not layout["tactile"]:
+        raise ValueError("记录中没有触觉数据")
+    data = record["tactile"]
+    pads = {
+        entry["name"]: data[entry["offset"]:entry["offset"] + entry["shape"][0] * entry["shape"][1]]
+        .reshape(entry["shape"])
+        for entry in layout["tactile"]
+    }
+    return TactileFrame(data, pads)
+
+
+def _encode_header(layout: Dict[str, Any]) -> bytes:
+    """编码文件头，总长度对齐到 HEADER_ALIGNMENT"""
+    body = json.dumps(layout, ensure_ascii=False).encode("utf-8")
+    total = _PREAMBLE.size + len(body)
+    total += -total % HEADER_ALIGNMENT
+    return _PREAMBLE.pack(RECORDING_MAGIC, total) + body.ljust(total - _PREAMBLE.size, b" ")
+
+
+def read_header(path: str) -> Tuple[Dict[str, Any], int]:
+    """
+    读取录制文件的文件头
+
+    Args:
+        path: 录制文件路径
+
+    Returns:
+        (记录布局字典, 文件头总长度)
+
+    Raises:
+        ValueError: 当文件不是录制文件或版本不受支持时抛出
+    """
+    with open(path, "rb") as file:
+        preamble = file.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"文件 {path} 不是有效的录制文件")
+        magic, header_size = _PREAMBLE.unpack(preamble)
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"文件 {path} 不是有效的录制文件")
+        layout = json.loads(file.read(header_size - _PREAMBLE.size).decode("utf-8"))
+    if layout.get("version") != RECORDING_VERSION:
+        raise ValueError(f"不支持的录制文件版本: {layout.get('version')}")
+    return layout, header_size
+
+
+class SessionRecorder:
+    """
+    会话录制器
+
+    记录先写入预分配的内存批次，攒满 batch_size 条后一次写入文件
+
+    Example::
+
+        with SessionRecorder("session.rec", client.registers) as recorder:
+            for _ in range(1000):
+                recorder.capture(client)
+    """
+
+    def __init__(self, path: str, registers: Dict[RegisterName, Register_FTP],
+                 include_setpoints: bool = False, include_tactile: bool = True,
+                 batch_size: int = DEFAULT_BATCH_SIZE, append: bool = False):
+        """
+        Args:
+            path: 录制文件路径
+            registers: 寄存器对象字典，用于计算记录布局
+            include_setpoints: 是否记录设定值块
+            include_tactile: 是否记录整帧触觉数据
+            batch_size: 每批写入的记录数
+            append: 文件已存在时是否追加，为False时覆盖
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            ValueError: 当追加的文件布局与当前布局不一致时抛出
+        """
+        _require_numpy()
+        if batch_size <= 0:
+            raise ValueError(f"批次大小必须为正数: {batch_size}")
+        self.path = path
+        self.layout = build_layout(registers, include_setpoints, include_tactile)
+        self.dtype = record_dtype(self.layout)
+        self.batch_size = batch_size
+        self._batch = np.zeros(batch_size, dtype=self.dtype)
+        self._pending = 0
+        self.count = 0
+        """已追加的记录数（包括尚未写入文件的）"""
+
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            existing, header_size = read_header(path)
+            if existing != self.layout:
+                raise ValueError(f"文件 {path} 的记录布局与当前布局不一致，无法追加")
+            data_size = os.path.getsize(path) - header_size
+            self.count = data_size // self.dtype.itemsize
+            self._file = open(path, "r+b")  # pylint: disable=consider-using-with
+            # 丢弃上次异常退出时残留的不完整记录
+            self._file.truncate(header_size + self.count * self.dtype.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, "wb")  # pylint: disable=consider-using-with
+            self._file.write(_encode_header(self.layout))
+        logger.info("开始录制会话: %s，记录长度 %d 字节", path, self.dtype.itemsize)
+
+    @property
+    def record_size(self) -> int:
+        """单条记录的字节数"""
+        return self.dtype.itemsize
+
+    def append(self, state: HandState, tactile: Optional[TactileFrame | Sequence[int]] = None,
+               timestamp: Optional[float] = None) -> None:
+        """
+        追加一条记录
+
+        Args:
+            state: 状态快照，记录设定值块时需包含设定值
+            tactile: 触觉帧或全手一维触觉数据，记录触觉数据时必须提供
+            timestamp: 时间戳，默认使用 state.timestamp
+
+        Raises:
+            ValueError: 当缺少布局要求的数据时抛出
+        """
+        fill_record(self.layout, self._batch[self._pending], state, tactile, timestamp)
+        self._pending += 1
+        self.count += 1
+        if self._pending == self.batch_size:
+            self.flush()
+
+    def capture(self, client: Any) -> None:
+        """
+        从客户端读取一次状态快照（及触觉帧）并追加
+
+        Args:
+            client: RH56DFTPClient
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        state = client.read_state(include_setpoints=bool(self.layout["setpoint_groups"]))
+        tactile = client.read_tactile_tensor() if self.layout["tactile"] else None
+        self.append(state, tactile)
+
+    def flush(self) -> None:
+        """将内存批次中的记录写入文件"""
+        if self._pending:
+            self._file.write(self._batch[:self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """写入剩余记录并关闭文件"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        logger.info("会话录制结束: %s，共 %d 条记录", self.path, self.count)
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SessionRecording:
+    """
+    录制文件的内存映射读取器
+
+    records 为结构化数组，各字段均为文件的只读视图，不复制数据
+
+    Example::
+
+        recording = SessionRecording("session.rec")
+        recording.timestamps                       # (N,) float64
+        recording.group("FORCE_ACT")               # (N, 6) int16
+        recording.pad("TACTILE_PALM_8x14")         # (N, 8, 14) int16
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 录制文件路径
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            ValueError: 当文件不是录制文件时抛出
+        """
+        _require_numpy()
+        self.path = path
+        self.layout, self.header_size = read_header(path)
+        self.dtype = record_dtype(self.layout)
+        # 忽略末尾不完整的记录（录制异常中断时可能出现）
+        count = (os.path.getsize(path) - self.header_size) // self.dtype.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r",
+                                     offset=self.header_size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+        self._tactile = {
+            entry["name"]: (entry["offset"], tuple(entry["shape"]))
+            for entry in self.layout["tactile"]
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """(N,) 各记录的时间戳"""
+        return self.records["timestamp"]
+
+    @property
+    def state(self) -> "np.ndarray":
+        """(N, 4, 6) 状态块，第二维依次为 FORCE_ACT、CURRENT、ERROR、TEMP"""
+        return self.records["state"]
+
+    @property
+    def setpoints(self) -> Optional["np.ndarray"]:
+        """(N, 2, 6) 设定值块，第二维依次为 ANGLE_SET、POS_SET；未录制时为None"""
+        return self.records["setpoints"] if self.layout["setpoint_groups"] else None
+
+    @property
+    def tactile(self) -> Optional["np.ndarray"]:
+        """(N, 触觉点数) 全手触觉数据；未录制时为None"""
+        return self.records["tactile"] if self.layout["tactile"] else None
+
+    @property
+    def tactile_names(self) -> List[RegisterName]:
+        """已录制的触觉寄存器名称，按地址排序"""
+        return list(self._tactile)
+
+    def group(self, prefix: str) -> "np.ndarray":
+        """
+        获取一组寄存器的全部记录
+
+        Args:
+            prefix: 寄存器组前缀，如 "FORCE_ACT"、"ANGLE_SET"
+
+        Returns:
+            (N, 6) 视图
+
+        Raises:
+            KeyError: 当该组未录制时抛出
+        """
+        if prefix in self.layout["state_groups"]:
+            return self.state[:, self.layout["state_groups"].index(prefix)]
+        if prefix in self.layout["setpoint_groups"]:
+            return self.setpoints[:, self.layout["setpoint_groups"].index(prefix)]
+        raise KeyError(f"寄存器组 {prefix} 未录制")
+
+    def pad(self, register_name: RegisterName) -> "np.ndarray":
+        """
+        获取一个触觉区域的全部记录
+
+        Args:
+            register_name: 触觉寄存器名称
+
+        Returns:
+            (N, 行数, 列数) 视图
+
+        Raises:
+            KeyError: 当该触觉寄存器未录制时抛出
+        """
+        if register_name not in self._tactile:
+            raise KeyError(f"触觉寄存器 {register_name} 未录制")
+        offset, shape = self._tactile[register_name]
+        size = shape[0] * shape[1]
+        return self.tactile[:, offset:offset + size].reshape((len(self),) + shape)
+
+    def state_at(self, index: int) -> HandState:
+        """
+        将一条记录还原为状态快照
+
+        Args:
+            index: 记录序号
+
+        Returns:
+            状态快照
+        """
+        return record_state(self.layout, self.records[index])
+
+    def frame_at(self, index: int) -> TactileFrame:
+        """
+        将一条记录的触觉数据还原为触觉帧（视图，不复制数据）
+
+        Args:
+            index: 记录序号
+
+        Returns:
+            触觉帧
+
+        Raises:
+            ValueError: 当未录制触觉数据时抛出
+        """
+        if not self.layout["tactile"]:
+            raise ValueError("录制文件中没有触觉数据")
+        return record_frame(self.layout, self.records[index])
+
+    def index_at(self, timestamp: float) -> int:
+        """
+        查找时间戳不晚于给定时间的最后一条记录
+
+        Args:
+            timestamp: 时间戳
+
+        Returns:
+            记录序号，早于第一条记录时返回0
+        """
+        return max(int(np.searchsorted(self.timestamps, timestamp, side="right")) - 1, 0)
+
+    def close(self) -> None:
+        """释放对内存映射的引用，已取出的视图仍然有效"""
+        self.records = np.zeros(0, dtype=self.dtype)
+
+    def __enter__(self) -> "SessionRecording":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,478 @@
+"""
+RH56DFTP 回放模块，从会话录制文件提供寄存器值，用于离线测试与性能分析
+
+需要安装可选依赖 numpy: pip install plusml-rh56dftp[numpy]
+
+回放速度可选：
+- speed=1.0: 按录制时的时间推进
+- speed>1: 按倍速推进
+- speed=None: 尽可能快，同一寄存器在当前记录中被再次读取时前进一条记录，
+  每次循环读取一次 read_state() 与 read_tactile_tensor() 时每条记录恰好被处理一次
+
+不循环回放时，播放到末尾后读取录制的寄存器会抛出 EOFError
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterBuild.RegisterFactory import register_factory
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_base import RH56DFTPBase
+from .RH56DFTP_codec import validate_write
+from .RH56DFTP_decode import TactileFrame, decode_array
+from .RH56DFTP_index import lookup_register, build_register_index
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_recording import SessionRecording
+from .RH56DFTP_state import DOF_COUNT, POSE_PREFIXES, HandState, group_register_names
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class RH56DFTPReplay(RH56DFTPBase):
+    """
+    会话回放客户端，接口与 RH56DFTPClient 的读写方法一致
+
+    录制文件中的寄存器返回当前回放位置的值；写入只做校验并保存在内存中，
+    之后读取该寄存器返回写入的值；既未录制也未写入的寄存器返回配置的默认值（未配置时为0）
+
+    Example::
+
+        replay = RH56DFTPReplay("session.rec", speed=None)
+        try:
+            while True:
+                state = replay.read_state()
+                frame = replay.read_tactile_tensor()
+        except EOFError:
+            pass
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = False,
+                 config_folder_path: str = None):
+        """
+        Args:
+            path: 录制文件路径
+            speed: 回放倍速，1.0为实时，None为尽可能快
+            loop: 播放到末尾后是否从头循环
+            config_folder_path: 寄存器配置文件夹路径，默认为包内的配置路径
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            ValueError: 当文件无效、为空或倍速不合法时抛出
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"回放倍速必须为正数: {speed}")
+        self.recording = SessionRecording(path)
+        if len(self.recording) == 0:
+            raise ValueError(f"录制文件 {path} 中没有记录")
+        self.registers: Dict[RegisterName, Register_FTP] = register_factory.create_registers(
+            config_folder_path=None,
+            strategy_name='ftp'
+        )
+        self._register_index = build_register_index(self.registers)
+        self.speed = speed
+        self.loop = loop
+        self.is_connected = True
+
+        # 已录制寄存器 -> 取值方式
+        layout = self.recording.layout
+        self._recorded: Dict[RegisterName, Any] = {}
+        for field, groups in (("state", layout["state_groups"]),
+                              ("setpoints", layout["setpoint_groups"])):
+            for group_index, prefix in enumerate(groups):
+                for dof, register_name in enumerate(group_register_names(prefix)):
+                    self._recorded[register_name] = (field, group_index, dof)
+        for register_name in self.recording.tactile_names:
+            self._recorded[register_name] = ("tactile",)
+        self._state_names = [
+            name for name, source in self._recorded.items() if source[0] == "state"
+        ]
+        self._setpoint_names = [
+            name for name, source in self._recorded.items() if source[0] == "setpoints"
+        ]
+
+        self.writes: Dict[RegisterName, Any] = {}
+        """回放期间写入的值"""
+
+        self._timestamps = self.recording.timestamps
+        self._duration = float(self._timestamps[-1] - self._timestamps[0])
+        self._cursor = 0
+        self._consumed: Set[RegisterName] = set()
+        self._finished = False
+        self._started = time.monotonic()
+        logger.info("开始回放会话: %s，共 %d 条记录，时长 %.1f 秒，倍速 %s",
+                    path, len(self.recording), self._duration, speed or "最快")
+
+    @property
+    def position(self) -> int:
+        """当前回放位置的记录序号"""
+        if self.speed is not None:
+            self._cursor = self._clock_index()
+        return self._cursor
+
+    @property
+    def finished(self) -> bool:
+        """是否已播放到末尾（循环回放时始终为False）"""
+        if self.speed is not None:
+            self._clock_index()
+        return self._finished
+
+    def _clock_index(self) -> int:
+        """按回放时钟计算当前记录序号"""
+        elapsed = (time.monotonic() - self._started) * self.speed
+        if elapsed > self._duration:
+            if self.loop and self._duration > 0:
+                elapsed %= self._duration
+            else:
+                self._finished = True
+                return len(self.recording) - 1
+        return self.recording.index_at(self._timestamps[0] + elapsed)
+
+    def seek(self, index: int) -> None:
+        """
+        跳转到指定记录，按时钟回放时从该记录的时间继续
+
+        Args:
+            index: 记录序号
+
+        Raises:
+            IndexError: 当序号超出范围时抛出
+        """
+        if not 0 <= index < len(self.recording):
+            raise IndexError(f"记录序号 {index} 超出范围 [0, {len(self.recording) - 1}]")
+        self._cursor = index
+        self._consumed.clear()
+        self._finished = False
+        if self.speed is not None:
+            offset = float(self._timestamps[index] - self._timestamps[0])
+            self._started = time.monotonic() - offset / self.speed
+
+    def rewind(self) -> None:
+        """回到录制开头"""
+        self.seek(0)
+
+    def step(self, count: int = 1) -> bool:
+        """
+        前进若干条记录（仅用于最快回放）
+
+        Args:
+            count: 前进的记录数
+
+        Returns:
+            是否仍有记录，播放到末尾且不循环时返回False
+        """
+        target = self._cursor + count
+        if target >= len(self.recording):
+            if self.loop:
+                target %= len(self.recording)
+            else:
+                self._finished = True
+                target = len(self.recording) - 1
+        self._cursor = target
+        self._consumed.clear()
+        return not self._finished
+
+    def _record_index(self, register_names: Iterable[RegisterName]) -> int:
+        """
+        确定本次读取使用的记录序号
+
+        最快回放时，本次读取的寄存器若已在当前记录中读取过，先前进一条记录
+
+        Raises:
+            EOFError: 当已播放到末尾时抛出
+        """
+        if self.speed is not None:
+            self._cursor = self._clock_index()
+        else:
+            names = set(register_names)
+            if names & self._consumed and not self._finished:
+                self.step()
+            self._consumed |= names
+        if self._finished:
+            raise EOFError("回放已结束")
+        return self._cursor
+
+    def _describe_name(self, register_name: RegisterName | callable) -> RegisterName:
+        """将寄存器名称或函数对象解析为寄存器名称"""
+        descriptor = lookup_register(self._register_index, register_name)
+        if descriptor is not None:
+            return descriptor.name
+        return register_name.__name__ if callable(register_name) else register_name
+
+    def _value_at(self, index: int, register_name: RegisterName) -> Any:
+        """获取记录中寄存器的值，格式与 RH56DFTPClient.get() 一致"""
+        source = self._recorded[register_name]
+        if source[0] == "tactile":
+            values = self.recording.pad(register_name)[index].ravel()
+            # 还原为原始寄存器字：每个值后跟一个占位字
+            words = np.zeros(values.size * 2, dtype=np.uint16)
+            words[0::2] = values.view(np.uint16)
+            return words.tolist()
+        field, group_index, dof = source
+        return int(self.recording.records[index][field][group_index][dof])
+
+    def _default_value(self, register_name: RegisterName) -> Any:
+        """未录制寄存器的值：回放期间写入的值或配置的默认值（未配置时为0，与模拟器一致）"""
+        if register_name in self.writes:
+            return self.writes[register_name]
+        default_value = self.registers[register_name].default_value
+        return 0 if default_value is None else default_value
+
+    def get(self, register_name: RegisterName | callable, verify: bool = False) -> Any:
+        """
+        获取当前回放位置的寄存器值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            verify: 是否在读取前确认回放仍有记录可读，相当于对设备的同步探测
+
+        Returns:
+            寄存器的值
+
+        Raises:
+            ConnectionError: 当回放已关闭，或 verify 为True且已播放到末尾时抛出
+            ValueError: 当寄存器不存在时抛出
+            EOFError: 当不循环回放且已播放到末尾时抛出
+        """
+        if not self._check_connect(verify):
+            raise ConnectionError("回放已关闭或已结束")
+        register_name = self._describe_name(register_name)
+        if register_name not in self.registers:
+            logger.error("读取寄存器 %s 失败: 寄存器不存在", register_name)
+            raise ValueError(f"寄存器 {register_name} 不存在")
+        if register_name in self.writes or register_name not in self._recorded:
+            return self._default_value(register_name)
+        return self._value_at(self._record_index([register_name]), register_name)
+
+    def read_many(self, register_names: Iterable[RegisterName | callable],
+                  verify: bool = False) -> Dict[RegisterName, Any]:
+        """
+        读取当前回放位置的一组寄存器（来自同一条记录）
+
+        Args:
+            register_names: 寄存器名称或寄存器函数对象序列
+            verify: 是否在读取前确认回放仍有记录可读，相当于对设备的同步探测
+
+        Returns:
+            寄存器名称 -> 值
+
+        Raises:
+            ConnectionError: 当回放已关闭，或 verify 为True且已播放到末尾时抛出
+            ValueError: 当寄存器不存在时抛出
+            EOFError: 当不循环回放且已播放到末尾时抛出
+        """
+        if not self._check_connect(verify):
+            raise ConnectionError("回放已关闭或已结束")
+        names = [self._describe_name(name) for name in register_names]
+        for register_name in names:
+            if register_name not in self.registers:
+                raise ValueError(f"寄存器 {register_name} 不存在")
+        recorded = [
+            name for name in names if name in self._recorded and name not in self.writes
+        ]
+        index = self._record_index(recorded)
+        return {
+            name: self._value_at(index, name) if name in recorded else self._default_value(name)
+            for name in names
+        }
+
+    def read_state(self, include_setpoints: bool = False) -> HandState:
+        """
+        读取当前回放位置的整手状态快照
+
+        Args:
+            include_setpoints: 是否包含设定值；未录制设定值时使用回放期间写入的值或默认值
+
+        Returns:
+            整手状态快照，时间戳为录制时的时间戳
+
+        Raises:
+            EOFError: 当不循环回放且已播放到末尾时抛出
+        """
+        names = self._state_names + (self._setpoint_names if include_setpoints else [])
+        index = self._record_index(names)
+        state = self.recording.state_at(index)
+        if not include_setpoints:
+            return HandState(state.force_act, state.current, state.error, state.temp,
+                             timestamp=state.timestamp)
+        setpoints = {}
+        for prefix in POSE_PREFIXES.values():
+            names = group_register_names(prefix)
+            if all(name in self._recorded and name not in self.writes for name in names):
+                setpoints[prefix.lower()] = getattr(state, prefix.lower())
+            else:
+                setpoints[prefix.lower()] = tuple(
+                    self._value_at(index, name)
+                    if name in self._recorded and name not in self.writes
+                    else self._default_value(name)
+                    for name in names
+                )
+        return HandState(state.force_act, state.current, state.error, state.temp,
+                         timestamp=state.timestamp, **setpoints)
+
+    def read_tactile_tensor(self) -> TactileFrame:
+        """
+        读取当前回放位置的整帧触觉数据
+
+        Returns:
+            触觉帧，数据为录制文件的只读视图
+
+        Raises:
+            ValueError: 当录制文件中没有触觉数据时抛出
+            EOFError: 当不循环回放且已播放到末尾时抛出
+        """
+        names = self.recording.tactile_names
+        if not names:
+            raise ValueError("录制文件中没有触觉数据")
+        return self.recording.frame_at(self._record_index(names))
+
+    def read_tactile_frame(self) -> Dict[RegisterName, List[int]]:
+        """
+        读取当前回放位置的整帧触觉数据，格式与 RH56DFTPClient.read_tactile_frame() 一致
+
+        Returns:
+            触觉寄存器名称 -> 原始寄存器值列表
+
+        Raises:
+            ValueError: 当录制文件中没有触觉数据时抛出
+            EOFError: 当不循环回放且已播放到末尾时抛出
+        """
+        names = self.recording.tactile_names
+        if not names:
+            raise ValueError("录制文件中没有触觉数据")
+        index = self._record_index(names)
+        return {name: self._value_at(index, name) for name in names}
+
+    def get_array(self, register_name: RegisterName | callable) -> "np.ndarray":
+        """
+        读取寄存器并解码为NumPy数组
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+
+        Returns:
+            解码后的数组
+        """
+        register_name = self._describe_name(register_name)
+        value = self.get(register_name)
+        words = value if isinstance(value, list) else [value & 0xFFFF]
+        return decode_array(self.registers[register_name], words)
+
+    def set(self, register_name: RegisterName | callable, value: Any,
+            verify: bool = False) -> bool:
+        """
+        校验并保存写入的值，不影响录制数据
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            value: 要设置的值
+            verify: 是否在写入前确认回放仍有记录可读，相当于对设备的同步探测
+
+        Returns:
+            值是否合法，回放已关闭（或 verify 为True且已播放到末尾）时返回False
+        """
+        register_name = self._describe_name(register_name)
+        if not self._check_connect(verify):
+            logger.error("设置寄存器 %s 失败: 回放已关闭或已结束", register_name)
+            return False
+        if register_name not in self.registers:
+            logger.error("设置寄存器 %s 失败: 寄存器不存在", register_name)
+            return False
+        reason = validate_write(self.registers[register_name], value)
+        if reason:
+            logger.error("设置寄存器 %s 失败: %s", register_name, reason)
+            return False
+        self.writes[register_name] = value
+        return True
+
+    def set_many(self, values: Dict[RegisterName | callable, Any], verify: bool = False) -> bool:
+        """
+        批量校验并保存写入的值，任一值不合法时不保存任何值
+
+        Args:
+            values: 寄存器名称或寄存器函数对象 -> 要设置的值
+            verify: 是否在写入前确认回放仍有记录可读，相当于对设备的同步探测
+
+        Returns:
+            全部值是否合法，回放已关闭（或 verify 为True且已播放到末尾）时返回False
+        """
+        if not self._check_connect(verify):
+            logger.error("批量设置寄存器失败: 回放已关闭或已结束")
+            return False
+        resolved = {self._describe_name(name): value for name, value in values.items()}
+        for register_name, value in resolved.items():
+            if register_name not in self.registers:
+                logger.error("批量设置寄存器失败: 寄存器 %s 不存在", register_name)
+                return False
+            reason = validate_write(self.registers[register_name], value)
+            if reason:
+                logger.error("批量设置寄存器失败: 寄存器 %s %s", register_name, reason)
+                return False
+        self.writes.update(resolved)
+        return True
+
+    def set_pose(self, values: List[int], mode: str = "angle", verify: bool = False) -> bool:
+        """
+        一次性设置六个自由度的角度或位置设定值
+
+        Args:
+            values: 六个自由度的设定值
+            mode: "angle" 或 "pos"
+            verify: 是否在写入前确认回放仍有记录可读，相当于对设备的同步探测
+
+        Returns:
+            全部值是否合法
+
+        Raises:
+            ValueError: 当值的数量或模式不正确时抛出
+        """
+        if mode not in POSE_PREFIXES:
+            raise ValueError(f"无效的模式: {mode}")
+        if len(values) != DOF_COUNT:
+            raise ValueError(f"需要 {DOF_COUNT} 个设定值，实际为 {len(values)} 个")
+        return self.set_many(dict(zip(group_register_names(POSE_PREFIXES[mode]), values)), verify)
+
+    def get_register(self, register_name: RegisterName) -> Register_FTP:
+        """
+        获取寄存器对象
+
+        Args:
+            register_name: 寄存器名称
+
+        Returns:
+            对应的Register_FTP对象
+
+        Raises:
+            ValueError: 当寄存器不存在时抛出
+        """
+        if register_name not in self.registers:
+            raise ValueError(f"寄存器 {register_name} 不存在")
+        return self.registers[register_name]
+
+    def _check_connect(self, verify: bool = False) -> bool:
+        """
+        回放客户端始终处于连接状态，直到调用 close()
+
+        Args:
+            verify: 是否同时确认仍有记录可读；不循环回放且已播放到末尾时相当于设备不再应答
+
+        Returns:
+            是否未关闭（verify 为True时还要求未播放到末尾）
+        """
+        return self.is_connected and not (verify and self.finished)
+
+    def close(self) -> None:
+        """结束回放并释放录制文件"""
+        self.is_connected = False
+        self.recording.close()
+
+    def __enter__(self) -> "RH56DFTPReplay":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
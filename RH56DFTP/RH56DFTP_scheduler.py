@@ -0,0 +1,199 @@
+"""
+RH56DFTP 请求调度模块，按优先级分配单条Modbus链路的使用权
+
+每次事务开始前按优先级获取链路，释放时交给等待中优先级最高（数值最小）的请求，同级按到达顺序；
+大范围读取按分块逐个获取链路，等待中的写入可以在两个分块之间插入
+
+优先级按功能码与地址确定：
+- command: 写入请求（安全与控制指令）
+- state: 实时状态寄存器读取（FORCE_ACT、CURRENT、ERROR、TEMP）
+- tactile: 触觉寄存器读取
+- config: 其余读取（配置、设定值与心跳探测）
+"""
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import AddressIntervals
+
+# 优先级，数值越小越优先
+PRIORITY_COMMAND = 0
+PRIORITY_STATE = 1
+PRIORITY_TACTILE = 2
+PRIORITY_CONFIG = 3
+# 优先级名称
+PRIORITY_NAMES = {
+    PRIORITY_COMMAND: "command",
+    PRIORITY_STATE: "state",
+    PRIORITY_TACTILE: "tactile",
+    PRIORITY_CONFIG: "config"
+}
+# 读取功能码
+READ_FUNCTION_CODE = 3
+
+
+def register_priority(register: Register_FTP) -> int:
+    """
+    获取读取寄存器时的优先级
+
+    Args:
+        register: 寄存器对象
+
+    Returns:
+        优先级
+    """
+    if register.name.startswith("TACTILE_"):
+        return PRIORITY_TACTILE
+    if register.access_type == "read-only":
+        return PRIORITY_STATE
+    return PRIORITY_CONFIG
+
+
+class RequestScheduler:
+    """
+    按优先级分配链路使用权的锁，不可重入
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP]):
+        """
+        Args:
+            registers: 寄存器对象字典，用于按地址确定读取优先级
+        """
+        self._priorities = AddressIntervals(
+            registers, lambda _, register: register_priority(register), PRIORITY_CONFIG
+        )
+        self._mutex = threading.Lock()
+        self._cond = threading.Condition(self._mutex)
+        self._waiters: List[List[int]] = []
+        self._order = itertools.count()
+        self._holder: Optional[int] = None
+        self._acquired = [0] * len(PRIORITY_NAMES)
+        self._wait_total = [0.0] * len(PRIORITY_NAMES)
+        self._wait_max = [0.0] * len(PRIORITY_NAMES)
+
+    def classify(self, function_code: int, address: int, count: int) -> int:
+        """
+        确定一次请求的优先级
+
+        Args:
+            function_code: Modbus功能码
+            address: 起始地址
+            count: 寄存器数量
+
+        Returns:
+            优先级；跨越多类寄存器的读取取其中最高的优先级
+        """
+        if function_code != READ_FUNCTION_CODE:
+            return PRIORITY_COMMAND
+        return min(self._priorities.lookup(address), self._priorities.lookup(address + count - 1))
+
+    def acquire(self, priority: int) -> None:
+        """
+        获取链路使用权，阻塞直到轮到本请求
+
+        Args:
+            priority: 优先级
+        """
+        # 直接使用底层锁，避免 Condition.__enter__ 的Python层调用
+        with self._mutex:
+            self._acquired[priority] += 1
+            if self._holder is None and not self._waiters:
+                # 无竞争时直接获取，不计时
+                self._holder = priority
+                return
+            started = time.perf_counter()
+            entry = [priority, next(self._order)]
+            heapq.heappush(self._waiters, entry)
+            granted = False
+            try:
+                while self._holder is not None or self._waiters[0] is not entry:
+                    self._cond.wait()
+                granted = True
+            finally:
+                self._withdraw(entry, granted)
+            self._holder = priority
+            waited = time.perf_counter() - started
+            self._wait_total[priority] += waited
+            if waited > self._wait_max[priority]:
+                self._wait_max[priority] = waited
+
+    def _withdraw(self, entry: List[int], granted: bool) -> None:
+        """
+        从等待队列中移除请求，调用方持有锁
+
+        Args:
+            entry: 请求的队列项
+            granted: 是否已轮到该请求；为False表示等待被中断（如 KeyboardInterrupt），
+                此时该项可能不在堆顶，移除后唤醒其他等待者，避免它们一直排在已放弃的请求之后
+        """
+        if self._waiters[0] is entry:
+            heapq.heappop(self._waiters)
+        else:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+        if not granted and self._holder is None and self._waiters:
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        """释放链路使用权"""
+        with self._mutex:
+            self._holder = None
+            if self._waiters:
+                self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: int) -> Iterator[None]:
+        """
+        在上下文中持有链路使用权
+
+        Args:
+            priority: 优先级
+        """
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def preempt_requested(self, priority: int) -> bool:
+        """
+        是否有更高优先级的请求在等待，持有者应在当前分块完成后释放链路
+
+        Args:
+            priority: 持有者的优先级
+
+        Returns:
+            是否需要让出链路
+        """
+        with self._cond:
+            return bool(self._waiters) and self._waiters[0][0] < priority
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        获取各优先级的等待统计
+
+        Returns:
+            优先级名称 -> {"acquired": 获取次数, "wait_mean": 平均等待(秒), "wait_max": 最大等待(秒)}
+        """
+        with self._cond:
+            return {
+                name: {
+                    "acquired": self._acquired[priority],
+                    "wait_mean": (self._wait_total[priority] / self._acquired[priority]
+                                  if self._acquired[priority] else 0.0),
+                    "wait_max": self._wait_max[priority]
+                }
+                for priority, name in PRIORITY_NAMES.items()
+            }
+
+    def reset_stats(self) -> None:
+        """清空等待统计"""
+        with self._cond:
+            self._acquired = [0] * len(PRIORITY_NAMES)
+            self._wait_total = [0.0] * len(PRIORITY_NAMES)
+            self._wait_max = [0.0] * len(PRIORITY_NAMES)
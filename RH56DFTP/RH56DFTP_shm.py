@@ -0,0 +1,452 @@
+"""
+RH56DFTP 共享内存发布模块，一个进程读取设备并发布最新的状态快照与触觉帧，
+本机任意数量的进程通过共享内存读取，无需各自建立Modbus连接
+
+需要安装可选依赖 numpy: pip install plusml-rh56dftp[numpy]
+
+共享内存段使用双缓冲加序列锁（seqlock）：发布者交替写入两个槽位，写入前后各将槽位序号加一
+（写入期间为奇数），完成后更新发布计数；读取者读取最新槽位前后的序号一致且为偶数时数据有效。
+记录格式与会话录制文件相同（见 RH56DFTP_recording）
+
+共享内存段布局（小端）::
+
+    magic(8) | 版本(uint32) | 控制区与文件头总长度(uint32) | 槽位长度(uint32) | 填充
+    偏移32: 发布计数(uint64) | 槽位0序号(uint64) | 槽位1序号(uint64) | 填充
+    偏移64: JSON记录布局（空格填充到64字节对齐）
+    槽位0 | 槽位1
+"""
+import json
+import logging
+import struct
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Optional, Sequence, Set
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_decode import TactileFrame
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_recording import build_layout, fill_record, record_dtype, record_frame, record_state
+from .RH56DFTP_state import HandState
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 共享内存段标识
+SHM_MAGIC = b"RH56SHM\x00"
+# 共享内存段格式版本
+SHM_VERSION = 1
+# 槽位数量（双缓冲）
+SLOT_COUNT = 2
+# 对齐字节数
+SHM_ALIGNMENT = 64
+# 默认共享内存段名称
+DEFAULT_SHM_NAME = "rh56dftp"
+# 固定头部：magic、版本、头部总长度、槽位长度
+_PREAMBLE = struct.Struct("<8sIII")
+# 控制字（发布计数与各槽位序号）的偏移
+_CONTROL_OFFSET = 32
+# JSON记录布局的偏移
+_LAYOUT_OFFSET = 64
+# 本进程中发布者创建的共享内存段，同进程的读取者不能注销其 resource_tracker 登记
+_published_names: Set[str] = set()
+
+
+def _require_numpy() -> None:
+    """检查numpy是否可用"""
+    if np is None:
+        raise ImportError("共享内存发布需要安装numpy: pip install plusml-rh56dftp[numpy]")
+
+
+def _align(size: int) -> int:
+    """向上对齐到 SHM_ALIGNMENT"""
+    return size + (-size % SHM_ALIGNMENT)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    连接已存在的共享内存段，不交给 resource_tracker 管理
+
+    读取进程退出时不应删除发布者创建的共享内存段
+    """
+    if sys.version_info >= (3, 13):
+        # 低版本解释器上运行 pylint 时标准库没有 track 参数
+        return shared_memory.SharedMemory(  # pylint: disable=unexpected-keyword-arg
+            name=name, track=False
+        )
+    shm = shared_memory.SharedMemory(name=name)
+    if shm.name not in _published_names:
+        resource_tracker.unregister(shm._name, "shared_memory")  # pylint: disable=protected-access
+    return shm
+
+
+class SharedStatePublisher:
+    """
+    共享内存发布者，在设备读取进程中使用
+
+    Example::
+
+        publisher = SharedStatePublisher(client.registers, name="rh56dftp")
+        publisher.start(client, rate_hz=100)   # 后台线程读取并发布
+        ...
+        publisher.close()
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 name: Optional[str] = DEFAULT_SHM_NAME, include_setpoints: bool = False,
+                 include_tactile: bool = True):
+        """
+        Args:
+            registers: 寄存器对象字典，用于计算记录布局
+            name: 共享内存段名称，为None时由系统生成
+            include_setpoints: 是否发布设定值块
+            include_tactile: 是否发布整帧触觉数据
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            FileExistsError: 当同名共享内存段已存在时抛出
+        """
+        _require_numpy()
+        self.layout = build_layout(registers, include_setpoints, include_tactile)
+        self.dtype = record_dtype(self.layout)
+        layout_bytes = json.dumps(self.layout, ensure_ascii=False).encode("utf-8")
+        header_size = _align(_LAYOUT_OFFSET + len(layout_bytes))
+        slot_stride = _align(self.dtype.itemsize)
+
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=header_size + SLOT_COUNT * slot_stride
+        )
+        _published_names.add(self._shm.name)
+        buf = self._shm.buf
+        _PREAMBLE.pack_into(buf, 0, SHM_MAGIC, SHM_VERSION, header_size, slot_stride)
+        buf[_LAYOUT_OFFSET:header_size] = layout_bytes.ljust(header_size - _LAYOUT_OFFSET, b" ")
+
+        self._control = np.ndarray((1 + SLOT_COUNT,), dtype="<u8", buffer=buf,
+                                   offset=_CONTROL_OFFSET)
+        self._control[:] = 0
+        self._slots = [
+            np.ndarray((), dtype=self.dtype, buffer=buf, offset=header_size + i * slot_stride)
+            for i in range(SLOT_COUNT)
+        ]
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        logger.info("已创建共享内存段 %s，槽位长度 %d 字节", self.name, slot_stride)
+
+    @property
+    def name(self) -> str:
+        """共享内存段名称，读取者按此名称连接"""
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """已发布的次数"""
+        return int(self._control[0])
+
+    def publish(self, state: HandState, tactile: Optional[TactileFrame | Sequence[int]] = None,
+                timestamp: Optional[float] = None) -> int:
+        """
+        发布一次状态快照（及触觉帧）
+
+        Args:
+            state: 状态快照，发布设定值块时需包含设定值
+            tactile: 触觉帧或全手一维触觉数据，发布触觉数据时必须提供
+            timestamp: 时间戳，默认使用 state.timestamp
+
+        Returns:
+            本次发布的序号（从1开始）
+
+        Raises:
+            ValueError: 当缺少布局要求的数据时抛出
+        """
+        with self._lock:
+            control = self._control
+            sequence = int(control[0]) + 1
+            slot = sequence % SLOT_COUNT
+            control[1 + slot] += 1           # 奇数：写入中
+            try:
+                fill_record(self.layout, self._slots[slot], state, tactile, timestamp)
+            finally:
+                control[1 + slot] += 1       # 偶数：写入完成
+            control[0] = sequence
+            return sequence
+
+    def capture(self, client: Any) -> int:
+        """
+        从客户端读取一次状态快照（及触觉帧）并发布
+
+        Args:
+            client: RH56DFTPClient
+
+        Returns:
+            本次发布的序号
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        state = client.read_state(include_setpoints=bool(self.layout["setpoint_groups"]))
+        tactile = client.read_tactile_tensor() if self.layout["tactile"] else None
+        return self.publish(state, tactile)
+
+    def start(self, client: Any, rate_hz: float) -> None:
+        """
+        在后台线程中按固定频率读取并发布，已启动时不做任何操作
+
+        Args:
+            client: RH56DFTPClient
+            rate_hz: 发布频率（Hz）
+
+        Raises:
+            ValueError: 当频率不是正数时抛出
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"发布频率必须为正数: {rate_hz}")
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(client, 1.0 / rate_hz), name="RH56DFTP-shm", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, client: Any, period: float) -> None:
+        """发布线程主体"""
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.capture(client)
+            except (ConnectionError, ValueError) as e:
+                logger.warning("共享内存发布读取失败: %s", str(e))
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # 超时则从当前时间重新对齐
+                deadline = time.monotonic()
+            elif self._stop_event.wait(delay):
+                break
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        停止后台发布线程
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self, unlink: bool = True) -> None:
+        """
+        停止发布并关闭共享内存段
+
+        Args:
+            unlink: 是否删除共享内存段，读取者已连接的映射在其关闭前仍然有效
+        """
+        self.stop()
+        if self._shm is None:
+            return
+        self._control = None
+        self._slots = []
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+        _published_names.discard(self._shm.name)
+        self._shm = None
+
+    def __enter__(self) -> "SharedStatePublisher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SharedSnapshot:
+    """
+    一次读取得到的快照
+
+    copy=False 时各字段为共享内存的视图，发布者两次发布后槽位会被覆盖；
+    处理完视图后可调用 valid() 确认数据在处理期间未被覆盖
+    """
+
+    def __init__(self, reader: "SharedStateReader", sequence: int, slot: int, slot_sequence: int,
+                 record: "np.ndarray"):
+        self._reader = reader
+        self.sequence = sequence
+        """发布序号"""
+        self._slot = slot
+        self._slot_sequence = slot_sequence
+        self.record = record
+        """结构化记录（0维数组）"""
+
+    @property
+    def timestamp(self) -> float:
+        """发布时的时间戳"""
+        return float(self.record["timestamp"])
+
+    @property
+    def state(self) -> "np.ndarray":
+        """(4, 6) 状态块，依次为 FORCE_ACT、CURRENT、ERROR、TEMP"""
+        return self.record["state"]
+
+    @property
+    def setpoints(self) -> Optional["np.ndarray"]:
+        """(2, 6) 设定值块，依次为 ANGLE_SET、POS_SET；未发布时为None"""
+        return self.record["setpoints"] if self._reader.layout["setpoint_groups"] else None
+
+    @property
+    def tactile(self) -> Optional["np.ndarray"]:
+        """全手一维触觉数据；未发布时为None"""
+        return self.record["tactile"] if self._reader.layout["tactile"] else None
+
+    def frame(self) -> TactileFrame:
+        """
+        触觉帧，各触觉区域为二维视图
+
+        Raises:
+            ValueError: 当未发布触觉数据时抛出
+        """
+        return record_frame(self._reader.layout, self.record)
+
+    def hand_state(self) -> HandState:
+        """还原为状态快照"""
+        return record_state(self._reader.layout, self.record)
+
+    def valid(self) -> bool:
+        """数据是否仍与读取时一致（未被发布者覆盖）"""
+        return self._reader.slot_sequence(self._slot) == self._slot_sequence
+
+
+class SharedStateReader:
+    """
+    共享内存读取者，可在任意本机进程中使用
+
+    Example::
+
+        reader = SharedStateReader("rh56dftp")
+        snapshot = reader.wait(timeout=1.0)
+        palm = snapshot.frame()["TACTILE_PALM_8x14"]   # (8, 14) 视图
+        if snapshot.valid():
+            ...
+    """
+
+    def __init__(self, name: str = DEFAULT_SHM_NAME):
+        """
+        Args:
+            name: 共享内存段名称
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            FileNotFoundError: 当共享内存段不存在时抛出
+            ValueError: 当共享内存段格式不正确时抛出
+        """
+        _require_numpy()
+        self._shm = _attach(name)
+        buf = self._shm.buf
+        magic, version, header_size, slot_stride = _PREAMBLE.unpack_from(buf, 0)
+        if magic != SHM_MAGIC or version != SHM_VERSION:
+            self._shm.close()
+            raise ValueError(f"共享内存段 {name} 不是有效的发布段")
+        layout_bytes = bytes(buf[_LAYOUT_OFFSET:header_size])
+        self.layout: Dict[str, Any] = json.loads(layout_bytes.decode("utf-8"))
+        self.dtype = record_dtype(self.layout)
+        self._control = np.ndarray((1 + SLOT_COUNT,), dtype="<u8", buffer=buf,
+                                   offset=_CONTROL_OFFSET)
+        self._slots = [
+            np.ndarray((), dtype=self.dtype, buffer=buf, offset=header_size + i * slot_stride)
+            for i in range(SLOT_COUNT)
+        ]
+        for slot in self._slots:
+            slot.flags.writeable = False
+
+    @property
+    def sequence(self) -> int:
+        """发布者已发布的次数"""
+        return int(self._control[0])
+
+    def slot_sequence(self, slot: int) -> int:
+        """
+        获取槽位的序号
+
+        Args:
+            slot: 槽位编号
+
+        Returns:
+            槽位序号，奇数表示正在写入
+        """
+        return int(self._control[1 + slot])
+
+    def read(self, copy: bool = False) -> Optional[SharedSnapshot]:
+        """
+        读取最新发布的快照
+
+        Args:
+            copy: 是否复制数据；为False时返回共享内存的视图（零拷贝）
+
+        Returns:
+            快照，尚未发布过时返回None
+        """
+        control = self._control
+        while True:
+            sequence = int(control[0])
+            if sequence == 0:
+                return None
+            slot = sequence % SLOT_COUNT
+            before = int(control[1 + slot])
+            if before % 2:
+                continue
+            record = self._slots[slot]
+            if copy:
+                record = record.copy()
+            # 读取期间槽位未被改写，且该槽位未被更新的发布复用
+            if int(control[1 + slot]) == before and int(control[0]) < sequence + SLOT_COUNT:
+                return SharedSnapshot(self, sequence, slot, before, record)
+
+    def wait(self, after: Optional[int] = None, timeout: Optional[float] = None,
+             copy: bool = False, poll_interval: float = 0.0005) -> Optional[SharedSnapshot]:
+        """
+        等待新的发布
+
+        Args:
+            after: 等待序号大于该值的发布，默认为当前序号
+            timeout: 最长等待时间（秒），为None时一直等待
+            copy: 是否复制数据
+            poll_interval: 轮询间隔（秒）
+
+        Returns:
+            快照，超时时返回None
+        """
+        after = self.sequence if after is None else after
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.sequence <= after:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+        return self.read(copy)
+
+    def close(self) -> None:
+        """断开共享内存段，不删除该段"""
+        if self._shm is None:
+            return
+        self._control = None
+        self._slots = []
+        try:
+            self._shm.close()
+        except BufferError:
+            # 仍有快照视图引用共享内存，映射在其释放后由系统回收
+            logger.debug("共享内存段仍被快照视图引用，延迟释放")
+        self._shm = None
+
+    def __enter__(self) -> "SharedStateReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,416 @@
+"""
+RH56DFTP 本地模拟器模块，基于pymodbus服务端组件在本机模拟设备的Modbus TCP接口
+
+模拟器按 REGISTERS_CONFIG 提供完整的寄存器表：
+- 可写寄存器以配置中的默认值初始化，只读寄存器拒绝写入
+- 触觉、温度、力与电流寄存器按时间生成合成数据
+- 可配置应答延迟、抖动与单次请求的最大寄存器数量
+
+同一连接上的多个请求会依次处理，应答按请求顺序返回，支持客户端的流水线读取
+
+Example::
+
+    with RH56DFTPSimulator(latency=0.002) as simulator:
+        client = RH56DFTPClient("127.0.0.1", simulator.port)
+
+也可以作为独立进程运行: python -m RH56DFTP.RH56DFTP_simulator --port 6000
+"""
+# 标准库导入
+import argparse
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 第三方库导入
+from pymodbus.constants import ExcCodes
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.datastore.context import ModbusBaseDeviceContext
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.server import ModbusTcpServer
+from pymodbus.server.requesthandler import ServerRequestHandler
+
+# 本地库导入
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterBuild.RegisterFactory import register_factory
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import MAX_COUNT_PER_READ, encode_register_words, register_span
+from .RH56DFTP_decode import register_shape
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import DOF_COUNT, group_register_names
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 合成数据的默认刷新频率（Hz）
+DEFAULT_UPDATE_RATE = 100.0
+# 触觉数据的最大值，与配置中的 value_range 一致
+TACTILE_MAX_VALUE = 4096
+
+
+class SimulatorContext(ModbusBaseDeviceContext):
+    """
+    模拟器的寄存器数据区
+
+    只处理保持寄存器，地址与设备手册一致（不做pymodbus默认的+1偏移）
+    """
+
+    def __init__(self, registers: Dict[RegisterName, Register_FTP],
+                 max_registers_per_request: int = MAX_COUNT_PER_READ,
+                 update_rate: float = DEFAULT_UPDATE_RATE,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            registers: 寄存器对象字典
+            max_registers_per_request: 单次请求允许的最大寄存器数量，超过时返回非法数据值异常
+            update_rate: 合成数据的刷新频率（Hz）
+            seed: 随机数种子，指定后合成数据可复现
+        """
+        self.registers = registers
+        self.max_registers_per_request = max_registers_per_request
+        self.update_period = 1.0 / update_rate
+        self._random = random.Random(seed)
+        self._start_time = time.monotonic()
+        self._last_update = -math.inf
+
+        size = max(sum(register_span(register)) for register in registers.values())
+        self.words: List[int] = [0] * size
+        """按地址排列的寄存器字，未映射的地址读出为0"""
+
+        self._writable = set()
+        for register in registers.values():
+            start_address, count = register_span(register)
+            if register.access_type != "read-only":
+                self._writable.update(range(start_address, start_address + count))
+                if register.default_value is not None:
+                    self._store(register, register.default_value)
+
+        self._force_addresses = self._group_addresses("FORCE_ACT")
+        self._current_addresses = self._group_addresses("CURRENT")
+        self._temp_addresses = self._group_addresses("TEMP")
+        # (起始地址, 行数, 列数, 相位)
+        self._tactile_pads: List[Tuple[int, int, int, float]] = []
+        for name, register in registers.items():
+            shape = register_shape(register)
+            if name.startswith("TACTILE_") and shape is not None:
+                phase = self._random.uniform(0, 2 * math.pi)
+                self._tactile_pads.append((register_span(register)[0], *shape, phase))
+
+    def _group_addresses(self, prefix: str) -> List[int]:
+        """获取按自由度排列的寄存器组的起始地址"""
+        return [register_span(self.registers[name])[0] for name in group_register_names(prefix)]
+
+    def reset(self) -> None:
+        """重置合成数据的时间基准"""
+        self._start_time = time.monotonic()
+        self._last_update = -math.inf
+
+    def _store(self, register: Register_FTP, value: Any) -> None:
+        """按寄存器编码写入数据区，不检查访问权限"""
+        start_address, _ = register_span(register)
+        words = encode_register_words(register, value)
+        self.words[start_address:start_address + len(words)] = words
+
+    def _refresh(self) -> None:
+        """按刷新周期生成合成的实时数据"""
+        now = time.monotonic()
+        if now - self._last_update < self.update_period:
+            return
+        self._last_update = now
+        t = now - self._start_time
+
+        words = self.words
+        for dof in range(DOF_COUNT):
+            # 温度缓慢漂移，力与电流带小幅噪声
+            words[self._temp_addresses[dof]] = int(35 + 3 * math.sin(0.05 * t + dof))
+            force = int(200 * math.sin(0.5 * t + dof)) + self._random.randint(-5, 5)
+            words[self._force_addresses[dof]] = force & 0xFFFF
+            words[self._current_addresses[dof]] = 100 + abs(force) // 2
+
+        # 每个触觉区域上有一个沿圆周移动的高斯接触斑
+        for start_address, rows, cols, phase in self._tactile_pads:
+            center_row = (rows - 1) / 2 * (1 + math.sin(t + phase))
+            center_col = (cols - 1) / 2 * (1 + math.cos(t + phase))
+            sigma = max(rows, cols) / 4
+            row_weights = [math.exp(-((row - center_row) ** 2) / (2 * sigma ** 2))
+                           for row in range(rows)]
+            col_weights = [math.exp(-((col - center_col) ** 2) / (2 * sigma ** 2))
+                           for col in range(cols)]
+            address = start_address
+            for row_weight in row_weights:
+                for col_weight in col_weights:
+                    words[address] = int(TACTILE_MAX_VALUE * row_weight * col_weight)
+                    address += 2
+
+    def getValues(self, func_code: int, address: int,
+                  count: int = 1) -> List[int] | ExcCodes:  # pylint: disable=invalid-name
+        """读取保持寄存器"""
+        if self.decode(func_code) != "h":
+            return ExcCodes.ILLEGAL_FUNCTION
+        if count > self.max_registers_per_request:
+            return ExcCodes.ILLEGAL_VALUE
+        if address < 0 or address + count > len(self.words):
+            return ExcCodes.ILLEGAL_ADDRESS
+        self._refresh()
+        return self.words[address:address + count]
+
+    def setValues(self, func_code: int, address: int,
+                  values: List[int]) -> None | ExcCodes:  # pylint: disable=invalid-name
+        """写入保持寄存器，目标地址中包含只读或未映射地址时整次写入被拒绝"""
+        if self.decode(func_code) != "h":
+            return ExcCodes.ILLEGAL_FUNCTION
+        if len(values) > self.max_registers_per_request:
+            return ExcCodes.ILLEGAL_VALUE
+        if not all(addr in self._writable for addr in range(address, address + len(values))):
+            return ExcCodes.ILLEGAL_ADDRESS
+        self.words[address:address + len(values)] = values
+        return None
+
+
+class _SimulatorRequestHandler(ServerRequestHandler):
+    """
+    单个连接的请求处理器
+
+    pymodbus默认每次收到数据只处理一帧，这里拆分缓冲区中的全部请求帧并排队依次处理；
+    应答在模拟延迟后按请求顺序发出，延迟期间继续处理后续请求
+    """
+
+    def __init__(self, owner: "_SimulatorServer", *args):
+        super().__init__(owner, *args)
+        self.simulator = owner.simulator
+        self._requests: "asyncio.Queue[Tuple[Any, Any]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._last_send_at = 0.0
+
+    def callback_data(self, data: bytes, addr: tuple | None = None) -> int:
+        used_len = 0
+        while True:
+            frame_len, pdu = self.framer.handleFrame(data[used_len:], 0, 0)
+            used_len += frame_len
+            if not pdu:
+                break
+            self._requests.put_nowait((pdu, addr))
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._serve())
+        return used_len
+
+    def callback_disconnected(self, exc: Exception | None) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        super().callback_disconnected(exc)
+
+    def send(self, data: bytes, addr: tuple | None = None) -> None:
+        # 父类发送时会清空接收缓冲区，其中可能还有尚未处理的流水线请求
+        recv_buffer = self.recv_buffer
+        super().send(data, addr)
+        self.recv_buffer = recv_buffer
+
+    async def _serve(self) -> None:
+        """依次处理排队的请求"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pdu, addr = await self._requests.get()
+            try:
+                response = await pdu.update_datastore(self.server.context[pdu.dev_id])
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("模拟器处理请求时出错: %s", str(e))
+                response = ExceptionResponse(pdu.function_code, ExcCodes.DEVICE_FAILURE)
+            response.transaction_id = pdu.transaction_id
+            response.dev_id = pdu.dev_id
+
+            send_at = max(self._last_send_at, loop.time() + self.simulator.response_delay())
+            self._last_send_at = send_at
+            loop.call_at(send_at, self._send_response, response, addr)
+
+    def _send_response(self, response, addr) -> None:
+        """发送应答，连接已关闭时丢弃"""
+        if self.transport is not None and not self.transport.is_closing():
+            self.server_send(response, addr)
+
+
+class _SimulatorServer(ModbusTcpServer):
+    """使用 _SimulatorRequestHandler 处理连接的Modbus TCP服务端"""
+
+    def __init__(self, simulator: "RH56DFTPSimulator", *args, **kwargs):
+        self.simulator = simulator
+        super().__init__(*args, **kwargs)
+
+    def callback_new_connection(self):
+        return _SimulatorRequestHandler(
+            self, self.trace_packet, self.trace_pdu, self.trace_connect
+        )
+
+
+class RH56DFTPSimulator:
+    """
+    RH56DFTP 本地模拟器，在后台线程中运行Modbus TCP服务端
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 max_registers_per_request: int = MAX_COUNT_PER_READ,
+                 update_rate: float = DEFAULT_UPDATE_RATE,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口，为0时由系统分配，启动后通过 port 属性获取
+            latency: 应答延迟（秒）
+            jitter: 应答延迟的随机抖动幅度（秒），实际延迟在 latency±jitter 内均匀分布
+            max_registers_per_request: 单次请求允许的最大寄存器数量
+            update_rate: 合成数据的刷新频率（Hz）
+            seed: 随机数种子，指定后合成数据与延迟抖动可复现
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self.registers: Dict[RegisterName, Register_FTP] = register_factory.create_registers(
+            config_folder_path=None,
+            strategy_name='ftp'
+        )
+        self.context = SimulatorContext(
+            self.registers, max_registers_per_request, update_rate, seed
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[_SimulatorServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def response_delay(self) -> float:
+        """
+        生成一次应答的延迟
+
+        Returns:
+            延迟（秒），不小于0
+        """
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def get_value(self, register_name: RegisterName) -> Any:
+        """
+        直接读取模拟器中寄存器的当前值，不经过网络
+
+        Args:
+            register_name: 寄存器名称
+
+        Returns:
+            单值寄存器返回原始值，其余返回原始寄存器值列表
+        """
+        start_address, count = register_span(self.registers[register_name])
+        words = self.context.words[start_address:start_address + count]
+        return words[0] if count <= 2 and not register_name.startswith("TACTILE_") else words
+
+    def set_value(self, register_name: RegisterName, value: Any) -> None:
+        """
+        直接设置模拟器中寄存器的值，不检查访问权限，可用于注入故障等状态
+
+        实时数据寄存器的值会在下次刷新合成数据时被覆盖
+
+        Args:
+            register_name: 寄存器名称
+            value: 要设置的值
+        """
+        self.context._store(self.registers[register_name], value)  # pylint: disable=protected-access
+
+    def start(self, timeout: float = 5.0) -> "RH56DFTPSimulator":
+        """
+        在后台线程中启动服务端，返回时已开始监听
+
+        Args:
+            timeout: 等待启动的最长时间（秒）
+
+        Returns:
+            模拟器本身
+
+        Raises:
+            RuntimeError: 当服务端启动失败时抛出
+        """
+        if self._thread is not None:
+            return self
+        started = threading.Event()
+        errors: List[BaseException] = []
+        self._thread = threading.Thread(
+            target=self._run, args=(started, errors), name="RH56DFTP-simulator", daemon=True
+        )
+        self._thread.start()
+        if not started.wait(timeout) or errors:
+            self._thread = None
+            raise RuntimeError(f"模拟器启动失败: {errors[0] if errors else '启动超时'}")
+        logger.info("模拟器已启动: %s:%s", self.host, self.port)
+        return self
+
+    def _run(self, started: threading.Event, errors: List[BaseException]) -> None:
+        """后台线程入口，运行事件循环直到 stop()"""
+        async def serve() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._server = _SimulatorServer(
+                self,
+                ModbusServerContext(devices=self.context, single=True),
+                address=(self.host, self.port)
+            )
+            try:
+                await self._server.serve_forever(background=True)
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+                started.set()
+                return
+            self.port = self._server.transport.sockets[0].getsockname()[1]
+            started.set()
+            await self._server.serving
+
+        asyncio.run(serve())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        停止服务端并等待后台线程退出
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+        """
+        if self._thread is None:
+            return
+        if self._loop is not None and self._server is not None:
+            asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("模拟器已停止")
+
+    def __enter__(self) -> "RH56DFTPSimulator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """命令行入口，以独立进程运行模拟器直到按下Ctrl+C"""
+    parser = argparse.ArgumentParser(description="RH56DFTP Modbus TCP 模拟器")
+    parser.add_argument("--host", default="127.0.0.1", help="监听地址")
+    parser.add_argument("--port", type=int, default=6000, help="监听端口")
+    parser.add_argument("--latency", type=float, default=0.0, help="应答延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="应答延迟抖动（秒）")
+    parser.add_argument("--max-registers", type=int, default=MAX_COUNT_PER_READ,
+                        help="单次请求允许的最大寄存器数量")
+    parser.add_argument("--seed", type=int, default=None, help="随机数种子")
+    args = parser.parse_args()
+
+    simulator = RH56DFTPSimulator(
+        host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+        max_registers_per_request=args.max_registers, seed=args.seed
+    )
+    with simulator:
+        print(f"模拟器运行于 {simulator.host}:{simulator.port}，按 Ctrl+C 退出", flush=True)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+RH56DFTP 整手状态快照模块，定义状态块地址与快照数据结构
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from Register.RegisterSet.Register_FTP import Register_FTP
+from .RH56DFTP_codec import decode_raw_value, register_span
+
+# 自由度数量（6个执行器）
+DOF_COUNT = 6
+
+# 实时状态块: FORCE_ACT(0) ~ TEMP(5)，连续地址
+STATE_BLOCK_START = 1582
+STATE_BLOCK_END = 1623
+STATE_BLOCK_COUNT = STATE_BLOCK_END - STATE_BLOCK_START + 1
+
+# 设定值块: ANGLE_SET(0) ~ ANGLE_SET(5)，其间包含 POS_SET(0) ~ POS_SET(5)
+SETPOINT_BLOCK_START = 1464
+SETPOINT_BLOCK_END = 1487
+SETPOINT_BLOCK_COUNT = SETPOINT_BLOCK_END - SETPOINT_BLOCK_START + 1
+
+# 各状态块包含的寄存器组前缀
+STATE_GROUPS = ("FORCE_ACT", "CURRENT", "ERROR", "TEMP")
+SETPOINT_GROUPS = ("ANGLE_SET", "POS_SET")
+# set_pose 模式对应的寄存器组前缀
+POSE_PREFIXES = {"angle": "ANGLE_SET", "pos": "POS_SET"}
+
+
+def group_register_names(prefix: str) -> List[RegisterName]:
+    """
+    获取寄存器组内按执行器顺序排列的寄存器名称
+
+    Args:
+        prefix: 寄存器组前缀，如 "FORCE_ACT"
+
+    Returns:
+        寄存器名称列表，如 ["FORCE_ACT(0)", ..., "FORCE_ACT(5)"]
+    """
+    return [f"{prefix}({i})" for i in range(DOF_COUNT)]
+
+
+def decode_group(registers: Dict[RegisterName, Register_FTP], prefix: str,
+                 block_start: int, words: Sequence[int]) -> Tuple[int, ...]:
+    """
+    从一段连续寄存器数据中解码一个寄存器组
+
+    Args:
+        registers: 寄存器对象字典
+        prefix: 寄存器组前缀
+        block_start: 数据块起始地址
+        words: 从起始地址开始读取到的原始寄存器值
+
+    Returns:
+        按执行器顺序排列的解码值
+    """
+    values = []
+    for register_name in group_register_names(prefix):
+        register = registers[register_name]
+        start_address, _ = register_span(register)
+        values.append(decode_raw_value(register, words[start_address - block_start]))
+    return tuple(values)
+
+
+@dataclass(frozen=True)
+class HandState:
+    """
+    整手状态快照，由一次（或两次）批量读取解码得到
+    """
+    force_act: Tuple[int, ...]
+    """各手指实际受力值，单位：g"""
+
+    current: Tuple[int, ...]
+    """各执行器电流值，单位：mA"""
+
+    error: Tuple[int, ...]
+    """各执行器故障码"""
+
+    temp: Tuple[int, ...]
+    """各执行器温度值，单位：℃"""
+
+    angle_set: Optional[Tuple[int, ...]] = None
+    """角度设定值，仅在读取设定值块时有效"""
+
+    pos_set: Optional[Tuple[int, ...]] = None
+    """位置设定值，仅在读取设定值块时有效"""
+
+    timestamp: float = 0.0
+    """读取完成时的时间戳（time.time()）"""
+
+    @classmethod
+    def from_blocks(cls, registers: Dict[RegisterName, Register_FTP],
+                    state_words: Sequence[int],
+                    setpoint_words: Optional[Sequence[int]] = None,
+                    timestamp: float = 0.0) -> "HandState":
+        """
+        从状态块与设定值块的原始数据构建快照
+
+        Args:
+            registers: 寄存器对象字典
+            state_words: 实时状态块原始数据（1582-1623）
+            setpoint_words: 设定值块原始数据（1464-1487），可选
+            timestamp: 时间戳
+
+        Returns:
+            状态快照
+        """
+        state = {
+            prefix.lower(): decode_group(registers, prefix, STATE_BLOCK_START, state_words)
+            for prefix in STATE_GROUPS
+        }
+        if setpoint_words is not None:
+            for prefix in SETPOINT_GROUPS:
+                state[prefix.lower()] = decode_group(
+                    registers, prefix, SETPOINT_BLOCK_START, setpoint_words
+                )
+        return cls(timestamp=timestamp, **state)
+
+    def as_dict(self) -> Dict[RegisterName, int]:
+        """
+        将快照展开为 寄存器名称 -> 值 的字典
+
+        Returns:
+            寄存器值字典，未读取的设定值不包含在内
+        """
+        result = {}
+        for prefix in STATE_GROUPS + SETPOINT_GROUPS:
+            values = getattr(self, prefix.lower())
+            if values is None:
+                continue
+            for register_name, value in zip(group_register_names(prefix), values):
+                result[register_name] = value
+        return result
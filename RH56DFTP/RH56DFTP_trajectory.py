@@ -0,0 +1,250 @@
+"""
+RH56DFTP 轨迹播放模块，将六自由度路点插值后按固定步频流式写入设定值寄存器
+
+需要安装可选依赖 numpy: pip install plusml-rh56dftp[numpy]
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_state import DOF_COUNT, POSE_PREFIXES, group_register_names
+from .RH56DFTP_TCP import RH56DFTPClient
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 默认写入步频（Hz）
+DEFAULT_STEP_RATE = 100.0
+
+
+def _require_numpy() -> None:
+    """检查numpy是否可用"""
+    if np is None:
+        raise ImportError("轨迹播放需要安装numpy: pip install plusml-rh56dftp[numpy]")
+
+
+def interpolate_waypoints(waypoints: "np.ndarray", times: "np.ndarray",
+                          sample_times: "np.ndarray") -> "np.ndarray":
+    """
+    对路点做分段线性插值（向量化，一次计算全部步）
+
+    Args:
+        waypoints: (N, D) 路点
+        times: (N,) 严格递增的路点时间
+        sample_times: (M,) 采样时间，超出路点时间范围的按端点取值
+
+    Returns:
+        (M, D) 插值结果
+    """
+    _require_numpy()
+    sample_times = np.clip(sample_times, times[0], times[-1])
+    index = np.clip(np.searchsorted(times, sample_times, side="right") - 1, 0, len(times) - 2)
+    span = times[index + 1] - times[index]
+    fraction = ((sample_times - times[index]) / span)[:, None]
+    return waypoints[index] + fraction * (waypoints[index + 1] - waypoints[index])
+
+
+@dataclass(frozen=True)
+class TrajectoryResult:
+    """
+    一次播放的结果，时间均相对播放开始时刻（秒）
+    """
+    planned_times: "np.ndarray"
+    """(M,) 各步的计划写入时间"""
+
+    write_times: "np.ndarray"
+    """(M,) 各步的实际写入时间，未执行或因落后被跳过的步为NaN"""
+
+    commands: "np.ndarray"
+    """(M, 6) 各步写入的设定值"""
+
+    track_times: "np.ndarray"
+    """(K,) 各次状态读取的完成时间"""
+
+    setpoint_error: "np.ndarray"
+    """(K, 6) 设定值回读与最近一次写入指令之差；设备没有实际位置寄存器，这不是跟踪误差，
+    只反映写入是否丢失或被其他程序改写"""
+
+    force: "np.ndarray"
+    """(K, 6) 各次状态读取的 FORCE_ACT"""
+
+    failed_writes: int
+    """写入失败的步数"""
+
+    skipped_steps: int
+    """因落后于计划、截止时间已过而跳过的步数"""
+
+    completed: bool
+    """是否播放完全部步（未被 stop() 中断）"""
+
+    @property
+    def lateness(self) -> "np.ndarray":
+        """(M,) 各步实际写入时间相对计划时间的延迟"""
+        return self.write_times - self.planned_times
+
+    @property
+    def max_setpoint_mismatch(self) -> "np.ndarray":
+        """
+        (6,) 各自由度设定值回读与写入指令之差的最大绝对值
+
+        RH56DFTP 不提供实际角度或位置寄存器，无法测量执行器的跟踪误差；非零值说明写入丢失或
+        设定值在两次读写之间被其他程序改写
+        """
+        if self.setpoint_error.size == 0:
+            return np.zeros(DOF_COUNT)
+        return np.abs(self.setpoint_error).max(axis=0)
+
+
+class TrajectoryPlayer:
+    """
+    轨迹播放器
+
+    路点按时间插值为固定步频的指令序列，每步通过 set_pose() 一次写入六个设定值，
+    按单调时钟的绝对时间对齐，单步耗时波动不会累积；落后于计划时跳过截止时间已过的步，
+    直接写入当前时刻应到达的一步，不会补发过时的指令
+
+    Example::
+
+        waypoints = np.array([[0] * 6, [1000] * 6, [0] * 6])
+        player = TrajectoryPlayer(client, waypoints, waypoint_rate=1.0, step_rate=100)
+        result = player.play()
+        print(result.lateness.max(), result.max_setpoint_mismatch)
+    """
+
+    def __init__(self, client: RH56DFTPClient, waypoints: Sequence[Sequence[float]],
+                 times: Optional[Sequence[float]] = None,
+                 waypoint_rate: Optional[float] = None,
+                 step_rate: float = DEFAULT_STEP_RATE,
+                 mode: Literal["angle", "pos"] = "angle",
+                 track_every: int = 1):
+        """
+        Args:
+            client: 已创建的客户端
+            waypoints: (N, 6) 路点，N至少为2
+            times: (N,) 各路点的时间（秒），严格递增；与 waypoint_rate 二选一
+            waypoint_rate: 路点频率（Hz），路点等间隔排列
+            step_rate: 写入步频（Hz）
+            mode: "angle" 写入 ANGLE_SET，"pos" 写入 POS_SET
+            track_every: 每隔多少步读取一次状态用于记录设定值回读与受力，为0时不读取
+
+        Raises:
+            ImportError: 当未安装numpy时抛出
+            ValueError: 当参数不合法时抛出
+        """
+        _require_numpy()
+        if mode not in POSE_PREFIXES:
+            raise ValueError(f"无效的模式: {mode}")
+        if step_rate <= 0:
+            raise ValueError(f"步频必须为正数: {step_rate}")
+
+        waypoints = np.asarray(waypoints, dtype=np.float64)
+        if waypoints.ndim != 2 or waypoints.shape[1] != DOF_COUNT or len(waypoints) < 2:
+            raise ValueError(f"路点形状必须为 (N, {DOF_COUNT}) 且 N>=2，实际为 {waypoints.shape}")
+        if (times is None) == (waypoint_rate is None):
+            raise ValueError("times 与 waypoint_rate 必须且只能指定一个")
+        if times is None:
+            times = np.arange(len(waypoints)) / waypoint_rate
+        times = np.asarray(times, dtype=np.float64)
+        if times.shape != (len(waypoints),) or np.any(np.diff(times) <= 0):
+            raise ValueError("路点时间的数量必须与路点一致且严格递增")
+
+        self.client = client
+        self.mode = mode
+        self.track_every = track_every
+        self.step_period = 1.0 / step_rate
+
+        # 超出寄存器取值范围的路点在写入前截断
+        register_names = group_register_names(POSE_PREFIXES[mode])
+        ranges = np.array([client.registers[name].value_range for name in register_names])
+        waypoints = np.clip(waypoints, ranges[:, 0], ranges[:, 1])
+
+        # 步时间相对第一个路点，最后一步落在最后一个路点上
+        duration = times[-1] - times[0]
+        step_times = np.arange(0.0, duration, self.step_period)
+        self.planned_times = np.append(step_times, duration)
+        self.commands = np.rint(
+            interpolate_waypoints(waypoints, times, self.planned_times + times[0])
+        ).astype(np.int64)
+        self._stop_event = threading.Event()
+
+    @property
+    def duration(self) -> float:
+        """播放时长（秒）"""
+        return float(self.planned_times[-1])
+
+    def stop(self) -> None:
+        """请求中断播放，可在其他线程中调用"""
+        self._stop_event.set()
+
+    def play(self) -> TrajectoryResult:
+        """
+        在当前线程中播放轨迹，直到完成或调用 stop()
+
+        Returns:
+            播放结果
+        """
+        self._stop_event.clear()
+        step_count = len(self.planned_times)
+        write_times = np.full(step_count, np.nan)
+        track_times = []
+        setpoint_error = []
+        force = []
+        failed_writes = 0
+        skipped_steps = 0
+        completed = True
+
+        start = time.monotonic()
+        step = 0
+        while step < step_count:
+            # 截止时间已过时 wait(0) 只检查是否已请求中断
+            if self._stop_event.wait(max(0.0, start + self.planned_times[step] - time.monotonic())):
+                completed = False
+                break
+
+            # 落后时跳过截止时间已过的中间步，直接写入当前时刻应到达的一步
+            due = int(np.searchsorted(self.planned_times, time.monotonic() - start,
+                                      side="right")) - 1
+            if due > step:
+                skipped_steps += due - step
+                step = due
+
+            command = self.commands[step]
+            write_times[step] = time.monotonic() - start
+            if not self.client.set_pose(command.tolist(), self.mode):
+                failed_writes += 1
+
+            if self.track_every and step % self.track_every == 0:
+                try:
+                    state = self.client.read_state(include_setpoints=True)
+                except (ConnectionError, ValueError) as e:
+                    logger.warning("轨迹第 %d 步读取状态失败: %s", step, str(e))
+                else:
+                    track_times.append(time.monotonic() - start)
+                    setpoint_error.append(
+                        np.subtract(getattr(state, POSE_PREFIXES[self.mode].lower()), command)
+                    )
+                    force.append(state.force_act)
+            step += 1
+
+        if skipped_steps:
+            logger.warning("轨迹播放落后于计划，跳过了 %d 步", skipped_steps)
+        if failed_writes:
+            logger.warning("轨迹播放中有 %d 步写入失败", failed_writes)
+        return TrajectoryResult(
+            planned_times=self.planned_times,
+            write_times=write_times,
+            commands=self.commands,
+            track_times=np.array(track_times),
+            setpoint_error=np.array(setpoint_error).reshape(-1, DOF_COUNT),
+            force=np.array(force).reshape(-1, DOF_COUNT),
+            failed_writes=failed_writes,
+            skipped_steps=skipped_steps,
+            completed=completed
+        )
@@ -0,0 +1,200 @@
+"""
+RH56DFTP 读取分块调优模块，按设备实测的应答时间选择单次读取的寄存器数量
+
+探测从小到大依次测量各请求大小的应答时间，设备以非法数据值拒绝某一大小时停止增大；
+选中大小使整帧触觉读取的估算耗时最短。结果按 host:port 缓存在JSON文件中，之后的连接直接复用
+"""
+import json
+import logging
+import math
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from .RH56DFTP_logging import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 默认探测的请求大小，不超过Modbus单次读取上限125
+DEFAULT_PROBE_SIZES = (16, 32, 64, 96, 125)
+# 每个请求大小的测量次数，取中位数
+DEFAULT_PROBE_REPEATS = 5
+# 默认的调优结果缓存文件
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".rh56dftp", "read_profiles.json")
+# 缓存文件格式版本
+PROFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ReadProfile:
+    """
+    单台设备的读取分块调优结果
+    """
+    host: str
+    """设备IP地址"""
+
+    port: int
+    """设备端口号"""
+
+    max_count_per_read: int
+    """选定的单次读取寄存器数量"""
+
+    accepted_limit: int
+    """探测中设备接受的最大请求大小"""
+
+    timings: Dict[int, float]
+    """请求大小 -> 中位应答时间(秒)"""
+
+    probed_at: float
+    """探测时间（Unix时间戳）"""
+
+    def to_dict(self) -> Dict:
+        """转换为可写入JSON的字典"""
+        data = asdict(self)
+        data["timings"] = {str(size): seconds for size, seconds in self.timings.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ReadProfile":
+        """
+        从JSON字典创建调优结果
+
+        Raises:
+            KeyError, TypeError, ValueError: 当字典格式无效时抛出
+        """
+        return cls(
+            host=str(data["host"]),
+            port=int(data["port"]),
+            max_count_per_read=int(data["max_count_per_read"]),
+            accepted_limit=int(data["accepted_limit"]),
+            timings={int(size): float(seconds) for size, seconds in data["timings"].items()},
+            probed_at=float(data["probed_at"])
+        )
+
+
+def profile_key(host: str, port: int) -> str:
+    """获取调优结果在缓存文件中的键"""
+    return f"{host}:{port}"
+
+
+def _load_profiles(path: str) -> Dict[str, Dict]:
+    """读取缓存文件中的全部调优结果，文件不存在或格式无效时返回空字典"""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("读取调优缓存 %s 失败，将重新探测: %s", path, str(e))
+        return {}
+    if not isinstance(data, dict) or data.get("version") != PROFILE_VERSION:
+        logger.warning("调优缓存 %s 版本不匹配，将重新探测", path)
+        return {}
+    profiles = data.get("profiles")
+    return profiles if isinstance(profiles, dict) else {}
+
+
+def load_read_profile(host: str, port: int, path: Optional[str] = None) -> Optional[ReadProfile]:
+    """
+    读取设备的调优结果
+
+    Args:
+        host: 设备IP地址
+        port: 设备端口号
+        path: 缓存文件路径，默认为 DEFAULT_PROFILE_PATH
+
+    Returns:
+        调优结果，没有缓存或缓存无效时返回None
+    """
+    path = path or DEFAULT_PROFILE_PATH
+    data = _load_profiles(path).get(profile_key(host, port))
+    if data is None:
+        return None
+    try:
+        return ReadProfile.from_dict(data)
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        logger.warning("调优缓存中 %s 的记录无效，将重新探测: %s", profile_key(host, port), str(e))
+        return None
+
+
+def save_read_profile(profile: ReadProfile, path: Optional[str] = None) -> None:
+    """
+    保存设备的调优结果，同一文件中其他设备的结果保持不变
+
+    Args:
+        profile: 调优结果
+        path: 缓存文件路径，默认为 DEFAULT_PROFILE_PATH
+
+    Raises:
+        OSError: 当写入文件失败时抛出
+    """
+    path = path or DEFAULT_PROFILE_PATH
+    profiles = _load_profiles(path)
+    profiles[profile_key(profile.host, profile.port)] = profile.to_dict()
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 先写入临时文件再替换，避免并发读取到写了一半的文件
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".read_profiles.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"version": PROFILE_VERSION, "profiles": profiles}, file,
+                      ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def probe_read_profile(read_chunk: Callable[[int, int], bool], host: str, port: int,
+                       address: int, span: int,
+                       sizes: Iterable[int] = DEFAULT_PROBE_SIZES,
+                       repeats: int = DEFAULT_PROBE_REPEATS) -> ReadProfile:
+    """
+    探测设备的读取分块
+
+    Args:
+        read_chunk: 读取函数 (起始地址, 数量) -> 是否被接受，设备以非法数据值拒绝时返回False，
+            其他错误直接抛出
+        host: 设备IP地址
+        port: 设备端口号
+        address: 探测使用的起始地址，[address, address + span) 必须全部可读
+        span: 用于估算耗时的读取总量，同时限制最大探测大小
+        sizes: 探测的请求大小
+        repeats: 每个请求大小的测量次数
+
+    Returns:
+        调优结果
+
+    Raises:
+        ValueError: 当设备拒绝了所有探测大小时抛出
+    """
+    timings: Dict[int, float] = {}
+    accepted_limit = 0
+    for size in sorted(set(size for size in sizes if 0 < size <= span)):
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            if not read_chunk(address, size):
+                break
+            samples.append(time.perf_counter() - started)
+        if len(samples) < repeats:
+            logger.info("设备拒绝了 %d 个寄存器的读取请求，停止增大请求", size)
+            break
+        timings[size] = statistics.median(samples)
+        accepted_limit = size
+        logger.debug("探测读取 %d 个寄存器: 中位应答时间 %.3f ms", size, timings[size] * 1e3)
+
+    if not timings:
+        raise ValueError("设备拒绝了所有探测的请求大小")
+
+    # 估算按该大小分块读取 span 个寄存器的总耗时，耗时相同时取较大的分块
+    best = min(timings, key=lambda size: (math.ceil(span / size) * timings[size], -size))
+    logger.info("读取分块调优完成: %s:%s 选用 %d 个寄存器/次，设备接受上限 %d",
+                host, port, best, accepted_limit)
+    return ReadProfile(host=host, port=port, max_count_per_read=best,
+                       accepted_limit=accepted_limit, timings=timings, probed_at=time.time())
@@ -0,0 +1,267 @@
+"""
+RH56DFTP 写缓冲模块，缓存待写入的值并在刷新时合并为最少的批量写入
+
+写缓冲保存每个保持值的可写寄存器最近一次确认写入（或读回）的影子值，与影子值相同的写入直接丢弃；
+CLEAR_ERROR、SAVE 等触发类寄存器（读缓存的 command 类别）会被设备自行复位，写入总是发往设备；
+同一周期内多次写入同一寄存器只保留最后一次
+
+影子值在客户端读缓存失效时（写入失败、重连后设备可能已重启、写入 RESET_PARA）一并清除，
+并且超过 max_shadow_age 后不再用于丢弃写入，其他程序改写设定值后最多延迟该时长即可恢复发送
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from Register.RegisterKey.ftp_registers_keys import RegisterName
+from .RH56DFTP_cache import COMMAND_CLASS, INVALIDATE_ALL_ON_WRITE, register_cache_class
+from .RH56DFTP_codec import validate_write
+from .RH56DFTP_logging import LOGGER_NAME
+from .RH56DFTP_TCP import RH56DFTPClient
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 影子值的默认最长有效时间（秒）
+DEFAULT_SHADOW_MAX_AGE = 1.0
+
+
+@dataclass(frozen=True)
+class WriteBufferStats:
+    """
+    写缓冲统计
+    """
+    submitted: int
+    """调用 set() 的次数"""
+
+    suppressed: int
+    """因与影子值相同而丢弃的写入次数，触发类寄存器的写入从不丢弃"""
+
+    coalesced: int
+    """被同一周期内后续写入覆盖的写入次数"""
+
+    flushed: int
+    """实际写入设备的寄存器数量"""
+
+    flushes: int
+    """有实际写入的刷新次数"""
+
+
+class WriteBuffer:
+    """
+    带影子状态的写缓冲
+
+    Example::
+
+        buffer = WriteBuffer(client)
+        buffer.sync()                       # 可选：从设备读回影子值
+        with buffer:                        # 退出时刷新
+            buffer.set("ANGLE_SET(0)", 500)
+            buffer.set("ANGLE_SET(1)", 500)
+    """
+
+    def __init__(self, client: RH56DFTPClient,
+                 max_shadow_age: Optional[float] = DEFAULT_SHADOW_MAX_AGE):
+        """
+        Args:
+            client: 已创建的客户端
+            max_shadow_age: 影子值的最长有效时间（秒），超过后与之相同的写入照常发往设备；
+                为None时只在失效时清除
+        """
+        self.client = client
+        self.max_shadow_age = max_shadow_age
+        self.writable = [
+            name for name, register in client.registers.items()
+            if register.access_type != "read-only"
+        ]
+        # 触发类寄存器没有可比较的影子值，写入总是发往设备
+        self.triggers = frozenset(
+            name for name in self.writable
+            if register_cache_class(client.registers[name]) == COMMAND_CLASS
+        )
+        # 寄存器名称 -> (影子值, 确认时间)
+        self._shadow: Dict[RegisterName, Tuple[Any, float]] = {}
+        self._pending: Dict[RegisterName, Any] = {}
+        self._lock = threading.RLock()
+        client.read_cache.subscribe(self._cache_invalidated)
+        self._submitted = 0
+        self._suppressed = 0
+        self._coalesced = 0
+        self._flushed = 0
+        self._flushes = 0
+
+    @property
+    def pending(self) -> Dict[RegisterName, Any]:
+        """待写入的值（副本）"""
+        with self._lock:
+            return dict(self._pending)
+
+    def shadow(self, register_name: RegisterName | callable) -> Optional[Any]:
+        """
+        获取寄存器的影子值
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+
+        Returns:
+            最近一次确认的值，未知或已超过 max_shadow_age 时返回None
+        """
+        register_name = self.client._resolve_name(register_name)  # pylint: disable=protected-access
+        with self._lock:
+            return self._fresh_shadow(register_name, time.monotonic())
+
+    def _fresh_shadow(self, register_name: RegisterName, now: float) -> Optional[Any]:
+        """获取仍在有效期内的影子值，调用方持有锁"""
+        entry = self._shadow.get(register_name)
+        if entry is None:
+            return None
+        value, confirmed_at = entry
+        if self.max_shadow_age is not None and now - confirmed_at >= self.max_shadow_age:
+            return None
+        return value
+
+    def _remember(self, values: Dict[RegisterName, Any]) -> None:
+        """记录设备上已确认的值，触发类寄存器除外，调用方持有锁"""
+        now = time.monotonic()
+        self._shadow.update((register_name, (value, now))
+                            for register_name, value in values.items()
+                            if register_name not in self.triggers)
+
+    def _cache_invalidated(self, register_names: Optional[List[RegisterName]]) -> None:
+        """客户端读缓存失效时清除对应的影子值"""
+        self.invalidate(register_names)
+
+    def set(self, register_name: RegisterName | callable, value: Any) -> bool:
+        """
+        缓存一次写入，等待 flush() 时写入设备
+
+        Args:
+            register_name: 寄存器名称或寄存器函数对象
+            value: 要设置的值
+
+        Returns:
+            值是否合法并被接受（包括因与影子值相同而丢弃的情况）
+        """
+        register_name = self.client._resolve_name(register_name)  # pylint: disable=protected-access
+        if register_name not in self.client.registers:
+            logger.error("缓存写入失败: 寄存器 %s 不存在", register_name)
+            return False
+        reason = validate_write(self.client.registers[register_name], value)
+        if reason:
+            logger.error("缓存写入寄存器 %s 失败: %s", register_name, reason)
+            return False
+
+        with self._lock:
+            self._submitted += 1
+            if register_name in self._pending:
+                self._coalesced += 1
+            shadow = self._fresh_shadow(register_name, time.monotonic())
+            if register_name not in self.triggers and shadow is not None and shadow == value:
+                # 与设备上的值相同，撤销之前未刷新的写入即可
+                self._pending.pop(register_name, None)
+                self._suppressed += 1
+            else:
+                self._pending[register_name] = value
+        return True
+
+    def update(self, values: Dict[RegisterName | callable, Any]) -> bool:
+        """
+        缓存多次写入
+
+        Args:
+            values: 寄存器名称或寄存器函数对象 -> 要设置的值
+
+        Returns:
+            全部值是否被接受
+        """
+        results = [self.set(register_name, value) for register_name, value in values.items()]
+        return all(results)
+
+    def flush(self) -> bool:
+        """
+        将待写入的值一次性写入设备，地址相邻的寄存器合并为一次 write_registers 请求
+
+        写入失败时清除相关寄存器的影子值，下次写入不会被当作重复值丢弃
+
+        Returns:
+            写入是否成功，没有待写入的值时返回True
+        """
+        with self._lock:
+            if not self._pending:
+                return True
+            pending, self._pending = self._pending, {}
+            if self.client.set_many(pending):
+                if pending.keys().isdisjoint(INVALIDATE_ALL_ON_WRITE):
+                    self._remember(pending)
+                else:
+                    # 参数复位改变了设备上的所有值，之前的影子值全部作废
+                    self._shadow.clear()
+                self._flushed += len(pending)
+                self._flushes += 1
+                return True
+            for register_name in pending:
+                self._shadow.pop(register_name, None)
+            logger.error("写缓冲刷新失败，%d 个寄存器的写入已丢弃", len(pending))
+            return False
+
+    def sync(self, register_names: Optional[Iterable[RegisterName]] = None) -> None:
+        """
+        从设备读回影子值
+
+        Args:
+            register_names: 要读回的寄存器，默认为全部可写寄存器（触发类寄存器不保存影子值）
+
+        Raises:
+            ConnectionError: 当连接已断开时抛出
+            ValueError: 当读取失败时抛出
+        """
+        names = list(register_names) if register_names is not None else [
+            name for name in self.writable if name not in self.triggers
+        ]
+        values = self.client.read_many(names)
+        with self._lock:
+            self._remember(values)
+
+    def invalidate(self, register_names: Optional[Iterable[RegisterName]] = None) -> None:
+        """
+        清除影子值，例如其他程序修改了设备状态之后；客户端读缓存失效时会自动调用
+
+        Args:
+            register_names: 要清除的寄存器，默认为全部
+        """
+        with self._lock:
+            if register_names is None:
+                self._shadow.clear()
+            else:
+                for register_name in register_names:
+                    self._shadow.pop(register_name, None)
+
+    def discard(self) -> None:
+        """丢弃全部待写入的值"""
+        with self._lock:
+            self._pending.clear()
+
+    def stats(self) -> WriteBufferStats:
+        """
+        获取统计快照
+
+        Returns:
+            写缓冲统计
+        """
+        with self._lock:
+            return WriteBufferStats(
+                submitted=self._submitted,
+                suppressed=self._suppressed,
+                coalesced=self._coalesced,
+                flushed=self._flushed,
+                flushes=self._flushes
+            )
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
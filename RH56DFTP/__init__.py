@@ -1,13 +1,121 @@
 """
 RH56DFTP 库，用于通过Modbus TCP协议与RH56DFTP设备通信
 """
+import importlib
+from typing import TYPE_CHECKING
 
+from .RH56DFTP_logging import configure_logging, shutdown_logging
 from .RH56DFTP_base import RH56DFTPBase
 from .RH56DFTP_TCP import RH56DFTPClient, RH56DFTP_TCP
+from .RH56DFTP_state import HandState
+from .RH56DFTP_async import AsyncRH56DFTPClient
+from .RH56DFTP_decode import TactileFrame, TactileLayout, decode_array
+from .RH56DFTP_plan import ReadPlan, ReadPlanner
+from .RH56DFTP_scheduler import RequestScheduler
+from .RH56DFTP_tuning import ReadProfile
+from .RH56DFTP_writebuffer import WriteBuffer, WriteBufferStats
+from .RH56DFTP_metrics import ClientMetrics, MetricsServer, serve_metrics, to_prometheus
+
+# 可选子系统在首次访问时才导入，import RH56DFTP 只加载客户端本身
+_LAZY_IMPORTS = {
+    "PollGroup": ".RH56DFTP_poller",
+    "RH56DFTPPoller": ".RH56DFTP_poller",
+    "Sample": ".RH56DFTP_poller",
+    "SampleRing": ".RH56DFTP_poller",
+    "register_group": ".RH56DFTP_poller",
+    "state_group": ".RH56DFTP_poller",
+    "tactile_group": ".RH56DFTP_poller",
+    "RH56DFTPSimulator": ".RH56DFTP_simulator",
+    "ControlLoop": ".RH56DFTP_control",
+    "ControlTick": ".RH56DFTP_control",
+    "LoopStats": ".RH56DFTP_control",
+    "TrajectoryPlayer": ".RH56DFTP_trajectory",
+    "TrajectoryResult": ".RH56DFTP_trajectory",
+    "SessionRecorder": ".RH56DFTP_recording",
+    "SessionRecording": ".RH56DFTP_recording",
+    "RH56DFTPReplay": ".RH56DFTP_replay",
+    "SharedSnapshot": ".RH56DFTP_shm",
+    "SharedStatePublisher": ".RH56DFTP_shm",
+    "SharedStateReader": ".RH56DFTP_shm",
+    "RH56DFTPGateway": ".RH56DFTP_gateway",
+    "RH56DFTPGatewayClient": ".RH56DFTP_gateway",
+}
+
+if TYPE_CHECKING:
+    from .RH56DFTP_poller import (
+        PollGroup,
+        RH56DFTPPoller,
+        Sample,
+        SampleRing,
+        register_group,
+        state_group,
+        tactile_group
+    )
+    from .RH56DFTP_simulator import RH56DFTPSimulator
+    from .RH56DFTP_control import ControlLoop, ControlTick, LoopStats
+    from .RH56DFTP_trajectory import TrajectoryPlayer, TrajectoryResult
+    from .RH56DFTP_recording import SessionRecorder, SessionRecording
+    from .RH56DFTP_replay import RH56DFTPReplay
+    from .RH56DFTP_shm import SharedSnapshot, SharedStatePublisher, SharedStateReader
+    from .RH56DFTP_gateway import RH56DFTPGateway, RH56DFTPGatewayClient
+
+
+def __getattr__(name: str):
+    """按需导入可选子系统中的名称"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """包含尚未导入的可选子系统名称，便于交互式补全"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "RH56DFTPBase",
     "RH56DFTPClient",
-    "RH56DFTP_TCP"
+    "RH56DFTP_TCP",
+    "HandState",
+    "AsyncRH56DFTPClient",
+    "ReadPlan",
+    "ReadPlanner",
+    "RequestScheduler",
+    "ReadProfile",
+    "PollGroup",
+    "RH56DFTPPoller",
+    "Sample",
+    "SampleRing",
+    "register_group",
+    "state_group",
+    "tactile_group",
+    "RH56DFTPSimulator",
+    "WriteBuffer",
+    "WriteBufferStats",
+    "ControlLoop",
+    "ControlTick",
+    "LoopStats",
+    "TrajectoryPlayer",
+    "TrajectoryResult",
+    "SessionRecorder",
+    "SessionRecording",
+    "RH56DFTPReplay",
+    "SharedStatePublisher",
+    "SharedStateReader",
+    "SharedSnapshot",
+    "RH56DFTPGateway",
+    "RH56DFTPGatewayClient",
+    "ClientMetrics",
+    "MetricsServer",
+    "serve_metrics",
+    "to_prometheus",
+    "TactileFrame",
+    "TactileLayout",
+    "decode_array",
+    "configure_logging",
+    "shutdown_logging"
 ]
-__version__ = "0.1.3"
+__version__ = "0.1.8"
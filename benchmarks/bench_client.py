@@ -0,0 +1,260 @@
+"""
+RH56DFTPClient 性能基准
+
+在本地模拟器上测量常用读写路径的延迟分布与吞吐量，结果可保存为JSON基线，
+并与之前的基线逐项比较，用于发现版本之间的性能回退
+
+用法::
+
+    # 运行全部基准并在本机保存基线（基线与机器相关，不提交到仓库）
+    python benchmarks/bench_client.py --output benchmarks/baseline.json
+
+    # 与已有基线比较，p50延迟或吞吐量变差超过阈值时以退出码1结束；
+    # 基线格式或模拟器参数不同时拒绝比较并以退出码2结束，
+    # Python次版本或CPU架构不同时只输出警告
+    python benchmarks/bench_client.py --compare benchmarks/baseline.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+# 直接从源码目录运行时，确保能导入项目包
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from RH56DFTP import RH56DFTPClient, RH56DFTPSimulator, __version__
+
+# 基线文件格式版本，字段变化时递增
+BASELINE_FORMAT = 2
+# 比较前必须与基线一致的字段，不一致时结果没有可比性
+ENVIRONMENT_KEYS = ("format", "simulator")
+# 与基线不一致时只输出警告的主机字段
+HOST_KEYS = ("python", "machine")
+# 运行环境与基线不同、拒绝比较时的退出码
+EXIT_ENVIRONMENT_MISMATCH = 2
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    计算已排序数据的百分位数（最近秩法）
+
+    Args:
+        sorted_values: 升序排列的数据
+        fraction: 百分位，如 0.99
+
+    Returns:
+        百分位数
+    """
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(operation: Callable[[], object], iterations: int, warmup: int) -> Dict[str, float]:
+    """
+    重复执行操作并统计延迟
+
+    Args:
+        operation: 被测操作
+        iterations: 计入统计的执行次数
+        warmup: 预热次数，不计入统计
+
+    Returns:
+        延迟统计（毫秒）与每秒操作数
+    """
+    for _ in range(warmup):
+        operation()
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        begin = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "ops_per_s": iterations / elapsed
+    }
+
+
+def build_cases(client: RH56DFTPClient) -> Dict[str, Callable[[], object]]:
+    """
+    构建基准用例
+
+    Args:
+        client: 已连接模拟器的客户端
+
+    Returns:
+        用例名称 -> 被测操作
+    """
+    return {
+        # 单地址寄存器读取（跳过读缓存）
+        "get_single": lambda: client.get("HAND_ID", use_cache=False),
+        # 命中读缓存的配置寄存器读取
+        "get_cached": lambda: client.get("HAND_ID"),
+        # 双地址short寄存器读取（经 _read_range_register）
+        "get_short": lambda: client.get("FORCE_ACT(0)"),
+        # 大范围触觉寄存器读取（经 _read_range_register，分批读取）
+        "get_tactile_register": lambda: client.get("TACTILE_PALM_8x14"),
+        # 整手状态块
+        "read_state": client.read_state,
+        "read_state_with_setpoints": lambda: client.read_state(include_setpoints=True),
+        # 全部触觉寄存器的整帧读取
+        "tactile_frame_sequential": lambda: client.read_tactile_frame(max_in_flight=1),
+        "tactile_frame_pipelined": client.read_tactile_frame,
+        # 写入
+        "set_single": lambda: client.set("ANGLE_SET(0)", 500),
+        "set_pose": lambda: client.set_pose([500, 500, 500, 500, 500, 500]),
+    }
+
+
+def run(iterations: int, warmup: int, latency: float, jitter: float,
+        cases: Optional[List[str]] = None) -> Dict[str, object]:
+    """
+    启动模拟器并运行基准
+
+    Args:
+        iterations: 每个用例的执行次数
+        warmup: 每个用例的预热次数
+        latency: 模拟器应答延迟（秒）
+        jitter: 模拟器应答延迟抖动（秒）
+        cases: 要运行的用例名称，为None时运行全部
+
+    Returns:
+        基准结果
+    """
+    with RH56DFTPSimulator(latency=latency, jitter=jitter, seed=0) as simulator:
+        client = RH56DFTPClient("127.0.0.1", simulator.port, heartbeat_interval=0)
+        try:
+            results = {}
+            for name, operation in build_cases(client).items():
+                if cases and name not in cases:
+                    continue
+                results[name] = measure(operation, iterations, warmup)
+                print_result(name, results[name])
+        finally:
+            client.close()
+
+    return {
+        "format": BASELINE_FORMAT,
+        "version": __version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "simulator": {"latency": latency, "jitter": jitter},
+        "results": results
+    }
+
+
+def print_result(name: str, stats: Dict[str, float]) -> None:
+    """打印单个用例的结果"""
+    print(f"{name:<28} p50={stats['p50_ms']:8.3f}ms  p99={stats['p99_ms']:8.3f}ms  "
+          f"max={stats['max_ms']:8.3f}ms  {stats['ops_per_s']:10.1f} ops/s")
+
+
+def environment_mismatches(current: Dict[str, object], baseline: Dict[str, object],
+                           keys: Sequence[str] = ENVIRONMENT_KEYS) -> List[str]:
+    """
+    找出与基线不同的运行环境字段
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        keys: 要比较的字段
+
+    Returns:
+        不一致的字段说明，运行环境相同时为空
+    """
+    return [
+        f"{key}: 基线 {baseline.get(key)!r}，本次 {current.get(key)!r}"
+        for key in keys if current.get(key) != baseline.get(key)
+    ]
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> bool:
+    """
+    与基线逐项比较
+
+    p50延迟增加或吞吐量下降超过阈值的用例视为回退
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        threshold: 允许的相对变化，如 0.1 表示10%
+
+    Returns:
+        是否没有回退
+    """
+    ok = True
+    print(f"\n与基线比较（版本 {baseline.get('version')}，{baseline.get('created')}）：")
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<28} 基线中无此用例")
+            continue
+        p50_change = stats["p50_ms"] / base["p50_ms"] - 1
+        ops_change = stats["ops_per_s"] / base["ops_per_s"] - 1
+        regressed = p50_change > threshold or ops_change < -threshold
+        ok = ok and not regressed
+        print(f"{name:<28} p50 {p50_change:+7.1%}  ops/s {ops_change:+7.1%}"
+              f"{'  <-- 回退' if regressed else ''}")
+    return ok
+
+
+def main() -> int:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="RH56DFTPClient 性能基准")
+    parser.add_argument("--iterations", type=int, default=500, help="每个用例的执行次数")
+    parser.add_argument("--warmup", type=int, default=20, help="每个用例的预热次数")
+    parser.add_argument("--latency", type=float, default=0.0, help="模拟器应答延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="模拟器应答延迟抖动（秒）")
+    parser.add_argument("--case", action="append", dest="cases", help="只运行指定用例，可重复")
+    parser.add_argument("--output", help="保存结果的JSON文件路径")
+    parser.add_argument("--compare", help="作为比较基准的JSON文件路径")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="判定回退的相对变化阈值，默认0.1")
+    parser.add_argument("--allow-mismatch", action="store_true",
+                        help="运行环境与基线不同时仍然比较，只输出警告")
+    args = parser.parse_args()
+
+    current = run(args.iterations, args.warmup, args.latency, args.jitter, args.cases)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已保存到 {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        host_mismatches = environment_mismatches(current, baseline, HOST_KEYS)
+        if host_mismatches:
+            print("\n警告：基线在不同的主机环境上生成，延迟数值仅供粗略对照：")
+            for mismatch in host_mismatches:
+                print(f"  {mismatch}")
+        mismatches = environment_mismatches(current, baseline)
+        if mismatches:
+            print("\n运行环境与基线不同，结果不可直接比较：")
+            for mismatch in mismatches:
+                print(f"  {mismatch}")
+            if not args.allow_mismatch:
+                print("请在相同环境下重新生成基线，或使用 --allow-mismatch 强制比较")
+                return EXIT_ENVIRONMENT_MISMATCH
+        if not compare(current, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
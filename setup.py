@@ -5,7 +5,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 
 setup(
     name="plusml-rh56dftp",
-    version="0.1.7",
+    version="0.1.8",
     author="plus-m-r",
     author_email="",
     description="A Python library for communicating with RH56DFTP devices (tactile hand)",
@@ -23,4 +23,7 @@ setup(
     install_requires=[
         "pymodbus==3.11.3",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.20"],
+    },
 )
@@ -0,0 +1,45 @@
+"""
+测试公共夹具：进程内模拟器与连接到它的客户端
+"""
+import os
+import sys
+
+import pytest
+
+# 直接从源码目录运行时，确保能导入项目包
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from RH56DFTP import RH56DFTPClient, RH56DFTPSimulator
+from RH56DFTP.RH56DFTP_TCP import register_factory
+
+# 极低的刷新频率：合成数据只在首次读取时生成一次，之后保持不变，便于逐字比较
+FROZEN_UPDATE_RATE = 1e-6
+
+
+@pytest.fixture(scope="session")
+def registers():
+    """寄存器对象字典"""
+    return register_factory.create_registers(config_folder_path=None, strategy_name='ftp')
+
+
+@pytest.fixture
+def simulator():
+    """合成数据冻结的模拟器"""
+    with RH56DFTPSimulator(update_rate=FROZEN_UPDATE_RATE, seed=0) as sim:
+        yield sim
+
+
+@pytest.fixture
+def client(simulator):  # pylint: disable=redefined-outer-name
+    """连接到模拟器的客户端，关闭心跳"""
+    rh56 = RH56DFTPClient(simulator.host, simulator.port, heartbeat_interval=0)
+    assert rh56.is_connected
+    yield rh56
+    rh56.close()
+
+
+def requests_by_function(rh56: RH56DFTPClient, function_code: int) -> int:
+    """客户端按功能码统计的请求次数"""
+    histogram = rh56.metrics()["by_function"].get(function_code)
+    return histogram["count"] if histogram else 0
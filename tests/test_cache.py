@@ -0,0 +1,85 @@
+"""
+读缓存的寄存器分类与失效
+"""
+import math
+
+from RH56DFTP.RH56DFTP_cache import (
+    COMMAND_CLASS,
+    LIVE_CLASS,
+    PERSISTENT_CLASS,
+    SETPOINT_CLASS,
+    RegisterCache,
+    register_cache_class
+)
+
+
+def test_register_classes(registers):
+    assert register_cache_class(registers["HAND_ID"]) == PERSISTENT_CLASS
+    assert register_cache_class(registers["ANGLE_SET(0)"]) == SETPOINT_CLASS
+    assert register_cache_class(registers["CLEAR_ERROR"]) == COMMAND_CLASS
+    assert register_cache_class(registers["TEMP(0)"]) == LIVE_CLASS
+
+
+def test_only_persistent_registers_cached_by_default(registers):
+    cache = RegisterCache(registers)
+    for name in ("HAND_ID", "ANGLE_SET(0)", "CLEAR_ERROR", "TEMP(0)"):
+        cache.store(name, 1)
+    assert cache.lookup("HAND_ID") == (True, 1)
+    for name in ("ANGLE_SET(0)", "CLEAR_ERROR", "TEMP(0)"):
+        assert cache.lookup(name) == (False, None)
+
+
+def test_live_class_never_cached(registers):
+    cache = RegisterCache(registers, {LIVE_CLASS: math.inf, SETPOINT_CLASS: 60})
+    cache.store("TEMP(0)", 1)
+    cache.store("ANGLE_SET(0)", 2)
+    assert cache.lookup("TEMP(0)") == (False, None)
+    assert cache.lookup("ANGLE_SET(0)") == (True, 2)
+
+
+def test_reset_para_invalidates_everything(registers):
+    cache = RegisterCache(registers)
+    cache.store("HAND_ID", 1)
+    cache.store("REDU_RATIO", 2)
+    cache.written({"RESET_PARA": 1})
+    assert len(cache) == 0
+
+
+def test_invalidate_notifies_subscribers(registers):
+    received = []
+
+    class Listener:
+        def on_invalidate(self, names):
+            received.append(names)
+
+    listener = Listener()
+    cache = RegisterCache(registers)
+    cache.subscribe(listener.on_invalidate)
+    cache.invalidate(iter(["HAND_ID"]))
+    cache.invalidate()
+    assert received == [["HAND_ID"], None]
+
+    # 订阅者以弱引用保存，回收后不再通知
+    del listener
+    cache.invalidate()
+    assert len(received) == 2
+
+
+def test_client_get_hits_cache_until_write(client, simulator):
+    first = client.get("HAND_ID")
+    hits = client.read_cache.hits
+    simulator.set_value("HAND_ID", first + 1)
+    assert client.get("HAND_ID") == first
+    assert client.read_cache.hits == hits + 1
+
+    assert client.set("HAND_ID", 9)
+    assert client.get("HAND_ID") == 9
+    client.invalidate_cache(["HAND_ID"])
+    simulator.set_value("HAND_ID", 11)
+    assert client.get("HAND_ID") == 11
+
+
+def test_client_setpoints_always_read_from_device(client, simulator):
+    assert client.set("ANGLE_SET(0)", 100)
+    simulator.set_value("ANGLE_SET(0)", 200)
+    assert client.get("ANGLE_SET(0)") == 200
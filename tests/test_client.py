@@ -0,0 +1,109 @@
+"""
+客户端与模拟器之间的读写往返
+"""
+import pytest
+
+from RH56DFTP import RH56DFTPClient, RH56DFTPSimulator
+from RH56DFTP.RH56DFTP_codec import decode_raw_value
+
+from conftest import FROZEN_UPDATE_RATE, requests_by_function
+
+
+def test_get_matches_simulator(client, simulator, registers):
+    for name in ("HAND_ID", "TEMP(3)", "FORCE_ACT(2)"):
+        raw = simulator.get_value(name)
+        assert client.get(name, use_cache=False) == decode_raw_value(registers[name], raw)
+
+
+def test_read_many_matches_get(client):
+    names = ["HAND_ID", "ERROR(5)", "TEMP(0)", "FORCE_ACT(1)", "TACTILE_THUMB_TIP_3x3"]
+    values = client.read_many(names, use_cache=False)
+    assert set(values) == set(names)
+    for name in names:
+        assert values[name] == client.get(name, use_cache=False)
+
+
+def test_read_many_uses_planned_requests(client):
+    names = [f"TEMP({i})" for i in range(6)] + [f"ERROR({i})" for i in range(6)]
+    plan = client.read_planner.plan(names)
+    before = requests_by_function(client, 3)
+    client.read_many(names)
+    assert requests_by_function(client, 3) - before == plan.request_count == 1
+
+
+def test_set_pose_round_trip(client, simulator):
+    pose = [100, 200, 300, 400, 500, 600]
+    assert client.set_pose(pose)
+    assert [simulator.get_value(f"ANGLE_SET({i})") for i in range(6)] == pose
+    assert client.read_state(include_setpoints=True).angle_set == tuple(pose)
+    # 每个自由度一次单寄存器写入，与 set() 的请求相同
+    assert requests_by_function(client, 6) == 6
+    assert requests_by_function(client, 16) == 0
+
+
+def test_set_pose_leaves_placeholder_words(client, simulator, registers):
+    placeholder = registers["ANGLE_SET(0)"].address[1]
+    simulator.context.words[placeholder] = 77
+    assert client.set_pose([1, 2, 3, 4, 5, 6])
+    assert simulator.context.words[placeholder] == 77
+
+
+def test_set_pose_rejects_bad_input(client):
+    with pytest.raises(ValueError):
+        client.set_pose([1, 2, 3])
+    with pytest.raises(ValueError):
+        client.set_pose([0] * 6, mode="torque")
+
+
+def test_set_many_merges_adjacent_words(client, simulator):
+    """CLEAR_ERROR、SAVE、RESET_PARA 地址连续，合并为一次功能码16写入"""
+    assert client.set_many({"RESET_PARA": 1, "CLEAR_ERROR": 1, "SAVE": 1})
+    assert requests_by_function(client, 16) == 1
+    assert requests_by_function(client, 6) == 0
+    assert [simulator.get_value(name) for name in ("CLEAR_ERROR", "SAVE", "RESET_PARA")] == [1] * 3
+
+
+def test_set_many_is_all_or_nothing(client, simulator):
+    before = simulator.get_value("ANGLE_SET(0)")
+    assert not client.set_many({"ANGLE_SET(0)": 10, "ANGLE_SET(1)": 5000})
+    assert simulator.get_value("ANGLE_SET(0)") == before
+    assert requests_by_function(client, 6) == 0
+
+
+def test_write_rejected_by_device_returns_false(client):
+    # 只读寄存器在客户端校验阶段即被拒绝
+    assert not client.set("TEMP(0)", 1)
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 4, 8])
+def test_pipelined_tactile_frame_matches_simulator(client, simulator, max_in_flight):
+    frame = client.read_tactile_frame(max_in_flight=max_in_flight)
+    for name, words in frame.items():
+        assert words == simulator.get_value(name)
+
+
+def test_pipelined_read_shrinks_rejected_chunks():
+    """设备拒绝过大的请求时，流水线读取减小分块后重读"""
+    with RH56DFTPSimulator(update_rate=FROZEN_UPDATE_RATE, max_registers_per_request=60,
+                           seed=0) as simulator:
+        rh56 = RH56DFTPClient(simulator.host, simulator.port, heartbeat_interval=0)
+        try:
+            frame = rh56.read_tactile_frame()
+            assert rh56.max_count_per_read <= 60
+            for name, words in frame.items():
+                assert words == simulator.get_value(name)
+        finally:
+            rh56.close()
+
+
+def test_offline_client_raises_connection_error(simulator):
+    port = simulator.port
+    simulator.stop()
+    rh56 = RH56DFTPClient(simulator.host, port, heartbeat_interval=0)
+    try:
+        assert not rh56.is_connected
+        with pytest.raises(ConnectionError):
+            rh56.read_many(["TEMP(0)"])
+        assert not rh56.set_pose([0] * 6)
+    finally:
+        rh56.close()
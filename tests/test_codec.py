@@ -0,0 +1,71 @@
+"""
+寄存器编解码与写入段合并
+"""
+import pytest
+
+from RH56DFTP.RH56DFTP_codec import (
+    AddressIntervals,
+    MAX_COUNT_PER_WRITE,
+    decode_raw_value,
+    decode_register_words,
+    encode_raw_value,
+    encode_register_words,
+    merge_write_runs,
+    register_span
+)
+
+
+def test_register_span(registers):
+    assert register_span(registers["HAND_ID"]) == (1000, 1)
+    assert register_span(registers["ANGLE_SET(0)"]) == (1464, 2)
+    assert register_span(registers["TACTILE_PALM_8x14"]) == (4900, 224)
+
+
+def test_raw_value_round_trip(registers):
+    short = registers["FORCE_ACT(0)"]
+    for value in (0, 1, 32767, -1, -32768):
+        assert decode_raw_value(short, encode_raw_value(value)) == value
+    # uint8 只取低8位
+    assert decode_raw_value(registers["TEMP(0)"], 0x1234) == 0x34
+
+
+def test_short_register_writes_value_word_only(registers):
+    """双地址short寄存器只编码值所在的起始地址，不写占位字"""
+    assert encode_register_words(registers["ANGLE_SET(0)"], -2) == [65534]
+    assert encode_register_words(registers["HAND_ID"], 7) == [7]
+    with pytest.raises(ValueError):
+        encode_register_words(registers["TACTILE_PALM_8x14"], 0)
+
+
+def test_decode_register_words(registers):
+    assert decode_register_words(registers["ANGLE_SET(0)"], [65535, 0]) == -1
+    assert decode_register_words(registers["TACTILE_THUMB_TIP_3x3"], [1] * 18) == [1] * 18
+
+
+def test_merge_write_runs_joins_adjacent_addresses():
+    runs = merge_write_runs([(1006, [3]), (1004, [1]), (1005, [2]), (1000, [9])])
+    assert runs == [(1000, [9]), (1004, [1, 2, 3])]
+
+
+def test_merge_write_runs_keeps_placeholder_gaps(registers):
+    """相邻short寄存器之间隔着占位字，不会合并"""
+    items = [(register_span(registers[f"ANGLE_SET({i})"])[0],
+              encode_register_words(registers[f"ANGLE_SET({i})"], i)) for i in range(6)]
+    runs = merge_write_runs(items)
+    assert len(runs) == 6
+    assert [words for _, words in runs] == [[0], [1], [2], [3], [4], [5]]
+
+
+def test_merge_write_runs_respects_max_count():
+    items = [(address, [address]) for address in range(MAX_COUNT_PER_WRITE + 10)]
+    runs = merge_write_runs(items)
+    assert [len(words) for _, words in runs] == [MAX_COUNT_PER_WRITE, 10]
+    assert runs[1][0] == MAX_COUNT_PER_WRITE
+
+
+def test_address_intervals_lookup(registers):
+    intervals = AddressIntervals(registers, lambda name, _: name, default="unmapped")
+    assert intervals.lookup(1464) == "ANGLE_SET(0)"
+    assert intervals.lookup(1465) == "ANGLE_SET(0)"
+    assert intervals.lookup(5123) == "TACTILE_PALM_8x14"
+    assert intervals.lookup(1001) == "unmapped"
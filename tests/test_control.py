@@ -0,0 +1,39 @@
+"""
+控制循环的周期调度与回调异常处理
+"""
+import pytest
+
+from RH56DFTP import ControlLoop
+
+
+def test_commands_are_written(client, simulator):
+    loop = ControlLoop(client, lambda state, tick: {"ANGLE_SET(0)": 100 + tick.index},
+                       rate_hz=500)
+    stats = loop.run(cycles=3)
+    assert stats.cycles == 3
+    assert stats.errors == 0
+    assert simulator.get_value("ANGLE_SET(0)") == 102
+
+
+def _failing(state, tick):
+    if tick.index == 1:
+        raise RuntimeError("回调出错")
+    return None
+
+
+def test_callback_error_stops_foreground_loop(client):
+    loop = ControlLoop(client, _failing, rate_hz=500)
+    with pytest.raises(RuntimeError):
+        loop.run(cycles=10)
+    assert loop.stats().cycles == 1
+    assert loop.stats().errors == 1
+
+
+def test_callback_error_stops_background_thread(client, caplog):
+    loop = ControlLoop(client, _failing, rate_hz=500)
+    loop.start()
+    loop._thread.join(2.0)  # pylint: disable=protected-access
+    assert not loop._thread.is_alive()  # pylint: disable=protected-access
+    loop.stop()
+    assert isinstance(loop.error, RuntimeError)
+    assert "控制循环已停止" in caplog.text
@@ -0,0 +1,31 @@
+"""
+流水线读取适配器与顺序读取回退
+"""
+from types import SimpleNamespace
+
+from RH56DFTP.RH56DFTP_pipeline import REQUIRED_ATTRIBUTES, missing_attributes, split_chunks
+
+from conftest import requests_by_function
+
+
+def test_split_chunks():
+    assert split_chunks(3000, 300, 125) == [(3000, 125), (3125, 125), (3250, 50)]
+    assert not split_chunks(3000, 0, 125)
+
+
+def test_missing_attributes_reports_absent_internals(client):
+    assert not missing_attributes(client.client)
+    stub = SimpleNamespace(transaction=SimpleNamespace(getNextTID=lambda: 1))
+    assert missing_attributes(stub) == [path for path in REQUIRED_ATTRIBUTES
+                                        if path != "transaction.getNextTID"]
+
+
+def test_unsupported_pymodbus_falls_back_to_sequential_reads(client, simulator, monkeypatch):
+    pipeline = client._pipeline  # pylint: disable=protected-access
+    monkeypatch.setattr(pipeline, "missing", ["transaction._sync_lock"])
+    frame = client.read_tactile_frame()
+    for name, words in frame.items():
+        assert words == simulator.get_value(name)
+    expected = len(split_chunks(client.tactile_layout.start, client.tactile_layout.count,
+                                client.max_count_per_read))
+    assert requests_by_function(client, 3) == expected
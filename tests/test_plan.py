@@ -0,0 +1,45 @@
+"""
+读取计划编译：区间合并、间隙阈值与分块
+"""
+from RH56DFTP.RH56DFTP_plan import DEFAULT_GAP_THRESHOLD, ReadPlanner
+
+
+def test_gap_within_threshold_is_merged(registers):
+    # ERROR(5) 结束于1612，TEMP(0) 起始于1618，间隙6个字
+    plan = ReadPlanner(registers).plan(["ERROR(5)", "TEMP(0)"])
+    assert len(plan.segments) == 1
+    assert (plan.segments[0].start, plan.segments[0].count) == (1611, 8)
+    assert plan.request_count == 1
+
+
+def test_gap_above_threshold_is_split(registers):
+    plan = ReadPlanner(registers, gap_threshold=5).plan(["ERROR(5)", "TEMP(0)"])
+    assert [(segment.start, segment.count) for segment in plan.segments] == [(1611, 1), (1618, 1)]
+    assert plan.request_count == 2
+
+
+def test_distant_registers_are_separate(registers):
+    plan = ReadPlanner(registers).plan(["HAND_ID", "TEMP(0)"])
+    assert len(plan.segments) == 2
+    assert 1618 - 1001 > DEFAULT_GAP_THRESHOLD
+
+
+def test_merge_never_adds_requests(registers):
+    """合并后超过单次读取上限、会增加请求次数时保持分开"""
+    planner = ReadPlanner(registers, gap_threshold=1000, max_count=20)
+    plan = planner.plan(["ANGLE_SET(0)", "TEMP(5)"])
+    assert plan.request_count == 2
+
+
+def test_plan_is_cached(registers):
+    planner = ReadPlanner(registers)
+    plan = planner.plan(["TEMP(0)", "TEMP(1)"])
+    assert planner.plan(["TEMP(1)", "TEMP(0)"]) is plan
+    planner.clear_cache()
+    assert planner.plan(["TEMP(0)", "TEMP(1)"]) is not plan
+
+
+def test_extract_slices_segment_words(registers):
+    plan = ReadPlanner(registers).plan(["ERROR(5)", "TEMP(0)"])
+    words = list(range(1611, 1619))
+    assert plan.extract([words]) == {"ERROR(5)": [1611], "TEMP(0)": [1618]}
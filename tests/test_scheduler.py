@@ -0,0 +1,105 @@
+"""
+请求调度器的优先级分类与排队顺序
+"""
+import threading
+import time
+
+import pytest
+
+from RH56DFTP import RequestScheduler
+from RH56DFTP.RH56DFTP_scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_CONFIG,
+    PRIORITY_STATE,
+    PRIORITY_TACTILE
+)
+
+
+def _wait_for_waiters(scheduler, count, timeout=2.0):
+    """等待指定数量的请求进入等待队列"""
+    deadline = time.monotonic() + timeout
+    while len(scheduler._waiters) < count:  # pylint: disable=protected-access
+        assert time.monotonic() < deadline, "等待队列未达到预期长度"
+        time.sleep(0.001)
+
+
+def test_classify(registers):
+    scheduler = RequestScheduler(registers)
+    assert scheduler.classify(6, 1464, 1) == PRIORITY_COMMAND
+    assert scheduler.classify(16, 1004, 3) == PRIORITY_COMMAND
+    assert scheduler.classify(3, 1582, 42) == PRIORITY_STATE
+    assert scheduler.classify(3, 3000, 125) == PRIORITY_TACTILE
+    assert scheduler.classify(3, 1000, 1) == PRIORITY_CONFIG
+    # 首尾落在不同类别的寄存器时取其中最高的优先级
+    assert scheduler.classify(3, 1464, 119) == PRIORITY_STATE
+
+
+def test_waiters_are_served_by_priority(registers):
+    scheduler = RequestScheduler(registers)
+    order = []
+
+    def worker(priority):
+        with scheduler.slot(priority):
+            order.append(priority)
+
+    scheduler.acquire(PRIORITY_CONFIG)
+    threads = []
+    for priority in (PRIORITY_CONFIG, PRIORITY_TACTILE, PRIORITY_STATE, PRIORITY_COMMAND):
+        thread = threading.Thread(target=worker, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        _wait_for_waiters(scheduler, len(threads))
+    assert scheduler.preempt_requested(PRIORITY_TACTILE)
+    assert not scheduler.preempt_requested(PRIORITY_COMMAND)
+    scheduler.release()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert order == [PRIORITY_COMMAND, PRIORITY_STATE, PRIORITY_TACTILE, PRIORITY_CONFIG]
+    assert scheduler.stats()["command"]["acquired"] == 1
+
+
+class _InterruptedCondition:
+    """第一次 wait() 时抛出异常的条件变量，模拟等待线程被中断"""
+
+    def __init__(self, cond):
+        self._cond = cond
+        self.interrupted = False
+
+    def wait(self, timeout=None):
+        if not self.interrupted:
+            self.interrupted = True
+            raise KeyboardInterrupt
+        return self._cond.wait(timeout)
+
+    def notify_all(self):
+        self._cond.notify_all()
+
+    def __enter__(self):
+        return self._cond.__enter__()
+
+    def __exit__(self, *args):
+        return self._cond.__exit__(*args)
+
+
+def test_interrupted_waiter_leaves_queue(registers):
+    scheduler = RequestScheduler(registers)
+    scheduler._cond = _InterruptedCondition(scheduler._cond)  # pylint: disable=protected-access
+
+    scheduler.acquire(PRIORITY_CONFIG)
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.acquire(PRIORITY_COMMAND)
+    assert not scheduler.preempt_requested(PRIORITY_CONFIG)
+    scheduler.release()
+
+    # 被中断的请求不再占据队首，之后的请求可以正常获取
+    acquired = threading.Event()
+
+    def worker():
+        with scheduler.slot(PRIORITY_STATE):
+            acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join(2.0)
+    assert acquired.is_set()
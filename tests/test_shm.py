@@ -0,0 +1,81 @@
+"""
+共享内存发布者与读取者之间的序号锁（seqlock）
+"""
+import threading
+
+import pytest
+
+from RH56DFTP import HandState, SharedStatePublisher, SharedStateReader
+
+# 共享内存发布依赖可选的numpy
+pytest.importorskip("numpy")
+
+
+def _uniform_state(value: int) -> HandState:
+    """所有字段都等于同一个值的状态快照，读到混合两次发布的数据时可以识别"""
+    row = (value,) * 6
+    return HandState(force_act=row, current=row, error=row, temp=row, timestamp=float(value))
+
+
+@pytest.fixture(name="shared")
+def shared_segment(registers):
+    publisher = SharedStatePublisher(registers, name=None, include_tactile=False)
+    reader = SharedStateReader(publisher.name)
+    yield publisher, reader
+    reader.close()
+    publisher.close()
+
+
+def test_read_before_publish_returns_none(shared):
+    _, reader = shared
+    assert reader.read() is None
+
+
+def test_round_trip(shared):
+    publisher, reader = shared
+    assert publisher.publish(_uniform_state(7)) == 1
+    snapshot = reader.read()
+    assert snapshot.sequence == 1
+    assert snapshot.timestamp == 7.0
+    assert snapshot.hand_state().force_act == (7,) * 6
+    assert snapshot.valid()
+
+
+def test_view_is_invalidated_when_slot_is_reused(shared):
+    publisher, reader = shared
+    publisher.publish(_uniform_state(1))
+    view = reader.read()
+    copied = reader.read(copy=True)
+    publisher.publish(_uniform_state(2))
+    assert view.valid()
+    publisher.publish(_uniform_state(3))
+    assert not view.valid()
+    assert copied.hand_state().temp == (1,) * 6
+
+
+def test_reader_never_sees_torn_snapshot(shared):
+    publisher, reader = shared
+    stop = threading.Event()
+
+    def publish():
+        value = 0
+        while not stop.is_set():
+            value = (value + 1) % 100
+            publisher.publish(_uniform_state(value))
+
+    thread = threading.Thread(target=publish)
+    thread.start()
+    try:
+        seen = set()
+        for _ in range(2000):
+            snapshot = reader.read(copy=True)
+            if snapshot is None:
+                continue
+            state = snapshot.state
+            assert (state == state.flat[0]).all()
+            assert snapshot.timestamp == float(state.flat[0])
+            seen.add(int(state.flat[0]))
+    finally:
+        stop.set()
+        thread.join()
+    assert seen
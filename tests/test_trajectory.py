@@ -0,0 +1,42 @@
+"""
+轨迹播放的设定值写入与落后时的跳步
+"""
+import time
+
+import pytest
+
+from RH56DFTP import TrajectoryPlayer
+
+np = pytest.importorskip("numpy")
+
+
+def test_playback_reaches_final_waypoint(client, simulator):
+    waypoints = [[0] * 6, [600] * 6, [300] * 6]
+    player = TrajectoryPlayer(client, waypoints, times=[0.0, 0.05, 0.1], step_rate=200)
+    result = player.play()
+    assert result.completed
+    assert result.failed_writes == 0
+    assert [simulator.get_value(f"ANGLE_SET({i})") for i in range(6)] == [300] * 6
+    assert not result.max_setpoint_mismatch.any()
+
+
+def test_late_steps_are_skipped(client, simulator, monkeypatch):
+    set_pose = client.set_pose
+
+    def slow_set_pose(values, mode="angle", verify=False):
+        time.sleep(0.02)
+        return set_pose(values, mode, verify)
+
+    monkeypatch.setattr(client, "set_pose", slow_set_pose)
+    player = TrajectoryPlayer(client, [[0] * 6, [1000] * 6], times=[0.0, 0.2],
+                              step_rate=200, track_every=0)
+    result = player.play()
+    written = ~np.isnan(result.write_times)
+    assert result.completed
+    assert result.skipped_steps > 0
+    assert result.skipped_steps + written.sum() == len(result.planned_times)
+    # 最后一步总会写入
+    assert written[-1]
+    assert simulator.get_value("ANGLE_SET(0)") == 1000
+    # 被执行的步不会比计划晚超过一次写入的耗时太多
+    assert np.nanmax(result.lateness) < 0.1
@@ -0,0 +1,84 @@
+"""
+写缓冲的重复写入抑制、合并与影子值失效
+"""
+import time
+
+from RH56DFTP import WriteBuffer
+
+from conftest import requests_by_function
+
+
+def test_repeated_value_is_suppressed(client):
+    buffer = WriteBuffer(client)
+    buffer.set("ANGLE_SET(0)", 500)
+    assert buffer.flush()
+    assert buffer.shadow("ANGLE_SET(0)") == 500
+
+    buffer.set("ANGLE_SET(0)", 500)
+    assert not buffer.pending
+    assert buffer.flush()
+    stats = buffer.stats()
+    assert (stats.submitted, stats.suppressed, stats.flushes) == (2, 1, 1)
+    assert requests_by_function(client, 6) == 1
+
+
+def test_last_write_in_cycle_wins(client, simulator):
+    buffer = WriteBuffer(client)
+    with buffer:
+        buffer.set("ANGLE_SET(1)", 10)
+        buffer.set("ANGLE_SET(1)", 20)
+    assert simulator.get_value("ANGLE_SET(1)") == 20
+    assert buffer.stats().coalesced == 1
+
+
+def test_returning_to_shadow_value_cancels_pending_write(client):
+    buffer = WriteBuffer(client)
+    buffer.update({"ANGLE_SET(0)": 1})
+    buffer.flush()
+    buffer.set("ANGLE_SET(0)", 2)
+    buffer.set("ANGLE_SET(0)", 1)
+    assert not buffer.pending
+
+
+def test_invalid_value_is_rejected(client):
+    buffer = WriteBuffer(client)
+    assert not buffer.set("ANGLE_SET(0)", 5000)
+    assert not buffer.set("TEMP(0)", 1)
+    assert not buffer.pending
+
+
+def test_cache_invalidation_clears_shadow(client):
+    buffer = WriteBuffer(client)
+    buffer.set("ANGLE_SET(0)", 500)
+    buffer.flush()
+    client.invalidate_cache()
+    assert buffer.shadow("ANGLE_SET(0)") is None
+    buffer.set("ANGLE_SET(0)", 500)
+    assert buffer.pending == {"ANGLE_SET(0)": 500}
+
+
+def test_reset_para_clears_shadow(client):
+    buffer = WriteBuffer(client)
+    buffer.set("ANGLE_SET(0)", 500)
+    buffer.flush()
+    buffer.set("RESET_PARA", 1)
+    buffer.flush()
+    assert buffer.shadow("ANGLE_SET(0)") is None
+
+
+def test_shadow_expires(client):
+    buffer = WriteBuffer(client, max_shadow_age=0.01)
+    buffer.set("ANGLE_SET(0)", 500)
+    buffer.flush()
+    time.sleep(0.02)
+    assert buffer.shadow("ANGLE_SET(0)") is None
+
+
+def test_sync_reads_back_device_values(client, simulator):
+    simulator.set_value("ANGLE_SET(2)", 321)
+    buffer = WriteBuffer(client)
+    buffer.sync(["ANGLE_SET(2)"])
+    assert buffer.shadow("ANGLE_SET(2)") == 321
+    # 触发类寄存器没有影子值，写入总是发往设备
+    buffer.set("CLEAR_ERROR", 0)
+    assert buffer.pending == {"CLEAR_ERROR": 0}